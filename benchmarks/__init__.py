@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+
+"""
+__init__.py: Initialize the benchmarks package.
+"""
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
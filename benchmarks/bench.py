@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+
+"""
+bench.py: Benchmark suite of the simple-useragent package.
+
+This module measures the parse throughput of UserAgent over a synthetic
+corpus (also with and without the parse template cache), the first parse
+of a fresh process, the cold and warm latency of get, get_list and
+get_dict for each cache tier, the end-to-end refresh time, the import
+time and the memory per parsed record (also extrapolated to one million
+records) and per subsystem. All requests are answered by a local
+stand-in server, so the benchmarks run offline. Results are emitted as
+JSON to compare them across versions.
+
+The benchmarks can be run with the following command:
+    $ PYTHONPATH=src python -m benchmarks.bench --output results.json
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import argparse
+import ast
+import json
+import logging
+import os
+import pathlib
+import platform
+import random
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable
+
+import simple_useragent
+from simple_useragent import bots, core, diagnostics
+from simple_useragent.regexes import RegexSet
+
+from .server import FakeServer
+
+# Dependencies, which must only be imported on first use.
+HEAVY_MODULES = ("requests", "bs4", "ua_parser", "platformdirs", "numpy",
+                 "pyarrow")
+
+# Version numbers of products in user agent strings, e.g. 'Chrome/120'.
+_VERSION_PATTERN = re.compile(r"(?<=[/ ])(\d+)(?=[._])")
+
+
+def corpus(size: int, seed: int = 0) -> list[str]:
+    """
+    Builds a realistic synthetic corpus from the shipped fallback user
+    agents by varying their version numbers, so parse caches can not
+    answer every lookup.
+
+    :param size: The number of user agent strings.
+    :type size: int
+    :param seed: Seed of the variations (default=0).
+    :type seed: int
+    :return: The user agent strings.
+    :rtype: list[str]
+    """
+
+    with open(core._FALLBACK_JSON, "r") as fh:
+        data = json.load(fh)
+
+    seeds = data["desktop"] + data["mobile"]
+    rng = random.Random(seed)
+
+    def vary(match: re.Match) -> str:
+        if rng.random() < 0.5:
+            return match.group(1)
+
+        return str(max(0, int(match.group(1)) + rng.randint(-3, 3)))
+
+    return [_VERSION_PATTERN.sub(vary, rng.choice(seeds))
+            for _ in range(size)]
+
+
+def stats(samples: list[float]) -> dict[str, float | int]:
+    """
+    Summarizes the measured durations in seconds.
+
+    :param samples: The measured durations.
+    :type samples: list[float]
+    :return: The number of runs, min, median, mean, p95 and max.
+    :rtype: dict
+    """
+
+    ordered = sorted(samples)
+
+    return {
+            "runs": len(ordered),
+            "min": ordered[0],
+            "median": statistics.median(ordered),
+            "mean": statistics.mean(ordered),
+            "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            "max": ordered[-1],
+            }
+
+
+def measure(func: Callable, repeat: int, setup: Callable = None) -> dict:
+    """
+    Measures the duration of a function call multiple times.
+
+    :param func: The function to measure. Receives the result of setup.
+    :type func: Callable
+    :param repeat: The number of measurements.
+    :type repeat: int
+    :param setup: Called before each measurement (default=None).
+    :type setup: Callable
+    :return: The statistics of the durations.
+    :rtype: dict
+    """
+
+    samples = []
+    for _ in range(repeat):
+        arg = setup() if setup is not None else None
+        start = time.perf_counter()
+        func(arg)
+        samples.append(time.perf_counter() - start)
+
+    return stats(samples)
+
+
+def bench_parse(strings: list[str], repeat: int) -> dict:
+    """
+    Measures the parse throughput of UserAgent.
+    """
+
+    result = measure(
+            lambda _: [simple_useragent.UserAgent(s) for s in strings], repeat
+            )
+    result["records"] = len(strings)
+    result["records_per_second"] = len(strings) / result["median"]
+
+    return result
+
+
+def bench_parse_templates(strings: list[str], repeat: int) -> dict:
+    """
+    Measures the parse throughput of the regex set with and without its
+    template cache and compares the hit rate of the template cache with
+    the one of an exact string cache.
+    """
+
+    regex_set = RegexSet()
+    regex_set.parse(strings[0])
+
+    def fresh() -> RegexSet:
+        regex_set._templates.clear()
+        regex_set.template_hits = regex_set.template_misses = 0
+        return regex_set
+
+    full = measure(
+            lambda rs: [(rs.parse_user_agent(s), rs.parse_os(s))
+                        for s in strings],
+            repeat, fresh
+            )
+    templated = measure(lambda rs: [rs.parse(s) for s in strings],
+                        repeat, fresh
+                        )
+
+    return {
+            "records": len(strings),
+            "full": full,
+            "templated": templated,
+            "speedup": full["median"] / templated["median"],
+            "template_hit_rate": regex_set.template_hits / len(strings),
+            "exact_hit_rate": 1 - len(set(strings)) / len(strings),
+            }
+
+
+def bench_bots(strings: list[str], repeat: int) -> dict:
+    """
+    Measures the throughput of the bot classification compared to the
+    parse, both without their caches.
+    """
+
+    classify = bots.classify.__wrapped__
+    bots._pattern()
+    regex_set = RegexSet()
+    regex_set.parse_user_agent(strings[0])
+
+    classified = measure(lambda _: [classify(s) for s in strings], repeat)
+    parsed = measure(
+            lambda _: [(regex_set.parse_user_agent(s), regex_set.parse_os(s))
+                       for s in strings],
+            repeat
+            )
+
+    return {
+            "records": len(strings),
+            "classify": classified,
+            "parse": parsed,
+            "speedup": parsed["median"] / classified["median"],
+            }
+
+
+def bench_memory(strings: list[str], url: str, cache_dir: str) -> dict:
+    """
+    Measures the memory allocated per parsed UserAgent record and the
+    bytes retained by each subsystem of a refreshed UserAgents instance.
+    """
+
+    with diagnostics.trace_memory(top=5) as traced:
+        agents = [simple_useragent.UserAgent(s) for s in strings]
+
+    retained = diagnostics.deep_sizeof(agents)
+
+    core._API_URL = url
+    user_agents = simple_useragent.UserAgents(
+            cache_location=cache_dir, max_retries=1, timeout=5
+            )
+    user_agents.get()
+    user_agents.get(mobile=True)
+
+    return {
+            "records": len(agents),
+            "bytes_total": traced["net"],
+            "bytes_peak": traced["peak"],
+            "bytes_per_record": traced["net"] / len(agents),
+            "bytes_per_million_records": traced["net"] / len(agents) * 1e6,
+            "retained_per_record": retained / len(agents),
+            "top": traced["top"],
+            "report": diagnostics.memory_report(user_agents),
+            }
+
+
+def bench_tiers(url: str, cache_dir: str, repeat: int) -> dict:
+    """
+    Measures cold (first call on a new instance) and warm (repeated
+    call on the same instance) latency of get_dict, get_list and get
+    for each cache tier.
+    """
+
+    cache_file = pathlib.Path(cache_dir, "user_agents.json")
+    unreachable = f"http://127.0.0.1:{_free_port()}/"
+
+    def fresh_file() -> None:
+        with open(core._FALLBACK_JSON, "r") as fh:
+            data = json.load(fh)
+        data["cached"] = int(time.time())
+        with open(cache_file, "w") as fh:
+            json.dump(data, fh)
+
+    def no_file() -> None:
+        if cache_file.exists():
+            cache_file.unlink()
+
+    # Tier: (url of the API, preparation of the file cache, timeout).
+    # The timeout is also the delay between retries, so it is kept
+    # short for the unreachable API.
+    tiers = {
+            "file": (url, fresh_file, 5),
+            "api": (url, no_file, 5),
+            "fallback_file": (unreachable, no_file, 0.01),
+            }
+    calls = {
+            "get_dict": lambda ua: ua.get_dict(),
+            "get_list": lambda ua: ua.get_list(),
+            "get": lambda ua: ua.get(),
+            }
+
+    results = {}
+    for tier, (api_url, prepare, timeout) in tiers.items():
+        core._API_URL = api_url
+        results[tier] = {}
+
+        for name, call in calls.items():
+            def setup() -> simple_useragent.UserAgents:
+                prepare()
+                return simple_useragent.UserAgents(
+                        cache_location=cache_dir, max_retries=1,
+                        timeout=timeout
+                        )
+
+            cold = measure(call, repeat, setup)
+
+            user_agents = setup()
+            call(user_agents)
+            warm = measure(lambda _: call(user_agents), repeat * 10)
+
+            results[tier][name] = {"cold": cold, "warm": warm}
+
+    return results
+
+
+def bench_refresh(url: str, cache_dir: str, repeat: int) -> dict:
+    """
+    Measures refreshing the user agents from the (local) website,
+    including parsing the HTML and writing the file cache.
+    """
+
+    core._API_URL = url
+
+    return measure(
+            lambda ua: ua.get_dict(force_cached=False),
+            repeat,
+            lambda: simple_useragent.UserAgents(
+                    cache_location=cache_dir, max_retries=1, timeout=5
+                    ),
+            )
+
+
+def bench_import(repeat: int) -> dict:
+    """
+    Measures the import time of the package in fresh interpreters and
+    lists the heavy dependencies, which were imported eagerly.
+    """
+
+    src = os.path.dirname(os.path.dirname(simple_useragent.__file__))
+    env = dict(os.environ, PYTHONPATH=src)
+    code = (
+            "import sys, time; start = time.perf_counter(); "
+            "import simple_useragent; "
+            "duration = time.perf_counter() - start; "
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules]); "
+            "print(duration)"
+    )
+
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+                [sys.executable, "-c", code],
+                env=env, capture_output=True, check=True, text=True,
+                ).stdout.strip().splitlines()
+        samples.append(float(output[-1]))
+
+    result = stats(samples)
+    result["eager_modules"] = ast.literal_eval(output[-2])
+
+    return result
+
+
+def bench_first_parse(cache_dir: str, repeat: int) -> dict:
+    """
+    Measures the first parse in fresh interpreters (cold start), which
+    includes loading the regex set persisted in cache_dir. The first
+    interpreter prepares and persists it and is not measured.
+    """
+
+    src = os.path.dirname(os.path.dirname(simple_useragent.__file__))
+    env = dict(os.environ, PYTHONPATH=src)
+    code = (
+            "import time, simple_useragent; "
+            "from simple_useragent import core; "
+            f"core._persist_regexes({cache_dir!r}); "
+            "start = time.perf_counter(); "
+            f"simple_useragent.UserAgent({core._FALLBACK_DESKTOP[0]!r}); "
+            "print(time.perf_counter() - start)"
+    )
+
+    samples = []
+    for _ in range(repeat + 1):
+        output = subprocess.run(
+                [sys.executable, "-c", code],
+                env=env, capture_output=True, check=True, text=True,
+                ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+
+    return stats(samples[1:])
+
+
+def _free_port() -> int:
+    """
+    Returns a local port, on which nothing is listening.
+    """
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run(repeat: int = 5, corpus_size: int = 2000) -> dict:
+    """
+    Runs all benchmarks.
+
+    :param repeat: The number of measurements per benchmark
+        (default=5).
+    :type repeat: int
+    :param corpus_size: The number of user agent strings to parse
+        (default=2000).
+    :type corpus_size: int
+    :return: The JSON serializable results.
+    :rtype: dict
+    """
+
+    strings = corpus(corpus_size)
+    api_url = core._API_URL
+    logging.disable(logging.CRITICAL)
+
+    try:
+        with FakeServer() as server, \
+                tempfile.TemporaryDirectory() as cache_dir:
+            results = {
+                    "import": bench_import(repeat),
+                    "first_parse": bench_first_parse(cache_dir, repeat),
+                    "parse": bench_parse(strings, repeat),
+                    "parse_templates": bench_parse_templates(strings, repeat),
+                    "bots": bench_bots(strings, repeat),
+                    "memory": bench_memory(strings, server.url, cache_dir),
+                    "tiers": bench_tiers(server.url, cache_dir, repeat),
+                    "refresh": bench_refresh(server.url, cache_dir, repeat),
+                    }
+            results["upstream_requests"] = server.requests
+    finally:
+        core._API_URL = api_url
+        logging.disable(logging.NOTSET)
+
+    return {
+            "package": simple_useragent.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": int(time.time()),
+            "repeat": repeat,
+            "results": results,
+            }
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+            description="Benchmark the simple-useragent package offline."
+            )
+    parser.add_argument("--output", "-o", default="-",
+                        help="JSON file to write the results to "
+                             "(default: stdout)."
+                        )
+    parser.add_argument("--repeat", "-r", type=int, default=5,
+                        help="Measurements per benchmark (default: 5)."
+                        )
+    parser.add_argument("--corpus-size", type=int, default=2000,
+                        help="User agent strings to parse (default: 2000)."
+                        )
+    args = parser.parse_args(argv)
+
+    results = json.dumps(run(args.repeat, args.corpus_size), indent=2)
+
+    if args.output == "-":
+        print(results)
+    else:
+        with open(args.output, "w") as fh:
+            fh.write(results + "\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+
+"""
+loadtest.py: Concurrency load test of the shared user agent cache.
+
+This module starts M processes with N threads each, which call get or
+get_dict concurrently against a local stand-in of 'useragents.me' with
+injectable latency, failures and rate limits. The file cache starts
+expired, so all workers race to refresh it. It reports the throughput,
+the tail latency, the number of upstream requests and the cache file
+corruption events (partial writes seen by readers) as JSON.
+
+The load test can be run with the following command:
+    $ PYTHONPATH=src python -m benchmarks.loadtest --processes 4 \\
+        --threads 8 --calls 200 --latency 0.2 --rate-limit-rate 0.1
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import argparse
+import json
+import logging
+import multiprocessing
+import pathlib
+import sys
+import tempfile
+import threading
+import time
+
+from .server import FakeServer
+
+
+class _CorruptionCounter(logging.Handler):
+    """
+    Counts the warnings about unreadable cache files of a worker.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(logging.WARNING)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.getMessage().startswith("Could not load cached"):
+            self.count += 1
+
+
+def _worker(
+        url: str,
+        cache_dir: str,
+        cache_duration: int,
+        threads: int,
+        calls: int,
+        call: str,
+        max_retries: int,
+        timeout: float,
+        ) -> dict:
+    """
+    Runs the calls of a single process. All threads share one
+    UserAgents instance, like the module level functions do.
+
+    :return: The latencies, the number of errors and corruption events.
+    :rtype: dict
+    """
+
+    from simple_useragent import core
+
+    core._API_URL = url
+    counter = _CorruptionCounter()
+    core.LOGGER.addHandler(counter)
+    core.LOGGER.setLevel(logging.WARNING)
+    core.LOGGER.propagate = False
+
+    user_agents = core.UserAgents(
+            cache_location=cache_dir,
+            cache_duration=cache_duration,
+            max_retries=max_retries,
+            timeout=timeout,
+            )
+    func = getattr(user_agents, call)
+    latencies = []
+    errors = []
+    barrier = threading.Barrier(threads)
+
+    def run() -> None:
+        barrier.wait()
+        for _ in range(calls):
+            start = time.perf_counter()
+            try:
+                func()
+            except Exception as e:
+                errors.append(f"{e.__class__.__name__}: {e}")
+            latencies.append(time.perf_counter() - start)
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    return {
+            "latencies": latencies,
+            "errors": errors,
+            "corrupt_reads": counter.count,
+            }
+
+
+def _monitor(path: pathlib.Path, stop: threading.Event, events: list) -> None:
+    """
+    Reads the cache file in a loop and records every read, which is not
+    valid JSON (e.g. a partially written file).
+    """
+
+    while not stop.is_set():
+        try:
+            with open(path, "r") as fh:
+                content = fh.read()
+        except FileNotFoundError:
+            content = None
+
+        if content is not None:
+            try:
+                json.loads(content)
+            except ValueError:
+                events.append({"time": time.time(), "size": len(content)})
+
+        time.sleep(0.001)
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    """
+    Returns the tail latencies of the samples in seconds.
+    """
+
+    if not samples:
+        return {}
+
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+    return {
+            "p50": pick(0.5),
+            "p90": pick(0.9),
+            "p99": pick(0.99),
+            "p999": pick(0.999),
+            "max": ordered[-1],
+            }
+
+
+def run(
+        processes: int = 2,
+        threads: int = 8,
+        calls: int = 100,
+        call: str = "get",
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        cache_duration: int = 86400,
+        max_retries: int = 3,
+        timeout: float = 1.0,
+        seed: int = None,
+        ) -> dict:
+    """
+    Runs the load test and returns the JSON serializable report.
+
+    :param processes: The number of worker processes (default=2).
+    :type processes: int
+    :param threads: The number of threads per process (default=8).
+    :type threads: int
+    :param calls: The number of calls per thread (default=100).
+    :type calls: int
+    :param call: The method to call, 'get', 'get_list' or 'get_dict'
+        (default='get').
+    :type call: str
+    :param latency: Delay of the fake server in seconds (default=0.0).
+    :type latency: float
+    :param failure_rate: Share of status 500 responses (default=0.0).
+    :type failure_rate: float
+    :param rate_limit_rate: Share of status 429 responses
+        (default=0.0).
+    :type rate_limit_rate: float
+    :param cache_duration: Cache duration of the workers in seconds
+        (default=86400).
+    :type cache_duration: int
+    :param max_retries: Retries of the workers (default=3).
+    :type max_retries: int
+    :param timeout: Timeout and retry delay of the workers in seconds
+        (default=1.0).
+    :type timeout: float
+    :param seed: Seed of the injected failures (default=None).
+    :type seed: int
+    :return: The report.
+    :rtype: dict
+    """
+
+    context = multiprocessing.get_context("spawn")
+
+    with FakeServer(
+            latency=latency,
+            failure_rate=failure_rate,
+            rate_limit_rate=rate_limit_rate,
+            seed=seed,
+            ) as server, tempfile.TemporaryDirectory() as cache_dir:
+
+        # Start with an expired file cache, so all workers refresh.
+        cache_file = pathlib.Path(cache_dir, "user_agents.json")
+        with open(cache_file, "w") as fh:
+            json.dump({"desktop": ["ua"], "mobile": ["ua"], "cached": 0}, fh)
+
+        stop = threading.Event()
+        corrupt_files = []
+        monitor = threading.Thread(
+                target=_monitor, args=(cache_file, stop, corrupt_files),
+                daemon=True,
+                )
+        monitor.start()
+
+        args = (server.url, cache_dir, cache_duration, threads, calls, call,
+                max_retries, timeout)
+        start = time.perf_counter()
+        with context.Pool(processes) as pool:
+            results = pool.starmap(_worker, [args] * processes)
+        duration = time.perf_counter() - start
+
+        stop.set()
+        monitor.join()
+
+        latencies = [value for result in results
+                     for value in result["latencies"]]
+        errors = [value for result in results for value in result["errors"]]
+
+        return {
+                "config": {
+                        "processes": processes,
+                        "threads": threads,
+                        "calls": calls,
+                        "call": call,
+                        "latency": latency,
+                        "failure_rate": failure_rate,
+                        "rate_limit_rate": rate_limit_rate,
+                        "cache_duration": cache_duration,
+                        "max_retries": max_retries,
+                        "timeout": timeout,
+                        },
+                "duration": duration,
+                "calls": len(latencies),
+                "throughput": len(latencies) / duration,
+                "latency": _percentiles(latencies),
+                "errors": len(errors),
+                "error_samples": sorted(set(errors))[:10],
+                "upstream": {
+                        "requests": server.requests,
+                        "failures": server.failures,
+                        "rate_limited": server.rate_limited,
+                        },
+                "corruption": {
+                        "corrupt_reads": sum(result["corrupt_reads"]
+                                             for result in results),
+                        "corrupt_files_seen": len(corrupt_files),
+                        },
+                }
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+            description="Load test the shared user agent cache offline."
+            )
+    parser.add_argument("--processes", "-p", type=int, default=2)
+    parser.add_argument("--threads", "-t", type=int, default=8)
+    parser.add_argument("--calls", "-n", type=int, default=100,
+                        help="Calls per thread (default: 100)."
+                        )
+    parser.add_argument("--call", choices=("get", "get_list", "get_dict"),
+                        default="get"
+                        )
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Fake server delay in seconds (default: 0)."
+                        )
+    parser.add_argument("--failure-rate", type=float, default=0.0,
+                        help="Share of status 500 responses (default: 0)."
+                        )
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                        help="Share of status 429 responses (default: 0)."
+                        )
+    parser.add_argument("--cache-duration", type=int, default=86400)
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", "-o", default="-",
+                        help="JSON file to write the report to "
+                             "(default: stdout)."
+                        )
+    args = parser.parse_args(argv)
+
+    report = json.dumps(
+            run(
+                    processes=args.processes,
+                    threads=args.threads,
+                    calls=args.calls,
+                    call=args.call,
+                    latency=args.latency,
+                    failure_rate=args.failure_rate,
+                    rate_limit_rate=args.rate_limit_rate,
+                    cache_duration=args.cache_duration,
+                    max_retries=args.max_retries,
+                    timeout=args.timeout,
+                    seed=args.seed,
+                    ),
+            indent=2,
+            )
+
+    if args.output == "-":
+        print(report)
+    else:
+        with open(args.output, "w") as fh:
+            fh.write(report + "\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
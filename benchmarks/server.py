@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+"""
+server.py: Local stand-in for the 'useragents.me' website.
+
+This module serves the recorded website response of the tests
+(tests/data/fake_website_resp.html) from a local HTTP server in a
+background thread, so benchmarks never touch the network. Latency,
+failures (status 500) and rate limits (status 429) can be injected.
+
+# Serve the fake website and point the package to it:
+from benchmarks.server import FakeServer
+from simple_useragent import core
+
+with FakeServer() as server:
+    core._API_URL = server.url
+    ...
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import http.server
+import os.path
+import pathlib
+import random
+import threading
+import time
+
+# Recorded response of 'useragents.me'.
+WEBSITE_RESP = pathlib.Path(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "tests", "data", "fake_website_resp.html"
+        )
+
+
+class FakeServer:
+    """
+    A local HTTP server, which answers every GET request with the
+    recorded 'useragents.me' website.
+
+    :var requests: The number of requests answered so far.
+    :type requests: int
+    :var failures: The number of injected failures (status 500).
+    :type failures: int
+    :var rate_limited: The number of injected rate limits (status 429).
+    :type rate_limited: int
+    """
+
+    def __init__(
+            self,
+            latency: float = 0.0,
+            failure_rate: float = 0.0,
+            rate_limit_rate: float = 0.0,
+            seed: int = None,
+            ) -> None:
+        """
+        Creates a new FakeServer. Call start() or use it as context
+        manager to serve.
+
+        :param latency: Delay in seconds before each response
+            (default=0.0).
+        :type latency: float
+        :param failure_rate: Share of requests answered with status 500
+            (default=0.0).
+        :type failure_rate: float
+        :param rate_limit_rate: Share of requests answered with status
+            429 (default=0.0).
+        :type rate_limit_rate: float
+        :param seed: Seed of the injected failures (default=None).
+        :type seed: int
+        :return: None
+        """
+
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.requests = 0
+        self.failures = 0
+        self.rate_limited = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+        with open(WEBSITE_RESP, "rb") as fh:
+            self._body = fh.read()
+
+        self._httpd = http.server.ThreadingHTTPServer(
+                ("127.0.0.1", 0), self._handler()
+                )
+        self._httpd.daemon_threads = True
+
+    def __enter__(self) -> FakeServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """
+        Returns the URL of the server, e.g. 'http://127.0.0.1:54321/'.
+        """
+
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> None:
+        """
+        Starts serving in a background thread.
+
+        :return: None
+        """
+
+        self._thread = threading.Thread(
+                target=self._httpd.serve_forever, daemon=True
+                )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops serving and closes the socket.
+
+        :return: None
+        """
+
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def respond(self) -> tuple[int, bytes]:
+        """
+        Returns the status code and body of the next response.
+
+        :return: The status code and the body.
+        :rtype: tuple[int, bytes]
+        """
+
+        with self._lock:
+            self.requests += 1
+            roll = self._random.random()
+
+            if roll < self.failure_rate:
+                self.failures += 1
+                status = 500
+            elif roll < self.failure_rate + self.rate_limit_rate:
+                self.rate_limited += 1
+                status = 429
+            else:
+                status = 200
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if status != 200:
+            return status, b"Error"
+
+        return status, self._body
+
+    def _handler(self) -> type:
+        """
+        Returns the request handler class bound to this server.
+        """
+
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                status, body = server.respond()
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+
+                # Clients may give up early (timeouts), which is expected.
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        return Handler
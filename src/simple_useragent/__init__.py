@@ -23,14 +23,14 @@ obj = sua.get(num=1, force_cached=True)
 obj[0].string  >>  'Mozilla/5.0 (Windows ...'
 obj[0].os  >>  'Windows'
 
-# Fetch the 3 most common desktop user agents as str in a list:
+# Fetch the 3 most common desktop user agents as str in a tuple:
 sua.get_list(num=3)
->> ['Mozilla/5.0 (Windows ...', '...', '...']
+>> ('Mozilla/5.0 (Windows ...', '...', '...')
 
 # Get all desktop and mobile user agents in a dict sorted by usage:
 sua.get_dict()
->> {'desktop': ['Mozilla/5.0 (Windows ...', '...'],
-'mobile': ['Mozilla/5.0 (Android ...', '...']}
+>> {'desktop': ('Mozilla/5.0 (Windows ...', '...'),
+'mobile': ('Mozilla/5.0 (Android ...', '...')}
 
 # Parse single user agent string and create a UserAgent object.
 ua = sua.UserAgent('Mozilla/5.0 (Windows, Chrome ...')
@@ -52,6 +52,12 @@ __status__ = "Development"
 __github__ = "https://github.com/Lennolium/simple-useragent"
 
 # Imports.
-from .core import UserAgents, UserAgent, get_dict, get_list, get, parse
-
-__all__ = ("UserAgents", "UserAgent", "get_dict", "get_list", "get", "parse")
+from .core import (UserAgents, UserAgent, get_dict, get_list, get,
+                   get_headers, parse, pack_many, unpack_many)
+from .hooks import HOOKS, HookRegistry
+from .metrics import METRICS, MetricsRegistry
+
+__all__ = ("UserAgents", "UserAgent", "get_dict", "get_list", "get",
+           "get_headers", "parse",
+           "pack_many", "unpack_many", "HOOKS", "HookRegistry", "METRICS",
+           "MetricsRegistry")
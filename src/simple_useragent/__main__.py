@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+
+"""
+__main__.py: Runs the command line interface of the simple-useragent
+package with 'python -m simple_useragent'.
+"""
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+
+"""
+arrow.py: Streaming Arrow and Parquet export of parsed user agents.
+
+The parsed attributes are collected column by column (instead of one
+dict per row) and written as Arrow record batches with dictionary
+encoded browser and OS columns and integer version columns. Batches
+are written incrementally as Parquet row groups or to an Arrow IPC
+stream, so only one batch is held in memory. Needs pyarrow, which is
+only imported on first use (pip install simple-useragent[arrow]).
+
+# Write parsed user agents to Parquet:
+from simple_useragent import arrow
+rows = arrow.write((sua.UserAgent(s) for s in strings), 'agents.parquet')
+
+# Or stream batches yourself:
+with arrow.ArrowWriter('agents.arrows', output_format='arrow') as writer:
+    for chunk in chunks:
+        writer.write(sua.UserAgent(s) for s in chunk)
+
+# Or from the command line:
+$ simple-useragent parse --format parquet -o agents.parquet access.log
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import itertools
+from typing import IO, Any, Iterable, Iterator
+
+from .core import _BROWSER_NAMES, _OS_NAMES, UserAgent
+
+# Output formats: Parquet or the Arrow IPC stream format.
+FORMATS = ("arrow", "parquet")
+
+# Columns of the record batches and the version components per column.
+COLUMNS = (
+        "string",
+        "browser",
+        "browser_major",
+        "browser_minor",
+        "browser_patch",
+        "os",
+        "os_major",
+        "os_minor",
+        "os_patch",
+        "os_patch_minor",
+        "mobile",
+        "fingerprint",
+        )
+_VERSIONS = (
+        ("browser_version_tuple", ("browser_major", "browser_minor",
+                                   "browser_patch")),
+        ("os_version_tuple", ("os_major", "os_minor", "os_patch",
+                              "os_patch_minor")),
+        )
+
+# Largest version component of the int64 columns. Larger ones (junk
+# traffic like 'Chrome/99999999999999999999.0') are exported as null.
+_INT64_MAX = (1 << 63) - 1
+
+# Rows per written record batch (and Parquet row group).
+_BATCH_SIZE = 65536
+
+_PYARROW = None
+
+
+def _pyarrow():
+    """
+    Returns the pyarrow module, which is imported on first use.
+
+    :return: The pyarrow module.
+    :raises ImportError: If pyarrow is not installed.
+    """
+
+    global _PYARROW
+
+    if _PYARROW is None:
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError(
+                    "The Arrow export needs 'pyarrow': "
+                    "pip install simple-useragent[arrow]"
+                    ) from e
+        _PYARROW = pyarrow
+
+    return _PYARROW
+
+
+def available() -> bool:
+    """
+    Checks if pyarrow is installed.
+
+    :return: True if the Arrow export is available.
+    :rtype: bool
+    """
+
+    try:
+        _pyarrow()
+    except ImportError:
+        return False
+
+    return True
+
+
+def columns(agents: Iterable[UserAgent]) -> dict[str, list]:
+    """
+    Collects the exported attributes of user agents column by column
+    as plain lists, which are cheap to pickle between processes.
+    Missing version components and components, which do not fit into
+    the int64 columns, are None.
+
+    :param agents: The parsed user agents.
+    :type agents: Iterable[UserAgent]
+    :return: The values per column.
+    :rtype: dict[str, list]
+    """
+
+    result = {name: [] for name in COLUMNS}
+    string = result["string"].append
+    browser = result["browser"].append
+    os = result["os"].append
+    mobile = result["mobile"].append
+    fingerprint = result["fingerprint"].append
+    versions = [
+            (attribute, [result[name].append for name in names])
+            for attribute, names in _VERSIONS
+            ]
+
+    for agent in agents:
+        string(agent.string)
+        browser(agent.browser)
+        os(agent.os)
+        mobile(agent.mobile)
+        fingerprint(agent.fingerprint)
+
+        for attribute, appends in versions:
+            version = getattr(agent, attribute)
+            for pos, append in enumerate(appends):
+                value = version[pos] if len(version) > pos else None
+                append(value if value is None or value <= _INT64_MAX
+                       else None)
+
+    return result
+
+
+def schema():
+    """
+    Returns the Arrow schema of the record batches.
+
+    :return: The schema.
+    :rtype: pyarrow.Schema
+    """
+
+    pa = _pyarrow()
+    names = pa.dictionary(pa.int32(), pa.string())
+
+    return pa.schema([
+            ("string", pa.string()),
+            ("browser", names),
+            ("browser_major", pa.int64()),
+            ("browser_minor", pa.int64()),
+            ("browser_patch", pa.int64()),
+            ("os", names),
+            ("os_major", pa.int64()),
+            ("os_minor", pa.int64()),
+            ("os_patch", pa.int64()),
+            ("os_patch_minor", pa.int64()),
+            ("mobile", pa.bool_()),
+            ("fingerprint", pa.uint64()),
+            ])
+
+
+def _dictionary(values: list, names: tuple):
+    """
+    Dictionary encodes a column with the known names first, so the
+    dictionary only changes between batches for unknown names.
+    """
+
+    pa = _pyarrow()
+    codes = {name: code for code, name in enumerate(names)}
+    indices = []
+
+    for value in values:
+        if value is None:
+            indices.append(None)
+            continue
+
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+        indices.append(code)
+
+    return pa.DictionaryArray.from_arrays(
+            pa.array(indices, pa.int32()), pa.array(list(codes), pa.string())
+            )
+
+
+def record_batch(values: dict[str, list]):
+    """
+    Converts the columns of columns() to an Arrow record batch.
+
+    :param values: The values per column.
+    :type values: dict[str, list]
+    :return: The record batch.
+    :rtype: pyarrow.RecordBatch
+    """
+
+    pa = _pyarrow()
+    batch_schema = schema()
+    arrays = []
+
+    for field in batch_schema:
+        if field.name == "browser":
+            arrays.append(_dictionary(values[field.name], _BROWSER_NAMES[1:]))
+        elif field.name == "os":
+            arrays.append(_dictionary(values[field.name], _OS_NAMES[1:]))
+        else:
+            arrays.append(pa.array(values[field.name], field.type))
+
+    return pa.RecordBatch.from_arrays(arrays, schema=batch_schema)
+
+
+def record_batches(
+        agents: Iterable[UserAgent],
+        batch_size: int = _BATCH_SIZE,
+        ) -> Iterator[Any]:
+    """
+    Converts user agents lazily to Arrow record batches, so only one
+    batch is held in memory.
+
+    :param agents: The parsed user agents.
+    :type agents: Iterable[UserAgent]
+    :param batch_size: The rows per batch (default=65536).
+    :type batch_size: int
+    :return: The record batches.
+    :rtype: Iterator[pyarrow.RecordBatch]
+    """
+
+    agents = iter(agents)
+    while True:
+        values = columns(itertools.islice(agents, batch_size))
+        if not values["string"]:
+            return
+
+        yield record_batch(values)
+
+
+class ArrowWriter:
+    """
+    Writes parsed user agents incrementally to a Parquet file or an
+    Arrow IPC stream. Rows are buffered column by column until a batch
+    is full.
+    """
+
+    def __init__(
+            self,
+            sink: str | IO[bytes],
+            output_format: str = "parquet",
+            batch_size: int = _BATCH_SIZE,
+            compression: str = None,
+            ) -> None:
+        """
+        Creates a new ArrowWriter and opens the sink.
+
+        :param sink: The path or binary stream to write to.
+        :type sink: str or IO[bytes]
+        :param output_format: 'parquet' or 'arrow' for the Arrow IPC
+            stream format (default='parquet').
+        :type output_format: str
+        :param batch_size: The rows per record batch and Parquet row
+            group (default=65536).
+        :type batch_size: int
+        :param compression: The compression codec (default=None ->
+            default of pyarrow).
+        :type compression: str
+        :return: None
+        """
+
+        if output_format not in FORMATS:
+            raise ValueError(
+                    f"Unknown output format '{output_format}', "
+                    f"use one of {FORMATS}."
+                    )
+
+        pa = _pyarrow()
+        self.output_format = output_format
+        self.batch_size = batch_size
+        self.rows = 0
+        self._buffer = {name: [] for name in COLUMNS}
+
+        if output_format == "parquet":
+            import pyarrow.parquet as pq
+
+            kwargs = {} if compression is None else {
+                    "compression": compression
+                    }
+            self._writer = pq.ParquetWriter(sink, schema(), **kwargs)
+        else:
+            options = None if compression is None else pa.ipc.IpcWriteOptions(
+                    compression=compression
+                    )
+            self._writer = pa.ipc.new_stream(sink, schema(), options=options)
+
+    def __enter__(self) -> ArrowWriter:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        """
+        Returns the ArrowWriter instance as a representation.
+        """
+
+        return (
+                f"{self.__class__.__name__}"
+                f"(output_format={self.output_format!r}, rows={self.rows})"
+        )
+
+    def write(self, agents: Iterable[UserAgent]) -> None:
+        """
+        Writes parsed user agents.
+
+        :param agents: The parsed user agents.
+        :type agents: Iterable[UserAgent]
+        :return: None
+        """
+
+        agents = iter(agents)
+        while True:
+            values = columns(itertools.islice(agents, self.batch_size))
+            if not values["string"]:
+                return
+
+            self.write_columns(values)
+
+    def write_columns(self, values: dict[str, list]) -> None:
+        """
+        Writes the columns of columns(), e.g. from worker processes.
+
+        :param values: The values per column.
+        :type values: dict[str, list]
+        :return: None
+        """
+
+        for name in COLUMNS:
+            self._buffer[name].extend(values[name])
+
+        if len(self._buffer["string"]) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered rows as record batch.
+
+        :return: None
+        """
+
+        rows = len(self._buffer["string"])
+        if not rows:
+            return
+
+        self._writer.write_batch(record_batch(self._buffer))
+        self.rows += rows
+        self._buffer = {name: [] for name in COLUMNS}
+
+    def close(self) -> None:
+        """
+        Writes the buffered rows and the footer.
+
+        :return: None
+        """
+
+        if self._writer is None:
+            return
+
+        try:
+            self.flush()
+        finally:
+            self._writer.close()
+            self._writer = None
+
+
+def write(
+        agents: Iterable[UserAgent],
+        sink: str | IO[bytes],
+        output_format: str = "parquet",
+        batch_size: int = _BATCH_SIZE,
+        compression: str = None,
+        ) -> int:
+    """
+    Writes parsed user agents to a Parquet file or an Arrow IPC stream.
+    The agents are consumed lazily, batch by batch.
+
+    :param agents: The parsed user agents.
+    :type agents: Iterable[UserAgent]
+    :param sink: The path or binary stream to write to.
+    :type sink: str or IO[bytes]
+    :param output_format: 'parquet' or 'arrow' (default='parquet').
+    :type output_format: str
+    :param batch_size: The rows per record batch (default=65536).
+    :type batch_size: int
+    :param compression: The compression codec (default=None).
+    :type compression: str
+    :return: The number of written rows.
+    :rtype: int
+    """
+
+    with ArrowWriter(sink, output_format, batch_size, compression) as writer:
+        writer.write(agents)
+
+    return writer.rows
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+
+"""
+bots.py: Fast pre-parse classification of bots, crawlers and headless
+clients.
+
+Parsing a user agent runs hundreds of regexes, only to end up with
+browser 'Other' for most bot traffic. This module classifies a string
+with a single combined pattern of known crawler, headless browser and
+HTTP library tokens instead, which is built once on first use. The
+verdict tells if the string is a bot and why, so pipelines can drop
+bot traffic before the expensive parse.
+
+# Classify a user agent string:
+from simple_useragent import bots
+bots.classify('Mozilla/5.0 (compatible; Googlebot/2.1; ...)')
+>> Verdict(is_bot=True, reason='crawler', token='Googlebot/2.1')
+
+# Only parse the strings of real browsers:
+agents = [sua.UserAgent(s) for s in strings if not bots.is_bot(s)]
+
+# Or from the command line:
+$ simple-useragent parse --skip-bots access.log
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import functools
+import re
+from typing import NamedTuple
+
+# The reason codes of the verdicts: Known tokens per reason and 'empty'
+# for blank strings. The tokens are lowercase regex fragments, which
+# start with a literal character (or '^' for the start of the string).
+REASONS = ("crawler", "headless", "library", "empty")
+_TOKENS = {
+        "crawler": (
+                # Googlebot, bingbot, AdsBot-Google, GPTBot, ... but not
+                # the Cubot phones.
+                r"b(?<!cub)ot\b",
+                "crawl",
+                "spider",
+                "slurp",
+                "scraper",
+                "facebookexternalhit",
+                "meta-external",
+                "ia_archiver",
+                "mediapartners-google",
+                "apis-google",
+                "feedfetcher",
+                "google-inspectiontool",
+                "googleother",
+                "google-read-aloud",
+                "chatgpt-user",
+                "bingpreview",
+                "yeti/",
+                "whatsapp/",
+                "qwantify",
+                "pingdom",
+                "statuscake",
+                ),
+        "headless": (
+                "headless",
+                "phantomjs",
+                "slimerjs",
+                "puppeteer",
+                "playwright",
+                "selenium",
+                "webdriver",
+                "htmlunit",
+                "lighthouse",
+                "jsdom",
+                "prerender",
+                "rendertron",
+                ),
+        "library": (
+                "curl/",
+                "wget/",
+                "python-requests",
+                "python-urllib",
+                "python-httpx",
+                "httpx/",
+                "aiohttp/",
+                "go-http-client",
+                "okhttp",
+                "apache-httpclient",
+                "axios/",
+                "node-fetch",
+                "undici",
+                "libwww-perl",
+                "lwp::",
+                "guzzlehttp",
+                "pycurl",
+                "faraday",
+                "httpie",
+                "postmanruntime",
+                "insomnia",
+                "scrapy",
+                "reqwest",
+                "winhttp",
+                "powershell",
+                "mechanize",
+                "restsharp",
+                "^java/",
+                r"^ruby\b",
+                "^dart/",
+                "^deno/",
+                ),
+        }
+
+# Product tokens are separated by spaces, semicolons and parentheses.
+_DELIMITERS = " ;()"
+
+_PATTERN = None
+_REASON_PATTERNS = None
+
+
+class Verdict(NamedTuple):
+    """
+    The classification of a user agent string. Truthy for bots.
+
+    :ivar is_bot: If the string belongs to a bot.
+    :ivar reason: The reason code of REASONS or None.
+    :ivar token: The product token, which matched, or None.
+    """
+
+    is_bot: bool
+    reason: str | None = None
+    token: str | None = None
+
+    def __bool__(self) -> bool:
+        return self.is_bot
+
+
+_HUMAN = Verdict(False)
+_EMPTY = Verdict(True, "empty")
+
+
+def _pattern() -> re.Pattern:
+    """
+    Returns the combined pattern of all tokens, which is compiled on
+    first use. The tokens are grouped by their first character, so the
+    regex engine only tries the few alternatives, which can match at a
+    position, instead of all of them. The pattern runs over the
+    lowercased string, which is much faster than case-insensitive
+    matching.
+
+    :return: The compiled pattern.
+    :rtype: re.Pattern
+    """
+
+    global _PATTERN, _REASON_PATTERNS
+
+    if _PATTERN is None:
+        groups = {}
+        for tokens in _TOKENS.values():
+            for token in tokens:
+                groups.setdefault(token[0], []).append(token[1:])
+
+        _REASON_PATTERNS = tuple(
+                (reason, re.compile("|".join(tokens)))
+                for reason, tokens in _TOKENS.items()
+                )
+        _PATTERN = re.compile("|".join(
+                f"{re.escape(first)}(?:{'|'.join(rests)})"
+                if first != "^" else f"^(?:{'|'.join(rests)})"
+                for first, rests in groups.items()
+                ))
+
+    return _PATTERN
+
+
+def _reason(lower: str, match: re.Match) -> str:
+    """
+    Returns the reason code of the token, which matched.
+    """
+
+    start, end = match.span()
+    for reason, pattern in _REASON_PATTERNS:
+        if pattern.fullmatch(lower, start, end):
+            return reason
+
+    # Not reached: Every match of the combined pattern is a token.
+    return "crawler"
+
+
+def _token(string: str, start: int, end: int) -> str:
+    """
+    Expands a match to the product or comment token, which contains it.
+    """
+
+    while start > 0 and string[start - 1] not in _DELIMITERS:
+        start -= 1
+    while end < len(string) and string[end] not in _DELIMITERS:
+        end += 1
+
+    return string[start:end]
+
+
+@functools.lru_cache(maxsize=65536)
+def classify(string: str) -> Verdict:
+    """
+    Classifies a user agent string in one pass of the combined token
+    pattern, without parsing it. The first matching token decides the
+    reason. The verdicts are cached, as logs repeat the same strings.
+
+    :param string: The user agent string.
+    :type string: str
+    :return: The verdict with the reason code and the matched token.
+    :rtype: Verdict
+    """
+
+    if not string or string.isspace() or string == "-":
+        return _EMPTY
+
+    lower = string.lower()
+    match = _pattern().search(lower)
+    if match is None:
+        return _HUMAN
+
+    # Lowercasing changes the length of a few non-ASCII strings.
+    source = string if len(lower) == len(string) else lower
+    return Verdict(True, _reason(lower, match),
+                   _token(source, *match.span()))
+
+
+def is_bot(string: str) -> bool:
+    """
+    Checks if a user agent string belongs to a bot, crawler, headless
+    browser or HTTP library.
+
+    :param string: The user agent string.
+    :type string: str
+    :return: True if the string belongs to a bot.
+    :rtype: bool
+    """
+
+    return classify(string).is_bot
@@ -0,0 +1,634 @@
+#!/usr/bin/env python3
+
+"""
+cli.py: Command line interface of the simple-useragent package.
+
+The 'parse' subcommand streams user agent strings or web server log
+lines from files or stdin, parses them on all cores and writes one JSONL
+or CSV record per user agent, or Arrow record batches to a Parquet file
+or an Arrow IPC stream (needs pyarrow, see arrow.py). The input is read
+in chunks and only a bounded number of chunks is in flight, so memory
+stays flat over multi-GB logs and a slow consumer throttles the reader.
+Progress and a throughput summary are written to stderr. The 'snapshot'
+subcommand writes a read-only pool snapshot, the 'summarize' subcommand
+aggregates huge logs (see summary.py) and the 'serve' subcommand runs
+the sidecar service (see sidecar.py).
+
+# Parse a combined access log to JSONL on all cores:
+$ simple-useragent parse --input-format combined access.log > agents.jsonl
+
+# Parse user agent strings from stdin to CSV, in any order:
+$ cat agents.txt | simple-useragent parse --format csv --unordered
+
+# Parse only the user agents of real browsers, without bot traffic:
+$ simple-useragent parse --skip-bots access.log > browsers.jsonl
+
+# Parse a combined access log to Parquet for analytics:
+$ simple-useragent parse --input-format combined -f parquet -o ua.parquet \
+    access.log
+
+# Count the browser, OS and device shares of huge logs on all cores:
+$ simple-useragent summarize --input-format combined access.log
+
+# Write a snapshot, which is used without network I/O at startup:
+$ simple-useragent snapshot /opt/user_agents.json
+
+# Serve user agents to the scrapers of a host with 4 workers:
+$ simple-useragent serve --port 8555 --workers 4
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import argparse
+import csv
+import functools
+import io
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import time
+from typing import IO, Iterable, Iterator
+
+from . import arrow, bots
+from .core import (_ATTRIBUTES, SNAPSHOT_ENV, UserAgent, UserAgents,
+                   attribute_values)
+
+# Fields of the written records, in CSV column order.
+FIELDS = _ATTRIBUTES
+
+# The user agent is the last quoted field of the combined log format of
+# Apache and nginx.
+_COMBINED_PATTERN = re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)"\s*$')
+
+
+def _extract(line: str, input_format: str) -> str | None:
+    """
+    Returns the user agent string of an input line or None, if it
+    contains none.
+
+    :param line: The input line.
+    :type line: str
+    :param input_format: 'ua' for one user agent per line or
+        'combined' for combined log format lines.
+    :type input_format: str
+    :return: The user agent string or None.
+    :rtype: str or None
+    """
+
+    if input_format == "combined":
+        match = _COMBINED_PATTERN.search(line)
+        if match is None:
+            return None
+        line = match.group(1)
+    else:
+        line = line.strip()
+
+    if not line or line == "-":
+        return None
+
+    return line
+
+
+@functools.lru_cache(maxsize=65536)
+def _agent(string: str) -> UserAgent:
+    """
+    Returns the parsed user agent of a string, cached per worker like
+    the field values (see core.attribute_values).
+    """
+
+    return UserAgent(string)
+
+
+def _parse_chunk(
+        chunk: list[str],
+        input_format: str,
+        output_format: str,
+        skip_bots: bool = False,
+        ) -> tuple[int, int, str | dict[str, list]]:
+    """
+    Parses a chunk of input lines and serializes the records. Runs in
+    the worker processes, so the serialization is spread over all
+    cores, too.
+
+    :param chunk: The input lines.
+    :type chunk: list[str]
+    :param input_format: 'ua' or 'combined'.
+    :type input_format: str
+    :param output_format: 'jsonl', 'csv', 'arrow' or 'parquet'.
+    :type output_format: str
+    :param skip_bots: Drops bots before parsing (default=False).
+    :type skip_bots: bool
+    :return: The number of lines, the number of records and the
+        serialized records (the columns for Arrow formats).
+    :rtype: tuple[int, int, str or dict]
+    """
+
+    if output_format in arrow.FORMATS:
+        agents = [_agent(string) for string in (
+                _extract(line, input_format) for line in chunk
+                ) if string is not None
+                  and not (skip_bots and bots.is_bot(string))]
+        return len(chunk), len(agents), arrow.columns(agents)
+
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n") \
+        if output_format == "csv" else None
+    records = 0
+
+    for line in chunk:
+        string = _extract(line, input_format)
+        if string is None or skip_bots and bots.is_bot(string):
+            continue
+
+        values = attribute_values(string)
+
+        if writer is not None:
+            writer.writerow(values)
+        else:
+            out.write(json.dumps(dict(zip(FIELDS, values))))
+            out.write("\n")
+        records += 1
+
+    return len(chunk), records, out.getvalue()
+
+
+def _parse_chunk_star(args: tuple) -> tuple[int, int, str | dict]:
+    return _parse_chunk(*args)
+
+
+def _read_lines(paths: list[str]) -> Iterator[str]:
+    """
+    Yields the lines of the input files, '-' reads from stdin.
+    """
+
+    for path in paths:
+        if path == "-":
+            yield from sys.stdin
+            continue
+
+        with open(path, "r", encoding="utf-8", errors="replace") as fh:
+            yield from fh
+
+
+def _chunks(
+        lines: Iterable[str],
+        size: int,
+        slots: threading.Semaphore,
+        stop: threading.Event,
+        ) -> Iterator[list[str]]:
+    """
+    Yields chunks of input lines. Every chunk takes a slot, which is
+    released when its result is written, so the reader blocks as soon
+    as the bounded number of chunks is in flight.
+    """
+
+    lines = iter(lines)
+    while True:
+        chunk = list(itertools.islice(lines, size))
+        if not chunk:
+            return
+
+        slots.acquire()
+        if stop.is_set():
+            return
+        yield chunk
+
+
+class _Progress:
+    """
+    Counts the processed lines and records and reports the throughput
+    to stderr.
+    """
+
+    def __init__(self, stream: IO[str], interval: float = None) -> None:
+        self.stream = stream
+        self.interval = interval
+        self.lines = 0
+        self.records = 0
+        self.start = time.perf_counter()
+        self._last = self.start
+
+    def update(self, lines: int, records: int) -> None:
+        self.lines += lines
+        self.records += records
+
+        if self.interval is None:
+            return
+
+        now = time.perf_counter()
+        if now - self._last >= self.interval:
+            self._last = now
+            self.stream.write(f"\r{self._status(now)}")
+            self.stream.flush()
+
+    def _status(self, now: float) -> str:
+        duration = max(now - self.start, 1e-9)
+        return (
+                f"{self.lines:,} lines, {self.records:,} records, "
+                f"{duration:.1f} s, {self.records / duration:,.0f} records/s"
+        )
+
+    def summary(self) -> str:
+        return self._status(time.perf_counter())
+
+
+def parse(
+        inputs: list[str],
+        output: IO[str] | IO[bytes],
+        output_format: str = "jsonl",
+        input_format: str = "ua",
+        workers: int = None,
+        ordered: bool = True,
+        chunk_size: int = 1000,
+        queue_size: int = None,
+        progress: _Progress = None,
+        skip_bots: bool = False,
+        ) -> tuple[int, int]:
+    """
+    Streams the input lines through a pool of worker processes and
+    writes the parsed records.
+
+    :param inputs: The input files, '-' reads from stdin.
+    :type inputs: list[str]
+    :param output: The stream to write the records to, binary for the
+        Arrow formats.
+    :type output: IO[str] or IO[bytes]
+    :param output_format: 'jsonl', 'csv', or 'parquet' and 'arrow' (IPC
+        stream), which need pyarrow (default='jsonl').
+    :type output_format: str
+    :param input_format: 'ua' for one user agent per line or
+        'combined' for combined log format lines (default='ua').
+    :type input_format: str
+    :param workers: The number of worker processes, 0 parses in the
+        current process (default=None -> number of CPUs).
+    :type workers: int
+    :param ordered: Writes the records in input order (default=True).
+    :type ordered: bool
+    :param chunk_size: The number of lines per task (default=1000).
+    :type chunk_size: int
+    :param queue_size: The maximum number of chunks in flight
+        (default=None -> 4 per worker).
+    :type queue_size: int
+    :param progress: Receives the processed counts (default=None).
+    :type progress: _Progress
+    :param skip_bots: Drops the lines of bots, crawlers, headless
+        browsers and HTTP libraries before parsing (see bots.py)
+        (default=False).
+    :type skip_bots: bool
+    :return: The number of lines and records.
+    :rtype: tuple[int, int]
+    """
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if queue_size is None:
+        queue_size = max(1, workers) * 4
+
+    if progress is None:
+        progress = _Progress(sys.stderr)
+
+    if output_format == "csv":
+        csv.writer(output, lineterminator="\n").writerow(FIELDS)
+
+    # Arrow batches are buffered up to a bounded size before writing.
+    writer = arrow.ArrowWriter(output, output_format) \
+        if output_format in arrow.FORMATS else None
+
+    slots = threading.Semaphore(queue_size)
+    stop = threading.Event()
+    tasks = (
+            (chunk, input_format, output_format, skip_bots)
+            for chunk in _chunks(_read_lines(inputs), chunk_size, slots, stop)
+            )
+
+    if workers == 0:
+        pool = None
+        results = map(_parse_chunk_star, tasks)
+    else:
+        pool = multiprocessing.Pool(workers)
+        imap = pool.imap if ordered else pool.imap_unordered
+        results = imap(_parse_chunk_star, tasks)
+
+    try:
+        for lines, records, result in results:
+            if writer is not None:
+                writer.write_columns(result)
+            else:
+                output.write(result)
+            slots.release()
+            progress.update(lines, records)
+    finally:
+        # Unblock the reader, if the output failed mid-stream.
+        stop.set()
+        for _ in range(queue_size):
+            slots.release()
+
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+        if writer is not None:
+            writer.close()
+
+    output.flush()
+
+    return progress.lines, progress.records
+
+
+def _broken_pipe() -> int:
+    """
+    Silences stdout after the consumer of the pipe exited (e.g. 'head'),
+    which is fine.
+    """
+
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    return 1
+
+
+def main(argv: list[str] = None) -> int:
+    """
+    Runs the command line interface.
+
+    :param argv: The arguments (default=None -> sys.argv).
+    :type argv: list[str]
+    :return: The exit code.
+    :rtype: int
+    """
+
+    parser = argparse.ArgumentParser(
+            prog="simple-useragent",
+            description="Fetch and parse real world user agents.",
+            )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parse_parser = subparsers.add_parser(
+            "parse",
+            help="Parse user agent strings or log lines to JSONL, CSV, "
+                 "Parquet or Arrow.",
+            )
+    parse_parser.add_argument("inputs", nargs="*", default=["-"],
+                              help="Input files, '-' reads from stdin "
+                                   "(default: stdin)."
+                              )
+    parse_parser.add_argument("--format", "-f",
+                              choices=("jsonl", "csv") + arrow.FORMATS,
+                              default="jsonl", dest="output_format",
+                              help="Output format, 'arrow' writes an Arrow "
+                                   "IPC stream, 'parquet' and 'arrow' need "
+                                   "pyarrow (default: jsonl)."
+                              )
+    parse_parser.add_argument("--input-format", choices=("ua", "combined"),
+                              default="ua",
+                              help="One user agent per line or combined "
+                                   "log format lines (default: ua)."
+                              )
+    parse_parser.add_argument("--skip-bots", action="store_true",
+                              help="Drop bots, crawlers, headless browsers "
+                                   "and HTTP libraries before parsing."
+                              )
+    parse_parser.add_argument("--output", "-o", default="-",
+                              help="Output file (default: stdout)."
+                              )
+    parse_parser.add_argument("--workers", "-w", type=int, default=None,
+                              help="Worker processes, 0 parses in the main "
+                                   "process (default: number of CPUs)."
+                              )
+    parse_parser.add_argument("--unordered", action="store_true",
+                              help="Write records as soon as they are "
+                                   "parsed, not in input order."
+                              )
+    parse_parser.add_argument("--chunk-size", type=int, default=1000,
+                              help="Lines per task (default: 1000)."
+                              )
+    parse_parser.add_argument("--queue-size", type=int, default=None,
+                              help="Chunks in flight (default: 4 per "
+                                   "worker)."
+                              )
+    parse_parser.add_argument("--progress", action="store_true",
+                              help="Report the progress to stderr every "
+                                   "second."
+                              )
+    parse_parser.add_argument("--quiet", "-q", action="store_true",
+                              help="Do not write the summary to stderr."
+                              )
+
+    serve_parser = subparsers.add_parser(
+            "serve",
+            help="Serve user agents to a fleet of clients over HTTP.",
+            )
+    serve_parser.add_argument("--host", default="127.0.0.1",
+                              help="Host to bind to (default: 127.0.0.1)."
+                              )
+    serve_parser.add_argument("--port", "-p", type=int, default=8555,
+                              help="Port to bind to (default: 8555)."
+                              )
+    serve_parser.add_argument("--workers", "-w", type=int, default=1,
+                              help="Preforked worker processes "
+                                   "(default: 1)."
+                              )
+    serve_parser.add_argument("--refresh-interval", type=float, default=60,
+                              help="Seconds between the checks of the pool "
+                                   "age (default: 60)."
+                              )
+    serve_parser.add_argument("--cache-duration", type=int, default=86400,
+                              help="Seconds until the pool is refreshed "
+                                   "(default: 86400)."
+                              )
+    serve_parser.add_argument("--cache-location", default=None,
+                              help="Folder of the file cache (default: "
+                                   "os-specific user cache)."
+                              )
+
+    summarize_parser = subparsers.add_parser(
+            "summarize",
+            help="Count browser, OS, version and device shares over "
+                 "large log files.",
+            )
+    summarize_parser.add_argument("inputs", nargs="+",
+                                  help="Uncompressed input files."
+                                  )
+    summarize_parser.add_argument("--input-format", choices=("ua", "combined"),
+                                  default="ua",
+                                  help="One user agent per line or combined "
+                                       "log format lines (default: ua)."
+                                  )
+    summarize_parser.add_argument("--format", "-f", choices=("table", "json"),
+                                  default="table", dest="output_format",
+                                  help="Output format (default: table)."
+                                  )
+    summarize_parser.add_argument("--top", type=int, default=10,
+                                  help="Rows per section of the table "
+                                       "(default: 10)."
+                                  )
+    summarize_parser.add_argument("--workers", "-w", type=int, default=None,
+                                  help="Worker processes, 0 counts in the "
+                                       "main process (default: number of "
+                                       "CPUs)."
+                                  )
+    summarize_parser.add_argument("--skip-bots", action="store_true",
+                                  help="Do not count bots, crawlers, "
+                                       "headless browsers and HTTP "
+                                       "libraries."
+                                  )
+
+    snapshot_parser = subparsers.add_parser(
+            "snapshot",
+            help="Refresh the user agents once and write a read-only "
+                 "snapshot, e.g. for container images.",
+            )
+    snapshot_parser.add_argument("path",
+                                 help="File to write the snapshot to."
+                                 )
+    snapshot_parser.add_argument("--no-parsed", action="store_true",
+                                 help="Do not include the parsed "
+                                      "attributes."
+                                 )
+    snapshot_parser.add_argument("--from-cache", action="store_true",
+                                 help="Export the local file cache instead "
+                                      "of refreshing."
+                                 )
+    snapshot_parser.add_argument("--cache-location", default=None,
+                                 help="Folder of the file cache (default: "
+                                      "os-specific user cache)."
+                                 )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "summarize":
+        from .summary import format_table, summarize
+
+        if args.workers is not None and args.workers < 0:
+            parser.error("--workers must not be negative.")
+
+        start = time.perf_counter()
+        try:
+            result = summarize(args.inputs, input_format=args.input_format,
+                               workers=args.workers, skip_bots=args.skip_bots
+                               )
+        except (OSError, ValueError) as e:
+            sys.stderr.write(f"{e.__class__.__name__}: {e}\n")
+            return 1
+
+        try:
+            if args.output_format == "json":
+                print(json.dumps(result, indent=2))
+            else:
+                print(format_table(result, top=args.top))
+            sys.stdout.flush()
+        except BrokenPipeError:
+            return _broken_pipe()
+
+        duration = time.perf_counter() - start
+        sys.stderr.write(
+                f"{result['lines']:,} lines in {duration:.1f} s, "
+                f"{result['lines'] / max(duration, 1e-9):,.0f} lines/s\n"
+                )
+        return 0
+
+    if args.command == "snapshot":
+        try:
+            snapshot = UserAgents(
+                    cache_location=args.cache_location
+                    ).export_snapshot(
+                    args.path,
+                    parsed=not args.no_parsed,
+                    force_cached=args.from_cache,
+                    )
+        except Exception as e:
+            sys.stderr.write(f"{e.__class__.__name__}: {e}\n")
+            return 1
+
+        sys.stderr.write(
+                f"Wrote {len(snapshot['desktop'])} desktop and "
+                f"{len(snapshot['mobile'])} mobile user agents to "
+                f"'{args.path}'. Set {SNAPSHOT_ENV}={args.path} to use it.\n"
+                )
+        return 0
+
+    if args.command == "serve":
+        from .sidecar import serve
+
+        if args.workers < 1:
+            parser.error("--workers must be at least 1.")
+
+        logging.basicConfig(level=logging.INFO)
+        serve(
+                host=args.host,
+                port=args.port,
+                workers=args.workers,
+                refresh_interval=args.refresh_interval,
+                cache_duration=args.cache_duration,
+                cache_location=args.cache_location,
+                )
+        return 0
+
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1.")
+    if args.queue_size is not None and args.queue_size < 1:
+        parser.error("--queue-size must be at least 1.")
+    if args.workers is not None and args.workers < 0:
+        parser.error("--workers must not be negative.")
+
+    binary = args.output_format in arrow.FORMATS
+    if binary and not arrow.available():
+        parser.error(f"--format {args.output_format} needs 'pyarrow': "
+                     f"pip install simple-useragent[arrow]")
+
+    progress = _Progress(sys.stderr, 1.0 if args.progress else None)
+
+    if args.output == "-":
+        output = sys.stdout.buffer if binary else sys.stdout
+    elif binary:
+        output = open(args.output, "wb")
+    else:
+        output = open(args.output, "w", encoding="utf-8", newline="")
+
+    try:
+        parse(
+                inputs=args.inputs,
+                output=output,
+                output_format=args.output_format,
+                input_format=args.input_format,
+                workers=args.workers,
+                ordered=not args.unordered,
+                chunk_size=args.chunk_size,
+                queue_size=args.queue_size,
+                progress=progress,
+                skip_bots=args.skip_bots,
+                )
+
+    except BrokenPipeError:
+        return _broken_pipe()
+
+    except KeyboardInterrupt:
+        return 130
+
+    finally:
+        if output not in (sys.stdout, getattr(sys.stdout, "buffer", None)):
+            output.close()
+
+    if not args.quiet:
+        if args.progress:
+            sys.stderr.write("\r")
+        sys.stderr.write(f"{progress.summary()}\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
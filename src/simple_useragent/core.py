@@ -21,21 +21,37 @@ __status__ = "Development"
 __github__ = "https://github.com/Lennolium/simple-useragent"
 
 # Imports.
+import bisect
+import functools
+import itertools
 import json
 import logging
 import os.path
 import pathlib
 import time
 import random
-
-import platformdirs
-import requests
-from bs4 import BeautifulSoup
-from ua_parser import user_agent_parser
+import re
+import struct
+import urllib.parse
+from collections.abc import Iterable, Iterator, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from .hashing import HashRing, stable_hash64
+from .headers import DEFAULT_LANGUAGE, build as _build_headers
+from .hooks import HOOKS
+from .regexes import RegexSet, _source_path
+from .sampling import Sampler
+from .synthetic import VariantGenerator
+from .tokens import (Token, device_model as _device_model, engine as _engine,
+                     platform as _platform, tokenize as _tokenize)
+
+if TYPE_CHECKING:
+    import requests
+    from ua_parser import user_agent_parser
 
 # Logging.
 LOGGER = logging.getLogger(__name__)
-logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 
 # Fallback user agents if API is not reachable and no cached version
 # is available.
@@ -50,6 +66,19 @@ _FALLBACK_MOBILE = [
         "Chrome/120.0.0.0 Mobile Safari/537.3"
         ]
 
+# Built once, so its pool is reused by every fallback.
+_FALLBACK_HARDCODED = {
+        "desktop": _FALLBACK_DESKTOP,
+        "mobile": _FALLBACK_MOBILE,
+        }
+
+# Keys of the dict returned by get_dict. The usage percentages, the
+# parsed attributes and the age of a snapshot stay internal.
+_PUBLIC_KEYS = ("desktop", "mobile", "cached")
+
+# Website of 'useragents.me', which lists the most common user agents.
+_API_URL = "https://www.useragents.me/"
+
 _FALLBACK_JSON = pathlib.Path(
         os.path.dirname(__file__), "data", "fallback.json"
         )
@@ -67,6 +96,234 @@ _SUPPORTED_BROWSERS = [
         ]
 _SUPPORTED_OS = ["Windows", "macOS", "Linux", "Android", "iOS"]
 
+# Parsed attributes of a UserAgent (see UserAgent.__dict__).
+_ATTRIBUTES = (
+        "os",
+        "os_version",
+        "os_version_minor",
+        "browser",
+        "browser_version",
+        "browser_version_minor",
+        "mobile",
+        "string",
+        )
+
+_DIGITS_PATTERN = re.compile(r"\d+")
+
+# Binary record of a UserAgent (see UserAgent.to_bytes): format, browser
+# and OS code, flags, lengths and values of the version tuples, the
+# fingerprint and the byte lengths of the string and of the attributes,
+# which the header can not represent (JSON encoded).
+_RECORD = struct.Struct("<6B3I4IQ2I")
+_RECORD_FORMAT = 1
+_RECORD_MOBILE = 1
+_RECORD_NO_MOBILE = 2
+_RECORD_NO_STRING = 4
+_RECORD_NO_FINGERPRINT = 8
+_RECORD_CUSTOM = 255
+_BROWSER_NAMES = (None, *_SUPPORTED_BROWSERS, "Other")
+_BROWSER_CODES = {name: code for code, name in enumerate(_BROWSER_NAMES)}
+_OS_NAMES = (None, *_SUPPORTED_OS, "Other")
+_OS_CODES = {name: code for code, name in enumerate(_OS_NAMES)}
+
+# Environment variable with the path of a read-only pool snapshot (see
+# UserAgents.export_snapshot), which is used before any network I/O.
+SNAPSHOT_ENV = "SIMPLE_USERAGENT_SNAPSHOT"
+
+# Version of the snapshot format. Increment on every incompatible change
+# of it. Additive fields (e.g. the version tuples of the parsed
+# attributes) keep it, as readers must tolerate their absence.
+_SNAPSHOT_FORMAT = 1
+
+# The heavy dependencies (requests, bs4, platformdirs and ua_parser,
+# which compiles all its regexes) are imported on first use, so
+# importing the package is nearly free.
+_USER_AGENT_PARSER = None
+
+# Regex set of ua_parser, created on the first parse (False, if the
+# regexes of ua_parser could not be found). It is kept in memory and only
+# persisted under the cache location of UserAgents (see _Pool).
+_REGEX_SET = None
+
+
+def _user_agent_parser():
+    """
+    Returns the user_agent_parser module of ua_parser, which is imported
+    on the first parse.
+
+    :return: The ua_parser.user_agent_parser module.
+    """
+
+    global _USER_AGENT_PARSER
+
+    if _USER_AGENT_PARSER is None:
+        from ua_parser import user_agent_parser
+        _USER_AGENT_PARSER = user_agent_parser
+
+    return _USER_AGENT_PARSER
+
+
+def _regex_set() -> RegexSet | None:
+    """
+    Returns the shared, lazily compiled regex set, which is created on
+    first use. Parsing alone never writes to disk.
+
+    :return: The regex set or None, if the regexes of ua_parser could
+        not be found.
+    :rtype: RegexSet or None
+    """
+
+    global _REGEX_SET
+
+    if _REGEX_SET is None:
+        _REGEX_SET = RegexSet() if _source_path() is not None else False
+
+    return _REGEX_SET or None
+
+
+def _persist_regexes(cache_location: str) -> None:
+    """
+    Persists the shared regex set in the cache location of a UserAgents
+    instance, so the next process loads the prepared rules from there.
+    The first cache location wins.
+
+    :param cache_location: The folder of the file cache.
+    :type cache_location: str
+    :return: None
+    """
+
+    regex_set = _regex_set()
+    if regex_set is not None and regex_set.cache_location is None:
+        regex_set.persist(cache_location)
+
+
+def _parse(string: str) -> dict[str, dict[str, str | None]]:
+    """
+    Parses the browser and OS of a user agent string with the lazily
+    compiled regex set. Falls back to ua_parser, if its regexes could
+    not be found.
+
+    :param string: The user agent string.
+    :type string: str
+    :return: The parsed data like user_agent_parser.Parse.
+    :rtype: dict
+    """
+
+    regex_set = _regex_set()
+    if regex_set is None:
+        return _user_agent_parser().Parse(string)
+
+    return regex_set.parse(string)
+
+
+def __getattr__(name: str):
+    """
+    Imports user_agent_parser on access, so it stays available as
+    attribute of this module without being imported eagerly.
+    """
+
+    if name == "user_agent_parser":
+        return _user_agent_parser()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _default_cache_location() -> str:
+    """
+    Returns the os-specific user cache folder of the package and
+    creates it, if it does not exist yet.
+
+    :return: The path of the cache folder.
+    :rtype: str
+    """
+
+    import platformdirs
+
+    return platformdirs.user_cache_dir(
+            appname="simple-useragent",
+            appauthor="Lennolium",
+            ensure_exists=True,
+            )
+
+
+def _version_tuple(
+        parts: Mapping[str, str | None] | str,
+        keys: tuple[str, ...] = (),
+        ) -> tuple[int, ...]:
+    """
+    Converts version components to a tuple of ints, e.g. the 'major',
+    'minor' and 'patch' values of ua_parser or a string like
+    '120.0.6099'. Stops at the first missing or non-numeric component
+    and keeps the leading digits of it, e.g. '0b2' -> 0.
+
+    :param parts: The parsed version components or a version string.
+    :type parts: Mapping or str
+    :param keys: The ordered keys of the components in parts.
+    :type keys: tuple[str]
+    :return: The numeric version.
+    :rtype: tuple[int]
+    """
+
+    if isinstance(parts, str):
+        values = parts.split(".")
+    else:
+        values = [parts.get(key) for key in keys]
+
+    version = []
+    for value in values:
+        match = _DIGITS_PATTERN.match(value or "")
+        if match is None:
+            break
+
+        version.append(int(match.group()))
+        if match.end() != len(value):
+            break
+
+    return tuple(version)
+
+
+def _at_least(actual: tuple[int, ...], version: tuple) -> bool:
+    """
+    Compares a numeric version with a minimal version given as ints or
+    as a single string. Missing components count as 0.
+    """
+
+    if len(version) == 1 and isinstance(version[0], str):
+        version = _version_tuple(version[0])
+    else:
+        version = tuple(int(v) for v in version)
+
+    if not actual:
+        return False
+
+    padding = len(version) - len(actual)
+    if padding > 0:
+        actual = actual + (0,) * padding
+
+    return actual >= version
+
+
+def _record_fits(version: tuple, size: int) -> bool:
+    """
+    Checks if a numeric version fits into the header of a binary record.
+    """
+
+    return len(version) <= size and all(
+            type(v) is int and 0 <= v <= 0xFFFFFFFF for v in version
+            )
+
+
+def _record_strings(version: tuple[int, ...]) -> tuple[str, str]:
+    """
+    Returns the version strings, which a numeric version represents in a
+    binary record, e.g. (120, 0, 6099) -> ('120', '0').
+    """
+
+    if not version:
+        return "", ""
+
+    return str(version[0]), str(version[1]) if len(version) > 1 else ""
+
 
 class UserAgent:
     """
@@ -94,18 +351,25 @@ class UserAgent:
         self.mobile = None
         self.string = None
 
+        # Numeric versions, e.g. (120, 0, 6099), for cheap comparisons.
+        self.browser_version_tuple = ()
+        self.os_version_tuple = ()
+
+        # Stable 64-bit hash of the string, e.g. as shard key.
+        self.fingerprint = None
+
         # Validate user agent string.
         if not isinstance(user_agent, str):
             LOGGER.warning(
-                    f"User agent string must be of type str. "
-                    f"No {self.__class__.__name__} instance created. "
-                    f"Returning 'None'."
+                    "User agent string must be of type str. "
+                    "No %s instance created. Returning 'None'.",
+                    self.__class__.__name__
                     )
         elif not user_agent or user_agent.isspace():
             LOGGER.warning(
-                    f"User agent string must not be empty. "
-                    f"No {self.__class__.__name__} instance created. "
-                    f"Returning 'None'."
+                    "User agent string must not be empty. "
+                    "No %s instance created. Returning 'None'.",
+                    self.__class__.__name__
                     )
         # Input valid: Parse ua string and save to class attributes.
         else:
@@ -167,7 +431,8 @@ class UserAgent:
 
     def __eq__(self, other) -> bool:
         """
-        Returns True if the user agent strings are equal.
+        Returns True if the user agent strings are equal. Other types
+        are not equal (NotImplemented), so 'ua in mixed_list' works.
 
         :param other: The other user agent instance to compare.
         :type other: UserAgent
@@ -175,14 +440,23 @@ class UserAgent:
         :rtype: bool
         """
 
-        if not isinstance(other, self.__class__):
-            raise TypeError(
-                    f"Can not compare {self.__class__.__name__} with other "
-                    f"types than {self.__class__.__name__}."
-                    )
+        if not isinstance(other, UserAgent):
+            return NotImplemented
 
         return self.string == other.string
 
+    def __hash__(self) -> int:
+        """
+        Returns the hash of the user agent string, so instances can be
+        used in sets and as dict keys. Do not modify the string of an
+        instance, while it is in a set or a dict key.
+
+        :return: The hash of the user agent string.
+        :rtype: int
+        """
+
+        return hash(self.string)
+
     def __getitem__(self, item) -> str:
         """
         Returns the value of the given item.
@@ -235,6 +509,216 @@ class UserAgent:
                     f"{item}'."
                     )
 
+    def __reduce__(self) -> tuple:
+        """
+        Pickles the user agent as binary record (see to_bytes), which is
+        smaller and faster to restore than its attributes, e.g. for
+        multiprocessing pools.
+        """
+
+        return self.__class__.from_bytes, (self.to_bytes(),)
+
+    @classmethod
+    def _from_attributes(cls, attributes: Mapping) -> UserAgent:
+        """
+        Creates a new UserAgent object from pre-parsed attributes (see
+        UserAgent.__dict__) without parsing.
+
+        :param attributes: The attributes of the user agent.
+        :type attributes: Mapping
+        :return: UserAgent instance.
+        :rtype: UserAgent
+        """
+
+        # Bypasses the write protection of _FrozenUserAgent.
+        agent = cls.__new__(cls)
+        set_attr = object.__setattr__
+        for name in _ATTRIBUTES:
+            set_attr(agent, name, attributes.get(name))
+
+        if "fingerprint" in attributes:
+            set_attr(agent, "fingerprint", attributes["fingerprint"])
+        else:
+            set_attr(agent, "fingerprint", stable_hash64(agent.string)
+                     if agent.string else None)
+
+        # Older snapshots only have the major and minor version.
+        for name in ("browser", "os"):
+            version = attributes.get(f"{name}_version_tuple")
+            if version is None:
+                version = _version_tuple(
+                        attributes,
+                        (f"{name}_version", f"{name}_version_minor"),
+                        )
+            set_attr(agent, f"{name}_version_tuple", tuple(version))
+
+        return agent
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the user agent as compact binary record: a fixed header
+        with the browser and OS codes, the numeric versions, the mobile
+        flag and the fingerprint, followed by the UTF-8 string. Values,
+        which the header can not represent (e.g. a browser version
+        '0b2'), are appended JSON encoded. Restore it with from_bytes.
+
+        :return: The binary record.
+        :rtype: bytes
+        """
+
+        extras = {}
+        flags = 0
+
+        browser_code = _BROWSER_CODES.get(self.browser, _RECORD_CUSTOM)
+        if browser_code == _RECORD_CUSTOM:
+            extras["browser"] = self.browser
+
+        os_code = _OS_CODES.get(self.os, _RECORD_CUSTOM)
+        if os_code == _RECORD_CUSTOM:
+            extras["os"] = self.os
+
+        # The version strings are the first components of the numeric
+        # versions, unless they are missing or not purely numeric.
+        browser_version = self.browser_version_tuple
+        if not _record_fits(browser_version, 3):
+            extras["browser_version_tuple"] = list(browser_version)
+            browser_version = ()
+        if (
+                (self.browser_version, self.browser_version_minor)
+                != _record_strings(browser_version)
+        ):
+            extras["browser_version"] = self.browser_version
+            extras["browser_version_minor"] = self.browser_version_minor
+
+        os_version = self.os_version_tuple
+        if not _record_fits(os_version, 4):
+            extras["os_version_tuple"] = list(os_version)
+            os_version = ()
+        if (
+                (self.os_version, self.os_version_minor)
+                != _record_strings(os_version)
+        ):
+            extras["os_version"] = self.os_version
+            extras["os_version_minor"] = self.os_version_minor
+
+        if self.mobile is True:
+            flags |= _RECORD_MOBILE
+        elif self.mobile is None:
+            flags |= _RECORD_NO_MOBILE
+        elif self.mobile is not False:
+            extras["mobile"] = self.mobile
+
+        if self.string is None:
+            flags |= _RECORD_NO_STRING
+            string = b""
+        else:
+            string = self.string.encode("utf-8", "surrogatepass")
+
+        if self.fingerprint is None:
+            flags |= _RECORD_NO_FINGERPRINT
+
+        extras = json.dumps(extras).encode() if extras else b""
+
+        return _RECORD.pack(
+                _RECORD_FORMAT,
+                browser_code,
+                os_code,
+                flags,
+                len(browser_version),
+                len(os_version),
+                *browser_version,
+                *(0,) * (3 - len(browser_version)),
+                *os_version,
+                *(0,) * (4 - len(os_version)),
+                self.fingerprint or 0,
+                len(string),
+                len(extras),
+                ) + string + extras
+
+    @classmethod
+    def _unpack(cls, view: memoryview, offset: int = 0) -> tuple:
+        """
+        Decodes the binary record at the offset of a byte view.
+
+        :return: The UserAgent and the offset of the next record.
+        :rtype: tuple[UserAgent, int]
+        """
+
+        try:
+            (
+                    record_format, browser_code, os_code, flags,
+                    browser_length, os_length, *versions,
+                    fingerprint, string_length, extras_length,
+                    ) = _RECORD.unpack_from(view, offset)
+        except struct.error:
+            raise ValueError(
+                    f"Truncated user agent record at offset {offset}."
+                    ) from None
+
+        start = offset + _RECORD.size
+        end = start + string_length + extras_length
+
+        if record_format != _RECORD_FORMAT:
+            raise ValueError(
+                    f"Unsupported user agent record format {record_format}."
+                    )
+        if end > len(view):
+            raise ValueError(
+                    f"Truncated user agent record at offset {offset}."
+                    )
+
+        browser_version = tuple(versions[:browser_length])
+        os_version = tuple(versions[3:3 + os_length])
+        browser_strings = _record_strings(browser_version)
+        os_strings = _record_strings(os_version)
+
+        attributes = {
+                "os": _OS_NAMES[os_code]
+                if os_code < len(_OS_NAMES) else None,
+                "os_version": os_strings[0],
+                "os_version_minor": os_strings[1],
+                "browser": _BROWSER_NAMES[browser_code]
+                if browser_code < len(_BROWSER_NAMES) else None,
+                "browser_version": browser_strings[0],
+                "browser_version_minor": browser_strings[1],
+                "mobile": None if flags & _RECORD_NO_MOBILE
+                else bool(flags & _RECORD_MOBILE),
+                "string": None if flags & _RECORD_NO_STRING
+                else str(view[start:start + string_length], "utf-8",
+                         "surrogatepass"),
+                "fingerprint": None if flags & _RECORD_NO_FINGERPRINT
+                else fingerprint,
+                "browser_version_tuple": browser_version,
+                "os_version_tuple": os_version,
+                }
+
+        if extras_length:
+            attributes.update(json.loads(bytes(
+                    view[start + string_length:end]
+                    )))
+
+        return cls._from_attributes(attributes), end
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> UserAgent:
+        """
+        Restores a user agent from its binary record (see to_bytes)
+        without parsing the string again.
+
+        :param data: The binary record.
+        :type data: bytes or bytearray or memoryview
+        :return: The restored UserAgent instance.
+        :rtype: UserAgent
+        :raises ValueError: If the data is no valid record.
+        """
+
+        view = memoryview(data).cast("B")
+        agent, end = cls._unpack(view)
+        if end != len(view):
+            raise ValueError("Trailing data after the user agent record.")
+
+        return agent
+
     @staticmethod
     def __parse_browser(parsed: user_agent_parser.Parse) -> str:
         """
@@ -340,6 +824,105 @@ class UserAgent:
                 or "mobile" in string_lower
         )
 
+    def browser_version_at_least(self, *version: int | str) -> bool:
+        """
+        Checks if the browser version is at least the given version.
+        Missing components count as 0, an unknown version never
+        matches.
+
+        - ua.browser_version_at_least(120)
+        - ua.browser_version_at_least(120, 0, 6099)
+        - ua.browser_version_at_least('120.0.6099')
+
+        :param version: The minimal version as numbers or as string.
+        :type version: int or str
+        :return: True if the browser version is at least the version.
+        :rtype: bool
+        """
+
+        return _at_least(self.browser_version_tuple, version)
+
+    def os_version_at_least(self, *version: int | str) -> bool:
+        """
+        Checks if the OS version is at least the given version, e.g.
+        ua.os_version_at_least(10, 15). Missing components count as 0,
+        an unknown version never matches.
+
+        :param version: The minimal version as numbers or as string.
+        :type version: int or str
+        :return: True if the OS version is at least the version.
+        :rtype: bool
+        """
+
+        return _at_least(self.os_version_tuple, version)
+
+    @property
+    def tokens(self) -> tuple[Token, ...]:
+        """
+        Returns the product and comment tokens of the string (see
+        tokens.tokenize). They are tokenized on first access and cached
+        per string, so the following properties share one pass.
+
+        :return: The products and comments in order.
+        :rtype: tuple[Product or Comment, ...]
+        """
+
+        if not self.string:
+            return ()
+
+        cached = getattr(self, "_tokens", None)
+        if cached is None or cached[0] is not self.string:
+            # Bypasses the write protection of _FrozenUserAgent.
+            cached = (self.string, _tokenize(self.string))
+            object.__setattr__(self, "_tokens", cached)
+
+        return cached[1]
+
+    @property
+    def engine(self) -> str | None:
+        """
+        Returns the rendering engine, e.g. 'Blink', 'WebKit' or 'Gecko'.
+
+        :return: The rendering engine or None.
+        :rtype: str or None
+        """
+
+        return _engine(self.tokens)[0]
+
+    @property
+    def engine_version(self) -> str | None:
+        """
+        Returns the version of the rendering engine, e.g. '120.0.0.0'.
+
+        :return: The engine version or None.
+        :rtype: str or None
+        """
+
+        return _engine(self.tokens)[1]
+
+    @property
+    def platform(self) -> tuple[str, ...]:
+        """
+        Returns the items of the platform comment, e.g.
+        ('Windows NT 10.0', 'Win64', 'x64').
+
+        :return: The platform comment items.
+        :rtype: tuple[str, ...]
+        """
+
+        return _platform(self.tokens)
+
+    @property
+    def device_model(self) -> str | None:
+        """
+        Returns the device model, e.g. 'Pixel 8' or 'iPhone'.
+
+        :return: The device model or None.
+        :rtype: str or None
+        """
+
+        return _device_model(self.tokens)
+
     def parse(self, string: str) -> None:
         """
         Parses the user agent string and saves the results to the
@@ -359,8 +942,11 @@ class UserAgent:
         elif not string or string.isspace():
             raise ValueError("User agent string must not be empty.")
 
+        start = time.perf_counter() if HOOKS.active else None
+
         self.string = string
-        parsed = user_agent_parser.Parse(string)
+        self.fingerprint = stable_hash64(string)
+        parsed = _parse(string)
 
         # Convert and cleanup browser and os.
         self.browser = self.__parse_browser(parsed)
@@ -385,6 +971,13 @@ class UserAgent:
                         else:
                             setattr(self, f"{data}_version_minor", "")
 
+            self.browser_version_tuple = _version_tuple(
+                    parsed["user_agent"], ("major", "minor", "patch")
+                    )
+            self.os_version_tuple = _version_tuple(
+                    parsed["os"], ("major", "minor", "patch", "patch_minor")
+                    )
+
             # Check if OS/device is mobile.
             self.mobile = self.__parse_mobile(
                     string=self.string, os=self.os, browser=self.browser
@@ -392,9 +985,9 @@ class UserAgent:
 
         except Exception as e:
             LOGGER.warning(
-                    f"Could not parse version numbering from "
-                    f"'user_agent_parser' data: "
-                    f"{str(e.__class__.__name__)}: {str(e)}"
+                    "Could not parse version numbering from "
+                    "'user_agent_parser' data: %s: %s",
+                    e.__class__.__name__, e
                     )
 
             for attr in [
@@ -404,105 +997,646 @@ class UserAgent:
                     "os_version_minor",
                     ]:
                 setattr(self, attr, "")
+            self.browser_version_tuple = ()
+            self.os_version_tuple = ()
+
+        if start is not None:
+            HOOKS.emit(
+                    "on_parse",
+                    string=string,
+                    duration=time.perf_counter() - start,
+                    )
 
 
-class UserAgents:
+def _freeze(value):
     """
-    Fetch real world user agents from the public 'useragents.me' API for
-    use in a web scraping process to avoid bot detection.
-
-    You can either fetch random or usage weighted user agents. It caches
-    the user agents locally to avoid unnecessary API calls. The cached
-    user agents are refreshed every 24 hours.
+    Converts the user agent data recursively to read-only types: dicts
+    to read-only mapping views and lists to tuples.
 
-    :var max_retries: Maximum number of retries to fetch the user
-        agents from the API (default=3).XXX
-    :type max_retries: int
-    :var timeout: Timeout in seconds for the API request (default=5).
-    :type timeout: int
-    :var cache_duration: The duration in seconds after which the
-        cached user agents are refreshed (default=86400).
-    :type cache_duration: int
-    :var cache_location: The folder to save the cached user agents in.
-    :type cache_location: str.
+    :param value: The value to convert.
+    :return: The read-only value.
     """
 
-    _user_agents_cached = None
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
 
-    def __init__(
-            self,
-            max_retries: int = 3,
-            timeout: int = 5,
-            cache_duration: int = 86400,
-            cache_location: str = platformdirs.user_cache_dir(
-                    appname="simple-useragent",
-                    appauthor="Lennolium",
-                    ensure_exists=True,
-                    ),
-            ) -> None:
-        """
-        Create a new UserAgents object, which can be used to fetch user
-        agents from the public useragents.me API, cache them locally and
-        return them as a string/list, dict or object (see examples).
+    if isinstance(value, list):
+        return tuple(value)
 
-        - Initialize the class to set custom settings:
-        import simple_useragent as sua \n
-        user_agents = sua.UserAgents(max_retries=5, timeout=10, ...)
+    return value
 
-        - Fetch two random mobile user agent instances:
-        user_agents.get(num=2, shuffle=True, mobile=True) \n
-        >> [UserAgent('Mozilla/5.0 (iPhone ...'), UserAgent(
-        'Mozilla/5.0 (iPhone; ...')]
 
-        - The functions have a convenience counterpart:
-        obj = sua.get(num=1, force_cached=True) \n
-        obj[0].string  >>  'Mozilla/5.0 (Windows ...' \n
-        obj[0].os  >>  'Windows'
+class _FrozenUserAgent(UserAgent):
+    """
+    A read-only UserAgent, which is shared between all callers of
+    UserAgents.get. Create a new UserAgent from its string, if you need
+    a modifiable copy.
+    """
 
-        - Fetch the 3 most common desktop user agents as str in a list:
-        sua.get_list(num=3) \n
-        >> ['Mozilla/5.0 (Windows ...', '...', '...']
+    __frozen = False
 
-        - Get all desktop and mobile user agents in a dict sorted by
-          usage percentage:
-        sua.get_dict() \n
-        >> {'desktop': ['Mozilla/5.0 (Windows ...', '...'],
-        'mobile': ['Mozilla/5.0 (Android ...', '...']} \n
+    def __init__(self, user_agent: str) -> None:
+        """
+        Creates a new read-only UserAgent object from the user agent
+        string.
 
-        - Parse single user agent string and create a UserAgent object.
-        ua = sua.UserAgent('Mozilla/5.0 (Windows, Chrome ...') \n
-        ua.browser  >>  'Chrome' \n
-        ua.browser_version  >>  '91' \n
+        :param user_agent: The user agent string to parse.
+        :type user_agent: str
+        :return: _FrozenUserAgent instance.
+        :rtype: _FrozenUserAgent
+        """
 
-        - Parse a single user agent string and create UserAgent object.
-        sua.parse('Mozilla/5.0 (iPhone, Safari ...') \n
-        >> UserAgent('Mozilla/5.0 (iPhone, Safari ...')
+        super().__init__(user_agent)
+        self.__frozen = True
 
-        :param max_retries: Maximum number of retries to fetch the user
-            agents from the API (default=3).
-        :type max_retries: int
-        :param timeout: Timeout in seconds for the API request
-            (default=5).
-        :type timeout: int
-        :param cache_duration: The duration in seconds after which the
-            cached user agents are refreshed (default=86400 -> 24h).
-        :type cache_duration: int
-        :param cache_location: Folder path to save the cached user
-            agents in (default=os-specific user cache).
-        :type cache_location: str
-        :return: None
+    @classmethod
+    def _from_attributes(cls, attributes: Mapping) -> _FrozenUserAgent:
         """
+        Creates a new read-only UserAgent object from pre-parsed
+        attributes (see UserAgent.__dict__) without parsing.
 
-        # Settings for the API request and local cache.
-        self._max_retries = max_retries
-        self._timeout = timeout
-        self._cache_duration = cache_duration
-        self._cache_location = cache_location
+        :param attributes: The attributes of the user agent.
+        :type attributes: Mapping
+        :return: _FrozenUserAgent instance.
+        :rtype: _FrozenUserAgent
+        """
+
+        agent = super()._from_attributes(attributes)
+        agent.__frozen = True
+
+        return agent
 
     def __repr__(self) -> str:
         """
-        Returns the UserAgents instance as a representation for fast
-        reconstruction.
+        Returns the user agent instance as a representation for fast
+        reconstruction (as a modifiable UserAgent).
+
+        :return: The UserAgent instance as a shortened representation.
+        :rtype: str
+        """
+
+        return f"{UserAgent.__name__}({self.string!r})"
+
+    def __setattr__(self, name, value) -> None:
+        """
+        Prevents modifications of the shared instance.
+        """
+
+        if self.__frozen:
+            raise AttributeError(
+                    f"Shared {UserAgent.__name__} instances are read-only. "
+                    f"Create a new one with {UserAgent.__name__}"
+                    f"(user_agent.string) to modify it."
+                    )
+
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name) -> None:
+        """
+        Prevents deletions on the shared instance.
+        """
+
+        raise AttributeError(
+                f"Shared {UserAgent.__name__} instances are read-only."
+                )
+
+
+class _Index:
+    """
+    Inverted indexes over the parsed user agents of one device type,
+    so attribute queries are answered by set intersections instead of
+    parsing and filtering the whole pool on every call.
+    """
+
+    def __init__(self, agents: tuple[UserAgent, ...]) -> None:
+        """
+        Creates the browser, OS and browser version indexes.
+
+        :param agents: The parsed user agents, sorted by usage.
+        :type agents: tuple[UserAgent]
+        :return: None
+        """
+
+        self.all = frozenset(range(len(agents)))
+        self.by_browser = {}
+        self.by_os = {}
+        versions = []
+
+        for i, agent in enumerate(agents):
+            self.by_browser.setdefault(
+                    (agent.browser or "").casefold(), set()
+                    ).add(i)
+            self.by_os.setdefault((agent.os or "").casefold(), set()).add(i)
+
+            if agent.browser_version_tuple:
+                versions.append((agent.browser_version_tuple[0], i))
+
+        # Sorted by major version for range queries with bisect.
+        versions.sort()
+        self._versions = [version for version, _ in versions]
+        self._version_indices = [i for _, i in versions]
+
+    def key(
+            self,
+            browser: str | None = None,
+            os: str | None = None,
+            min_browser_version: int | None = None,
+            ) -> tuple[str | None, str | None, int | None] | None:
+        """
+        Normalizes the filters to the indexed values, so equal queries
+        share one memorized selection and arbitrary caller input can not
+        grow the memo.
+
+        :param browser: The browser name, e.g. 'Chrome' (default=None).
+        :type browser: str
+        :param os: The OS name, e.g. 'Windows' (default=None).
+        :type os: str
+        :param min_browser_version: Minimal major browser version
+            (default=None).
+        :type min_browser_version: int
+        :return: The normalized filters or None, if no user agent can
+            match them.
+        :rtype: tuple or None
+        """
+
+        if browser is not None:
+            browser = browser.casefold()
+            if browser not in self.by_browser:
+                return None
+
+        if os is not None:
+            os = os.casefold()
+            if os not in self.by_os:
+                return None
+
+        if min_browser_version is not None:
+            # The lowest indexed version selects the same user agents.
+            pos = bisect.bisect_left(self._versions, min_browser_version)
+            if pos == len(self._versions):
+                return None
+            min_browser_version = self._versions[pos]
+
+        return browser, os, min_browser_version
+
+    def select(
+            self,
+            browser: str | None = None,
+            os: str | None = None,
+            min_browser_version: int | None = None,
+            ) -> list[int]:
+        """
+        Returns the positions of all user agents matching the filters
+        in usage order.
+
+        :param browser: The browser name, e.g. 'Chrome' (default=None).
+        :type browser: str
+        :param os: The OS name, e.g. 'Windows' (default=None).
+        :type os: str
+        :param min_browser_version: Minimal major browser version
+            (default=None).
+        :type min_browser_version: int
+        :return: The positions of the matching user agents.
+        :rtype: list[int]
+        """
+
+        selected = self.all
+
+        if browser is not None:
+            selected = selected & self.by_browser.get(browser.casefold(),
+                                                      set()
+                                                      )
+
+        if os is not None:
+            selected = selected & self.by_os.get(os.casefold(), set())
+
+        if min_browser_version is not None:
+            pos = bisect.bisect_left(self._versions, min_browser_version)
+            selected = selected & set(self._version_indices[pos:])
+
+        return sorted(selected)
+
+
+class _Pool:
+    """
+    A snapshot of a fetched user agent pool. Derived structures, like
+    the consistent hash rings, are built lazily and only once per pool
+    refresh.
+    """
+
+    def __init__(self, data: dict[str, list[str] | int]) -> None:
+        """
+        Creates a new pool snapshot from the data returned by get_dict.
+
+        :param data: The dict of desktop and mobile user agents.
+        :type data: dict
+        :return: None
+        """
+
+        self.data = data
+        self._view = None
+        self._export = None
+        self._rings = {}
+        self._samplers = {}
+        self._generators = {}
+        self._headers = {}
+        self._agents = {}
+        self._indexes = {}
+        self._selections = {}
+
+    def index(self, device: str) -> _Index:
+        """
+        Returns the attribute indexes of a device type.
+
+        :param device: The device type ('desktop' or 'mobile').
+        :type device: str
+        :return: The indexes over the user agents of the device type.
+        :rtype: _Index
+        """
+
+        index = self._indexes.get(device)
+        if index is None:
+            index = self._indexes[device] = _Index(self.agents(device))
+
+        return index
+
+    @property
+    def view(self) -> MappingProxyType:
+        """
+        Returns a read-only view of the pool data with tuples instead of
+        lists. It is created once and can safely be shared between
+        callers and threads.
+
+        :return: The read-only view of the pool data.
+        :rtype: MappingProxyType
+        """
+
+        if self._view is None:
+            data = self.data
+            if isinstance(data, Mapping):
+                data = {k: v for k, v in data.items() if k in _PUBLIC_KEYS}
+            self._view = _freeze(data)
+
+        return self._view
+
+    @property
+    def export(self) -> MappingProxyType:
+        """
+        Returns a read-only view of the pool data like view, but with
+        the usage percentages ('pct'), if they are known.
+
+        :return: The read-only view of the pool data.
+        :rtype: MappingProxyType
+        """
+
+        if self._export is None:
+            view = self.view
+            pct = self.data.get("pct")
+            self._export = MappingProxyType(
+                    {**view, "pct": _freeze(pct)} if pct else dict(view)
+                    )
+
+        return self._export
+
+    def weights(self, device: str) -> list[float]:
+        """
+        Returns the usage weights of the user agents of a device type.
+        If the usage percentages are unknown (fallback or old cache
+        files), the weights are approximated by the usage rank.
+
+        :param device: The device type ('desktop' or 'mobile').
+        :type device: str
+        :return: A list of weights in the order of the user agents.
+        :rtype: list[float]
+        """
+
+        uas = self.data[device]
+        pct = (self.data.get("pct") or {}).get(device)
+
+        if pct and len(pct) == len(uas):
+            return pct
+
+        # The lists are sorted by usage, so the rank is a fair estimate.
+        return [1 / rank for rank in range(1, len(uas) + 1)]
+
+    def ring(self, device: str) -> HashRing:
+        """
+        Returns the consistent hash ring of a device type.
+
+        :param device: The device type ('desktop' or 'mobile').
+        :type device: str
+        :return: The hash ring over the user agents of the device type.
+        :rtype: HashRing
+        """
+
+        ring = self._rings.get(device)
+        if ring is None:
+            ring = self._rings[device] = HashRing(
+                    self.data[device], self.weights(device)
+                    )
+
+        return ring
+
+    def sampler(self, device: str) -> Sampler:
+        """
+        Returns the usage weighted batch sampler of a device type.
+
+        :param device: The device type ('desktop' or 'mobile').
+        :type device: str
+        :return: The sampler over the user agents of the device type.
+        :rtype: Sampler
+        """
+
+        sampler = self._samplers.get(device)
+        if sampler is None:
+            sampler = self._samplers[device] = Sampler(
+                    self.view[device], self.weights(device)
+                    )
+
+        return sampler
+
+    def generator(self, device: str, spread: int) -> VariantGenerator:
+        """
+        Returns the usage weighted variant generator of a device type.
+
+        :param device: The device type ('desktop' or 'mobile').
+        :type device: str
+        :param spread: The maximal number of lowered releases.
+        :type spread: int
+        :return: The generator over the user agents of the device type.
+        :rtype: VariantGenerator
+        """
+
+        generator = self._generators.get((device, spread))
+        if generator is None:
+            generator = self._generators[(device, spread)] = VariantGenerator(
+                    self.view[device], self.weights(device), spread
+                    )
+
+        return generator
+
+    def headers(
+            self,
+            device: str,
+            language: str,
+            ) -> tuple[tuple[MappingProxyType, ...], list[float]]:
+        """
+        Returns the read-only header bundles of the user agents of a
+        device type (see headers.build) and their cumulative usage
+        weights. They are built once per pool refresh and language.
+
+        :param device: The device type ('desktop' or 'mobile').
+        :type device: str
+        :param language: The preferred language, e.g. 'en-US'.
+        :type language: str
+        :return: The header bundles in the order of the user agents and
+            their cumulative weights.
+        :rtype: tuple[tuple[MappingProxyType], list[float]]
+        """
+
+        bundles = self._headers.get((device, language))
+        if bundles is None:
+            bundles = self._headers[(device, language)] = (
+                    tuple(_build_headers(agent, language)
+                          for agent in self.agents(device)),
+                    list(itertools.accumulate(self.weights(device))),
+                    )
+
+        return bundles
+
+    def agents(self, device: str) -> tuple[UserAgent, ...]:
+        """
+        Returns the parsed, read-only UserAgent instances of a device
+        type. They are created once per pool refresh and shared by all
+        calls of get.
+
+        :param device: The device type ('desktop' or 'mobile').
+        :type device: str
+        :return: The UserAgent instances in the order of the strings.
+        :rtype: tuple[UserAgent]
+        """
+
+        agents = self._agents.get(device)
+        if agents is None:
+            # Snapshots can ship the parsed attributes (see
+            # UserAgents.export_snapshot), so nothing is parsed.
+            parsed = (self.data.get("parsed") or {}).get(device)
+            if parsed and len(parsed) == len(self.data[device]):
+                agents = tuple(
+                        _FrozenUserAgent._from_attributes(attributes)
+                        for attributes in parsed
+                        )
+            else:
+                agents = tuple(
+                        _FrozenUserAgent(ua) for ua in self.data[device]
+                        )
+            self._agents[device] = agents
+
+        return agents
+
+    def select(
+            self,
+            device: str,
+            browser: str | None = None,
+            os: str | None = None,
+            min_browser_version: int | None = None,
+            num: int | None = None,
+            ) -> tuple[tuple[str, ...], tuple[UserAgent, ...]]:
+        """
+        Returns the user agents of a device type matching the filters,
+        sorted by usage, as strings and as UserAgent instances. The pool
+        is parsed and indexed on the first query and the result of every
+        filter combination and number is memorized until the next
+        refresh, so repeated queries allocate nothing. Only indexed
+        filter values are memorized, filters without matches return an
+        empty result.
+
+        :param device: The device type ('desktop' or 'mobile').
+        :type device: str
+        :param browser: The browser name, e.g. 'Chrome' (default=None).
+        :type browser: str
+        :param os: The OS name, e.g. 'Windows' (default=None).
+        :type os: str
+        :param min_browser_version: Minimal major browser version
+            (default=None).
+        :type min_browser_version: int
+        :param num: Maximal number of user agents (default=None = all).
+        :type num: int
+        :return: The matching user agent strings and instances.
+        :rtype: tuple[tuple[str], tuple[UserAgent]]
+        """
+
+        if (
+                browser is not None
+                or os is not None
+                or min_browser_version is not None
+        ):
+            filters = self.index(device).key(browser, os, min_browser_version)
+            if filters is None:
+                return (), ()
+            browser, os, min_browser_version = filters
+
+        key = (device, browser, os, min_browser_version, num)
+        selected = self._selections.get(key)
+
+        if selected is not None:
+            return selected
+
+        if num is not None:
+            uas, agents = self.select(
+                    device, browser, os, min_browser_version
+                    )
+            selected = (uas[:num], agents[:num])
+
+        elif browser is None and os is None and min_browser_version is None:
+            agents = self.agents(device)
+            selected = (
+                    self.view[device],
+                    tuple(agent for agent in agents if agent.string),
+                    )
+
+        else:
+            uas = self.view[device]
+            agents = self.agents(device)
+
+            positions = self.index(device).select(
+                    browser=browser,
+                    os=os,
+                    min_browser_version=min_browser_version,
+                    )
+            selected = (
+                    tuple(uas[i] for i in positions),
+                    tuple(agents[i] for i in positions if agents[i].string),
+                    )
+
+        self._selections[key] = selected
+
+        return selected
+
+
+class UserAgents:
+    """
+    Fetch real world user agents from the public 'useragents.me' API for
+    use in a web scraping process to avoid bot detection.
+
+    You can either fetch random or usage weighted user agents. It caches
+    the user agents locally to avoid unnecessary API calls. The cached
+    user agents are refreshed every 24 hours.
+
+    :var max_retries: Maximum number of retries to fetch the user
+        agents from the API (default=3).XXX
+    :type max_retries: int
+    :var timeout: Timeout in seconds for the API request (default=5).
+    :type timeout: int
+    :var cache_duration: The duration in seconds after which the
+        cached user agents are refreshed (default=86400).
+    :type cache_duration: int
+    :var cache_location: The folder to save the cached user agents in.
+    :type cache_location: str.
+    :var sidecar_url: The URL of a sidecar (see sidecar.py), which is
+        used instead of the public API.
+    :type sidecar_url: str
+    :var snapshot_path: The read-only pool snapshot, which is used
+        before any network I/O.
+    :type snapshot_path: str
+    :var auto_refresh: If False, the user agents in memory are used
+        regardless of their age and only refresh() refreshes them.
+    :type auto_refresh: bool
+    """
+
+    _user_agents_cached = None
+    _pool = None
+
+    def __init__(
+            self,
+            max_retries: int = 3,
+            timeout: int = 5,
+            cache_duration: int = 86400,
+            cache_location: str = None,
+            sidecar_url: str = None,
+            snapshot_path: str = None,
+            auto_refresh: bool = True,
+            ) -> None:
+        """
+        Create a new UserAgents object, which can be used to fetch user
+        agents from the public useragents.me API, cache them locally and
+        return them as a string/list, dict or object (see examples).
+
+        - Initialize the class to set custom settings:
+        import simple_useragent as sua \n
+        user_agents = sua.UserAgents(max_retries=5, timeout=10, ...)
+
+        - Fetch two random mobile user agent instances:
+        user_agents.get(num=2, shuffle=True, mobile=True) \n
+        >> [UserAgent('Mozilla/5.0 (iPhone ...'), UserAgent(
+        'Mozilla/5.0 (iPhone; ...')]
+
+        - The functions have a convenience counterpart:
+        obj = sua.get(num=1, force_cached=True) \n
+        obj[0].string  >>  'Mozilla/5.0 (Windows ...' \n
+        obj[0].os  >>  'Windows'
+
+        - Fetch the 3 most common desktop user agents as str in a tuple:
+        sua.get_list(num=3) \n
+        >> ('Mozilla/5.0 (Windows ...', '...', '...')
+
+        - Get all desktop and mobile user agents in a dict sorted by
+          usage percentage:
+        sua.get_dict() \n
+        >> {'desktop': ('Mozilla/5.0 (Windows ...', '...'),
+        'mobile': ('Mozilla/5.0 (Android ...', '...')} \n
+
+        - Parse single user agent string and create a UserAgent object.
+        ua = sua.UserAgent('Mozilla/5.0 (Windows, Chrome ...') \n
+        ua.browser  >>  'Chrome' \n
+        ua.browser_version  >>  '91' \n
+
+        - Parse a single user agent string and create UserAgent object.
+        sua.parse('Mozilla/5.0 (iPhone, Safari ...') \n
+        >> UserAgent('Mozilla/5.0 (iPhone, Safari ...')
+
+        :param max_retries: Maximum number of retries to fetch the user
+            agents from the API (default=3).
+        :type max_retries: int
+        :param timeout: Timeout in seconds for the API request
+            (default=5).
+        :type timeout: int
+        :param cache_duration: The duration in seconds after which the
+            cached user agents are refreshed (default=86400 -> 24h).
+        :type cache_duration: int
+        :param cache_location: Folder path to save the cached user
+            agents in (default=None -> os-specific user cache, which is
+            resolved on first use).
+        :type cache_location: str
+        :param sidecar_url: URL of a local sidecar service, which is
+            asked instead of the public API, e.g.
+            'http://127.0.0.1:8555/' (default=None).
+        :type sidecar_url: str
+        :param snapshot_path: Path of a read-only pool snapshot (see
+            export_snapshot), which is used at startup instead of any
+            network I/O and as first fallback (default=None -> the path
+            in the SIMPLE_USERAGENT_SNAPSHOT environment variable).
+        :type snapshot_path: str
+        :param auto_refresh: If False, the user agents in memory are
+            used regardless of their age and only refresh() refreshes
+            them, e.g. by a background thread (default=True).
+        :type auto_refresh: bool
+        :return: None
+        """
+
+        # Settings for the API request and local cache.
+        self._max_retries = max_retries
+        self._timeout = timeout
+        self._cache_duration = cache_duration
+        self.__cache_location = cache_location
+        self._sidecar_url = sidecar_url
+        self._snapshot_path = snapshot_path or os.environ.get(SNAPSHOT_ENV)
+        self.__snapshot_used = False
+        self.auto_refresh = auto_refresh
+
+    def __repr__(self) -> str:
+        """
+        Returns the UserAgents instance as a representation for fast
+        reconstruction.
         """
 
         return (
@@ -513,6 +1647,18 @@ class UserAgents:
                 f"cache_location={self._cache_location!r})"
         )
 
+    @property
+    def _cache_location(self) -> str:
+        """
+        Returns the folder of the local file cache. The default folder
+        is resolved (and created) on first access.
+        """
+
+        if self.__cache_location is None:
+            self.__cache_location = _default_cache_location()
+
+        return self.__cache_location
+
     @staticmethod
     def __convert_to_list(response_data: list[dict]) -> list[str]:
         """
@@ -533,15 +1679,41 @@ class UserAgents:
 
         except Exception as e:
             LOGGER.warning(
-                    f"Could not convert response data from "
-                    f"'useragents.me' to list. Maybe the API changed "
-                    f"its response format? "
-                    f"{str(e.__class__.__name__)}: {str(e)}"
+                    "Could not convert response data from "
+                    "'useragents.me' to list. Maybe the API changed "
+                    "its response format? %s: %s",
+                    e.__class__.__name__, e
                     )
             return []
 
         return ua_list
 
+    @staticmethod
+    def __convert_to_pct(response_data: list[dict]) -> list[float]:
+        """
+        Converts the response data from API to a list of usage
+        percentages in the same order as __convert_to_list.
+
+        :param response_data: The response data from the API.
+        :type response_data: list[dict]
+        :return: A list of usage percentages sorted descending.
+        :rtype: list[float]
+        """
+
+        try:
+            return sorted(
+                    (float(entry["pct"]) for entry in response_data),
+                    reverse=True,
+                    )
+
+        except Exception as e:
+            LOGGER.debug(
+                    "Could not convert usage percentages from "
+                    "'useragents.me': %s: %s",
+                    e.__class__.__name__, e
+                    )
+            return []
+
     @staticmethod
     def __fallback() -> dict[str, list[str]] | None:
         """
@@ -564,10 +1736,10 @@ class UserAgents:
 
         except Exception as e:
             LOGGER.error(
-                    f"Could not find fallback file, that is shipped "
-                    f"with the package! Verify that the file exists "
-                    f"and if it does, report the issue please.\n"
-                    f"{str(e.__class__.__name__)}: {str(e)}"
+                    "Could not find fallback file, that is shipped "
+                    "with the package! Verify that the file exists "
+                    "and if it does, report the issue please.\n%s: %s",
+                    e.__class__.__name__, e
                     )
             return
 
@@ -582,8 +1754,20 @@ class UserAgents:
         :rtype: requests.Response or None
         """
 
+        import requests
+
         # Try to reach API for maximum 3 times (default).
         for i in range(1, self._max_retries + 1):
+            start = None
+            if HOOKS.active:
+                HOOKS.emit(
+                        "on_fetch_start",
+                        url=url,
+                        attempt=i,
+                        max_retries=self._max_retries,
+                        )
+                start = time.perf_counter()
+
             try:
                 response = requests.get(
                         url=url, timeout=self._timeout, allow_redirects=True
@@ -591,39 +1775,85 @@ class UserAgents:
 
             # If connection fails with exception, retry after delay.
             except Exception as e:
+                if start is not None:
+                    HOOKS.emit(
+                            "on_fetch_end",
+                            url=url,
+                            attempt=i,
+                            status=None,
+                            duration=time.perf_counter() - start,
+                            error=e,
+                            )
+                    HOOKS.emit(
+                            "on_retry",
+                            url=url,
+                            attempt=i,
+                            delay=i * self._timeout,
+                            reason=e.__class__.__name__,
+                            )
+
                 LOGGER.warning(
-                        f"({i}/{self._max_retries}) Try to reach "
-                        f"'useragents.me' API failed with exception: "
-                        f"{str(e.__class__.__name__)}: {str(e)}. Retrying in "
-                        f"{i * self._timeout} seconds ..."
+                        "(%s/%s) Try to reach 'useragents.me' API failed "
+                        "with exception: %s: %s. Retrying in %s seconds ...",
+                        i, self._max_retries, e.__class__.__name__, e,
+                        i * self._timeout
                         )
                 time.sleep(i * self._timeout)
                 continue
 
+            status = getattr(response, "status_code", None)
+            if start is not None:
+                HOOKS.emit(
+                        "on_fetch_end",
+                        url=url,
+                        attempt=i,
+                        status=status,
+                        duration=time.perf_counter() - start,
+                        error=None,
+                        )
+
             if not response:
+                if start is not None:
+                    HOOKS.emit(
+                            "on_retry",
+                            url=url,
+                            attempt=i,
+                            delay=i * self._timeout,
+                            reason=f"status code {status}",
+                            )
                 LOGGER.warning(
-                        f"({i}/{self._max_retries}) Try to reach "
-                        f"'useragents.me' API failed. Retrying in "
-                        f"{i * self._timeout} seconds ..."
+                        "(%s/%s) Try to reach 'useragents.me' API failed. "
+                        "Retrying in %s seconds ...",
+                        i, self._max_retries, i * self._timeout
                         )
                 time.sleep(i * self._timeout)
                 continue
 
-            if response.status_code == 429:
+            if status == 429:
+                if start is not None:
+                    HOOKS.emit("on_rate_limit", url=url, attempt=i)
                 LOGGER.warning(
-                        f"({i}/{self._max_retries}) Rate limit reached for "
-                        f"'useragents.me' (15 requests/h)."
+                        "(%s/%s) Rate limit reached for 'useragents.me' "
+                        "(15 requests/h).",
+                        i, self._max_retries
                         )
                 return
 
             # If status code indicates no success or maybe a rate-limit,
             # retry after delay.
-            if response.status_code != 200:
+            if status != 200:
+                if start is not None:
+                    HOOKS.emit(
+                            "on_retry",
+                            url=url,
+                            attempt=i,
+                            delay=i * self._timeout,
+                            reason=f"status code {status}",
+                            )
                 LOGGER.warning(
-                        f"({i}/{self._max_retries}) Try to reach "
-                        f"'useragents.me' API failed with status code: "
-                        f"{response.status_code}. Retrying in "
-                        f"{i * self._timeout} seconds ..."
+                        "(%s/%s) Try to reach 'useragents.me' API failed "
+                        "with status code: %s. Retrying in %s seconds ...",
+                        i, self._max_retries, status, i * self._timeout
                         )
                 time.sleep(i * self._timeout)
                 continue
@@ -634,11 +1864,55 @@ class UserAgents:
 
         return
 
+    def __useragents_sidecar(self) -> dict | None:
+        """
+        Fetches the user agents from a sidecar service instead of the
+        public API.
+
+        :return: A dictionary containing the user agents fetched from
+            the sidecar or None if it could not be reached after
+            _max_retries.
+        :rtype: dict or None
+        """
+
+        url = urllib.parse.urljoin(self._sidecar_url.rstrip("/") + "/", "dict")
+        response = self.__response_data(url)
+
+        if not response:
+            return
+
+        try:
+            content = response.json()
+            response_data = {
+                    "desktop": list(content["desktop"]),
+                    "mobile": list(content["mobile"]),
+                    "cached": None,
+                    "pct": {
+                            device: list(pct) for device, pct in
+                            (content.get("pct") or {}).items()
+                            },
+                    }
+
+        except Exception as e:
+            LOGGER.warning(
+                    "Could not parse response from sidecar '%s': %s: %s",
+                    self._sidecar_url, e.__class__.__name__, e
+                    )
+            return
+
+        if response_data["desktop"] and response_data["mobile"]:
+            # The pool of the sidecar is fresh, expire it from now on.
+            response_data["cached"] = int(time.time())
+            return response_data
+
+        return
+
     def __useragents_api(
             self,
             ) -> dict | None:
         """
-        Fetches user agents from the public useragents.me API.
+        Fetches user agents from the public useragents.me API or the
+        sidecar, if one is set.
 
         :return: A dictionary containing the user agents fetched from
             the API or None if the API could not be reached after
@@ -646,12 +1920,19 @@ class UserAgents:
         :rtype: dict or None
         """
 
+        if self._sidecar_url:
+            return self.__useragents_sidecar()
+
+        from bs4 import BeautifulSoup
+
         # For mobile user agents, we can not use the api endpoint.
         endpoints = {
-                "desktop": "https://www.useragents.me/",
-                "mobile": "https://www.useragents.me/",
+                "desktop": _API_URL,
+                "mobile": _API_URL,
+                }
+        response_data = {
+                "desktop": None, "mobile": None, "cached": None, "pct": {}
                 }
-        response_data = {"desktop": None, "mobile": None, "cached": None}
 
         # Fetch desktop and mobile user agents from API.
         for device, endpoint in endpoints.items():
@@ -676,16 +1957,17 @@ class UserAgents:
 
                     # Remove newlines and whitespaces.
                     content = content.replace("\n", "").replace("  ", "")
-                    print(content)
-                    response_data["desktop"] = self.__convert_to_list(
-                            json.loads(content)
+                    content = json.loads(content)
+                    response_data["desktop"] = self.__convert_to_list(content)
+                    response_data["pct"]["desktop"] = self.__convert_to_pct(
+                            content
                             )
 
                 except Exception as e:
                     LOGGER.warning(
-                            f"Could not parse HTML response from "
-                            f"'useragents.me': "
-                            f"{str(e.__class__.__name__)}: {str(e)}"
+                            "Could not parse HTML response from "
+                            "'useragents.me': %s: %s",
+                            e.__class__.__name__, e
                             )
                     return
             # For mobile UA, we need to parse the HTML response and
@@ -703,15 +1985,17 @@ class UserAgents:
                     # Remove newlines and whitespaces.
                     content = content.replace("\n", "").replace("  ", "")
 
-                    response_data["mobile"] = self.__convert_to_list(
-                            json.loads(content)
+                    content = json.loads(content)
+                    response_data["mobile"] = self.__convert_to_list(content)
+                    response_data["pct"]["mobile"] = self.__convert_to_pct(
+                            content
                             )
 
                 except Exception as e:
                     LOGGER.warning(
-                            f"Could not parse HTML response from "
-                            f"'useragents.me': "
-                            f"{str(e.__class__.__name__)}: {str(e)}"
+                            "Could not parse HTML response from "
+                            "'useragents.me': %s: %s",
+                            e.__class__.__name__, e
                             )
                     return
 
@@ -721,8 +2005,9 @@ class UserAgents:
             return response_data
 
         LOGGER.warning(
-                f"Could not reach 'useragents.me' API after "
-                f"{self._max_retries} failed retries."
+                "Could not reach 'useragents.me' API after %s failed "
+                "retries.",
+                self._max_retries
                 )
         return
 
@@ -730,44 +2015,171 @@ class UserAgents:
         """
         Fetches user agents from the local cache.
 
-        :return: A dictionary containing the user agents fetched from
-            the local cache or None if local cache could not be read.
+        :return: A dictionary containing the user agents fetched from
+            the local cache or None if local cache could not be read.
+        :rtype: dict or None
+        """
+
+        # Load cached user agents from json file.
+        try:
+            fp = pathlib.Path(self._cache_location, "user_agents.json")
+
+            with open(fp, "r") as fh:
+                response_data = json.load(fh)
+
+                return response_data
+
+        except FileNotFoundError:
+            LOGGER.debug(
+                    "No cached 'user_agents.json' found. Maybe your first run?"
+                    )
+            return
+
+        except Exception as e:
+            LOGGER.warning(
+                    "Could not load cached 'user_agents.json': %s: %s",
+                    e.__class__.__name__, e
+                    )
+            return
+
+    def __useragents_snapshot(
+            self,
+            restamp: bool = True,
+            ) -> dict[str, list[str] | int] | None:
+        """
+        Loads the user agents from the read-only snapshot. At startup,
+        the pool is treated as fresh from now on, so it is used for one
+        cache duration before the next refresh is tried.
+
+        :param restamp: If False, the pool keeps the time of the
+            snapshot, so the next call tries to refresh again, e.g. as
+            fallback (default=True).
+        :type restamp: bool
+        :return: A dictionary containing the user agents of the
+            snapshot or None if it could not be read.
         :rtype: dict or None
         """
 
-        # Load cached user agents from json file.
         try:
-            fp = pathlib.Path(self._cache_location, "user_agents.json")
-
-            with open(fp, "r") as fh:
+            with open(self._snapshot_path, "r") as fh:
                 response_data = json.load(fh)
 
-                return response_data
+            if response_data.get("format") != _SNAPSHOT_FORMAT:
+                raise ValueError(
+                        f"Unsupported format {response_data.get('format')!r}"
+                        )
 
-        except FileNotFoundError:
-            LOGGER.debug(
-                    "No cached 'user_agents.json' found. Maybe your first run?"
-                    )
-            return
+            if not response_data["desktop"] or not response_data["mobile"]:
+                raise ValueError("No user agents")
 
         except Exception as e:
             LOGGER.warning(
-                    f"Could not load cached 'user_agents.json': "
-                    f"{str(e.__class__.__name__)}: {str(e)}"
+                    "Could not load snapshot '%s': %s: %s",
+                    self._snapshot_path, e.__class__.__name__, e
                     )
             return
 
-    def __check_cached(self) -> bool:
+        # The attributes may differ, if they were parsed by another
+        # version of the package.
+        if response_data.pop("package", None) != __version__:
+            response_data.pop("parsed", None)
+        response_data.pop("format")
+
+        response_data["snapshot"] = response_data["cached"]
+        if restamp:
+            response_data["cached"] = int(time.time())
+
+        return response_data
+
+    def export_snapshot(
+            self,
+            path: str,
+            parsed: bool = True,
+            force_cached: bool = False,
+            ) -> dict[str, list[str] | int]:
+        """
+        Refreshes the pool once and writes it as self-contained,
+        read-only snapshot, e.g. to bake it into a container image.
+        Point snapshot_path or the SIMPLE_USERAGENT_SNAPSHOT environment
+        variable to it, to start without any network I/O.
+
+        :param path: The file to write the snapshot to.
+        :type path: str
+        :param parsed: Includes the parsed attributes of the user agents,
+            so they are not parsed at startup (default=True).
+        :type parsed: bool
+        :param force_cached: If True, exports the local file cache
+            instead of refreshing (default=False).
+        :type force_cached: bool
+        :return: The written snapshot.
+        :rtype: dict
+        :raises RuntimeError: If the user agents could not be fetched.
+        """
+
+        if force_cached:
+            data = self.__useragents_cached()
+        else:
+            data = self.__useragents_api()
+
+        if not data or not data.get("desktop") or not data.get("mobile"):
+            source = "local cache" if force_cached else "'useragents.me'"
+            raise RuntimeError(
+                    f"Could not fetch user agents from {source}. No "
+                    f"snapshot written."
+                    )
+
+        snapshot = {
+                "format": _SNAPSHOT_FORMAT,
+                "package": __version__,
+                "desktop": list(data["desktop"]),
+                "mobile": list(data["mobile"]),
+                "pct": data.get("pct") or {},
+                "cached": data.get("cached") or int(time.time()),
+                }
+
+        def attributes(agent: UserAgent) -> dict:
+            return {
+                    **agent.__dict__(),
+                    "browser_version_tuple": list(agent.browser_version_tuple),
+                    "os_version_tuple": list(agent.os_version_tuple),
+                    }
+
+        if parsed:
+            snapshot["parsed"] = {
+                    device: [attributes(UserAgent(ua)) for ua in
+                             snapshot[device]]
+                    for device in ("desktop", "mobile")
+                    }
+
+        # Write to a temporary file first, so readers never see a
+        # partial snapshot.
+        tmp = pathlib.Path(f"{path}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "w") as fh:
+                json.dump(snapshot, fh)
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+        return snapshot
+
+    def __check_cached(self, data: dict = None) -> bool:
         """
         Checks if the cached user agents are young enough.
 
+        :param data: The user agent data to check (default=None = the
+            user agents in memory).
+        :type data: dict
         :return: True if cached user agents are young enough.
         :rtype: bool
         """
 
-        if self._user_agents_cached:
+        if data is None:
+            data = self._user_agents_cached
+
+        if data:
             if (
-                    int(time.time()) - self._user_agents_cached["cached"]
+                    int(time.time()) - data["cached"]
             ) < self._cache_duration:
                 return True
 
@@ -790,19 +2202,15 @@ class UserAgents:
                 num = int(num)
             except (TypeError, ValueError):
                 LOGGER.warning(
-                        f"Could not convert '{num}' to int. "
-                        "Returning "
-                        "empty list ..."
+                        "Could not convert '%s' to int. Returning empty "
+                        "list ...", num
                         )
                 return 0, "mobile"
 
         if num and num < 1:
             LOGGER.warning(
-                    f"You requested '{num}' user agents. "
-                    "Returning empty "
-                    ""
-                    ""
-                    "list ..."
+                    "You requested '%s' user agents. Returning empty "
+                    "list ...", num
                     )
             return 0, "mobile"  # Device type does not matter.
 
@@ -820,31 +2228,219 @@ class UserAgents:
 
         elif num > num_max:
             LOGGER.warning(
-                    f"Maximal number of {device} user agents is {num_max}. "
-                    f"Requested: {num}. Enforcing {num_max} user agents "
-                    f"..."
+                    "Maximal number of %s user agents is %s. Requested: %s. "
+                    "Enforcing %s user agents ...",
+                    device, num_max, num, num_max
                     )
             num = num_max
 
         return num, device
 
+    def __pool(self, data: dict[str, list[str] | int]) -> _Pool:
+        """
+        Returns the pool snapshot for the given user agent data. The
+        snapshot is reused until get_dict returns refreshed data. Data,
+        which was loaded again without changes (e.g. a stale file cache
+        or the fallback file), keeps the snapshot.
+
+        :param data: The dict of desktop and mobile user agents or the
+            read-only view of a pool snapshot.
+        :type data: dict or MappingProxyType
+        :return: The pool snapshot.
+        :rtype: _Pool
+        """
+
+        pool = self._pool
+        if pool is not None and (data is pool.data or data is pool.view):
+            return pool
+
+        if pool is not None and data == pool.data:
+            # Adopt the equal data, so the next call hits the identity
+            # check above.
+            pool.data = data
+        else:
+            self._pool = _Pool(data)
+
+            # Next to the file cache, the next process loads the prepared
+            # regexes of the parser from there.
+            try:
+                _persist_regexes(self._cache_location)
+            except Exception as e:
+                LOGGER.debug(
+                        "Could not persist the regexes: %s: %s",
+                        e.__class__.__name__, e
+                        )
+
+        return self._pool
+
+    def __adopt(
+            self,
+            data: dict[str, list[str] | int],
+            ) -> _Pool:
+        """
+        Replaces the user agents in memory with the given data in one
+        step and returns their pool snapshot.
+
+        :param data: The dict of desktop and mobile user agents.
+        :type data: dict
+        :return: The pool snapshot.
+        :rtype: _Pool
+        """
+
+        self._user_agents_cached = data
+
+        return self.__pool(data)
+
+    def __select(
+            self,
+            device: str,
+            force_cached: bool = None,
+            browser: str = None,
+            os: str = None,
+            min_browser_version: int = None,
+            num: int = None,
+            ) -> tuple[tuple[str, ...], tuple[UserAgent, ...]]:
+        """
+        Collects the user agents of a device type matching the given
+        attribute filters, sorted by usage percentage, as strings and
+        as shared UserAgent instances.
+
+        :param device: The device type ('desktop' or 'mobile').
+        :type device: str
+        :param force_cached: If True, forces the use of local file
+            cached user agents, if False, forces the use of the API
+            (default=None).
+        :type force_cached: bool
+        :param browser: The browser name (default=None).
+        :type browser: str
+        :param os: The OS name (default=None).
+        :type os: str
+        :param min_browser_version: Minimal major browser version
+            (default=None).
+        :type min_browser_version: int
+        :param num: Maximal number of user agents (default=None = all).
+        :type num: int
+        :return: The matching user agent strings and instances.
+        :rtype: tuple[tuple[str], tuple[UserAgent]]
+        """
+
+        # Catch invalid min_browser_version parameter.
+        if min_browser_version is not None:
+            try:
+                min_browser_version = int(min_browser_version)
+            except (TypeError, ValueError):
+                LOGGER.warning(
+                        "Could not convert '%s' to int. Returning empty "
+                        "list ...", min_browser_version
+                        )
+                return (), ()
+
+        data = self.get_dict(force_cached=force_cached)
+
+        return self.__pool(data).select(
+                device,
+                browser=browser,
+                os=os,
+                min_browser_version=min_browser_version,
+                num=num,
+                )
+
     def get_dict(
             self,
             force_cached: bool = None,
-            ) -> dict[str, list[str] | int]:
+            ) -> MappingProxyType[str, tuple[str, ...] | int]:
         """
         Collects a dict of all available user agents as strings in a
-        list for each desktop and mobile device. The user agents are
-        sorted by usage percentage.
+        tuple for each desktop and mobile device. The user agents are
+        sorted by usage percentage. The dict is a read-only view, that
+        is shared between all callers until the next refresh.
+
+        :param force_cached: If True, forces the use of local file
+            cached user agents, if False, forces the use of the API
+            (default=None).
+        :type force_cached: bool
+        :return: A read-only dict of desktop and mobile user agents.
+        :rtype: MappingProxyType[str, tuple[str]]
+        """
+
+        return self.__get_pool(force_cached, refresh=self.auto_refresh).view
+
+    def refresh(
+            self,
+            force_cached: bool = None,
+            ) -> MappingProxyType[str, tuple[str, ...] | int]:
+        """
+        Refreshes the user agents like get_dict, if they are older than
+        the cache duration, even if auto_refresh is disabled.
+
+        :param force_cached: If True, forces the use of local file
+            cached user agents, if False, forces the use of the API
+            (default=None).
+        :type force_cached: bool
+        :return: A read-only dict of desktop and mobile user agents.
+        :rtype: MappingProxyType[str, tuple[str]]
+        """
+
+        return self.__get_pool(force_cached, refresh=True).view
+
+    def export_dict(
+            self,
+            force_cached: bool = None,
+            ) -> MappingProxyType[str, tuple[str, ...] | int | Mapping]:
+        """
+        Collects the dict of get_dict with the usage percentages of the
+        user agents per device type ('pct'), e.g. to serve them to other
+        clients (see sidecar.py). The dict is a read-only view, that is
+        shared between all callers until the next refresh.
 
         :param force_cached: If True, forces the use of local file
             cached user agents, if False, forces the use of the API
             (default=None).
         :type force_cached: bool
-        :return: A dict of desktop and mobile user agents.
-        :rtype: dict[str, list[str]]
+        :return: A read-only dict of desktop and mobile user agents and
+            their usage percentages.
+        :rtype: MappingProxyType
+        """
+
+        return self.__get_pool(force_cached,
+                               refresh=self.auto_refresh
+                               ).export
+
+    @property
+    def pool_age(self) -> int | None:
+        """
+        Returns the seconds since the user agents in memory were
+        fetched, or None, if none are loaded yet.
+        """
+
+        cached = (self._user_agents_cached or {}).get("cached")
+        if not cached:
+            return None
+
+        return int(time.time()) - cached
+
+    def __get_pool(
+            self,
+            force_cached: bool,
+            refresh: bool,
+            ) -> _Pool:
+        """
+        Collects the user agents of get_dict from the cache tiers and
+        returns their pool snapshot.
+
+        :param force_cached: See get_dict.
+        :type force_cached: bool
+        :param refresh: If False, the user agents in memory are used
+            regardless of their age.
+        :type refresh: bool
+        :return: The pool snapshot.
+        :rtype: _Pool
         """
 
+        # Other threads (e.g. of the sidecar) read the user agents in
+        # memory during a refresh. So each tier loads into a local
+        # variable and only a successful result replaces them.
+
         # 1. Check for memory cached user agents (class attributes).
         if (
                 self._user_agents_cached
@@ -854,28 +2450,62 @@ class UserAgents:
         ):
 
             # Check if the cached uas are young enough.
-            if self.__check_cached():
-                return self._user_agents_cached
+            if not refresh or self.__check_cached():
+                if HOOKS.active:
+                    HOOKS.emit("on_cache_hit", tier="memory")
+                return self.__pool(self._user_agents_cached)
+
+        # 1.25. Read-only snapshot at startup, without any network I/O.
+        if (
+                self._snapshot_path
+                and not self.__snapshot_used
+                and force_cached is not False
+        ):
+            self.__snapshot_used = True
+            snapshot = self.__useragents_snapshot()
+            cached = self.__useragents_cached() if snapshot else None
+
+            # A newer file cache wins over the baked snapshot, but only
+            # if it is young enough, otherwise we would fetch at startup.
+            if (
+                    cached
+                    and (cached.get("cached") or 0)
+                    > (snapshot["snapshot"] or 0)
+                    and self.__check_cached(cached)
+            ):
+                LOGGER.debug("Local cache is newer than the snapshot.")
+                snapshot = None
+
+            if snapshot:
+                if HOOKS.active:
+                    HOOKS.emit("on_cache_hit", tier="snapshot")
+                return self.__adopt(snapshot)
 
         # 1.5. Forced use of local file cached user agents.
         if force_cached:
             LOGGER.debug("Forcing the use of local cached user agents ...")
-            self._user_agents_cached = self.__useragents_cached()
+            data = self.__useragents_cached()
 
-            if self._user_agents_cached:
-                return self._user_agents_cached
+            if data:
+                if HOOKS.active:
+                    HOOKS.emit("on_cache_hit", tier="file")
+                return self.__adopt(data)
 
             # If no local cached user agents are available.
             LOGGER.warning("Falling back to historic user agent.")
-            return {"desktop": _FALLBACK_DESKTOP, "mobile": _FALLBACK_MOBILE}
+            if HOOKS.active:
+                HOOKS.emit("on_fallback", tier="fallback_hardcoded")
+            return self.__pool(_FALLBACK_HARDCODED)
 
         # 2. Check for local file cached user agents.
         if force_cached is not False:
-            self._user_agents_cached = self.__useragents_cached()
+            data = self.__useragents_cached()
 
             # Check if the cached uas are young enough and return them.
-            if self.__check_cached():
-                return self._user_agents_cached
+            if data and self.__check_cached(data):
+                if HOOKS.active:
+                    HOOKS.emit("on_cache_hit", tier="file")
+                return self.__adopt(data)
 
         # 3. Call API to fetch user agents and save them to local cache.
         if force_cached is False:
@@ -884,31 +2514,79 @@ class UserAgents:
                     "of local cached user agents first ..."
                     )
 
-        self._user_agents_cached = self.__useragents_api()
+        start = None
+        if HOOKS.active:
+            HOOKS.emit("on_refresh_start")
+            start = time.perf_counter()
+
+        data = self.__useragents_api()
+
+        if start is not None:
+            HOOKS.emit(
+                    "on_refresh_end",
+                    duration=time.perf_counter() - start,
+                    success=bool(data),
+                    )
 
-        if self._user_agents_cached:
+        if data:
             try:
                 fp = pathlib.Path(self._cache_location, "user_agents.json")
+                tmp = fp.with_name(f"{fp.name}.{os.getpid()}.tmp")
 
-                # Save user agents to local file cache.
-                with open(fp, "w") as fh:
-                    json.dump(self._user_agents_cached, fh)
+                # Save user agents to local file cache. Write to a
+                # temporary file first, so concurrent processes never
+                # read a partial file.
+                try:
+                    with open(tmp, "w") as fh:
+                        json.dump(data, fh)
+                    os.replace(tmp, fp)
+                finally:
+                    tmp.unlink(missing_ok=True)
 
             except Exception as e:
                 LOGGER.warning(
-                        f"Could not save user agents to local cache. Maybe "
-                        f"got no write permission for "
-                        f"'{self._cache_location}'? "
-                        f"{str(e.__class__.__name__)}: {str(e)}"
+                        "Could not save user agents to local cache. Maybe "
+                        "got no write permission for '%s'? %s: %s",
+                        self._cache_location, e.__class__.__name__, e
                         )
 
-            return self._user_agents_cached
+            if HOOKS.active:
+                HOOKS.emit("on_cache_hit", tier="api")
+            return self.__adopt(data)
+
+        # 3.25. Keep the (outdated) user agents in memory, they are
+        # newer than any of the fallbacks. The next refresh tries to
+        # reach the API again.
+        if (
+                self._user_agents_cached
+                and self._user_agents_cached["desktop"]
+                and self._user_agents_cached["mobile"]
+        ):
+            LOGGER.warning("Could not refresh, keeping the user agents in "
+                           "memory."
+                           )
+            if HOOKS.active:
+                HOOKS.emit("on_fallback", tier="memory")
+            return self.__pool(self._user_agents_cached)
+
+        # 3.5. Fall back to the (outdated) snapshot. It keeps its age,
+        # so at the next run, we will try to reach the API again.
+        if self._snapshot_path:
+            self.__snapshot_used = True
+            data = self.__useragents_snapshot(restamp=False)
+            if data:
+                LOGGER.warning("Falling back to snapshot user agents.")
+                if HOOKS.active:
+                    HOOKS.emit("on_fallback", tier="snapshot")
+                return self.__adopt(data)
 
         # 4. Fall back to historic local file user agents.
         LOGGER.error("Falling back to historic file user agents.")
-        self._user_agents_cached = self.__fallback()
-        if self._user_agents_cached:
-            return self._user_agents_cached
+        data = self.__fallback()
+        if data:
+            if HOOKS.active:
+                HOOKS.emit("on_fallback", tier="fallback_file")
+            return self.__adopt(data)
 
         # 5. Final fall back to historic hard-coded user agents.
         LOGGER.critical(
@@ -916,7 +2594,9 @@ class UserAgents:
                 "These are not up to date and limited in number."
                 "This should never happen. Please report this issue."
                 )
-        return {"desktop": _FALLBACK_DESKTOP, "mobile": _FALLBACK_MOBILE}
+        if HOOKS.active:
+            HOOKS.emit("on_fallback", tier="fallback_hardcoded")
+        return self.__pool(_FALLBACK_HARDCODED)
 
     def get_list(
             self,
@@ -924,9 +2604,14 @@ class UserAgents:
             mobile: bool = False,
             shuffle: bool = False,
             force_cached: bool = None,
-            ) -> list[str]:
+            browser: str = None,
+            os: str = None,
+            min_browser_version: int = None,
+            ) -> tuple[str, ...]:
         """
-        Fetches a list of usage weighted user agents as strings.
+        Fetches a tuple of usage weighted user agents as strings. The
+        tuple is memorized per filters and number until the next
+        refresh, so it is shared between callers.
 
         :param num: The number of user agents to fetch (desktop=45,
             mobile=23).
@@ -940,22 +2625,49 @@ class UserAgents:
             cached user agents, if False, forces the use of the API
             (default=None).
         :type force_cached: bool
-        :return: A list of user agents as strings.
-        :rtype: list[str]
+        :param browser: Only user agents of this browser, e.g. 'Chrome'
+            (default=None).
+        :type browser: str
+        :param os: Only user agents of this OS, e.g. 'Windows'
+            (default=None).
+        :type os: str
+        :param min_browser_version: Only user agents with at least this
+            major browser version, e.g. 120 (default=None).
+        :type min_browser_version: int
+        :return: A tuple of user agents as strings.
+        :rtype: tuple[str]
         """
 
         # Check if the requested number of user agents is valid.
         num, device = self.__check_num(num, mobile)
 
         # Get the user agents list.
-        uas = self.get_dict(
-                force_cached=force_cached,
-                )[device]
-
         if shuffle:
-            uas = random.SystemRandom().choices(uas, k=num)
+            uas, _ = self.__select(
+                    device=device,
+                    force_cached=force_cached,
+                    browser=browser,
+                    os=os,
+                    min_browser_version=min_browser_version,
+                    )
+
+            if not uas:
+                return uas
+
+            return tuple(random.SystemRandom().choices(uas, k=num))
+
+        # Memorized per filters and number, repeated calls allocate
+        # nothing.
+        uas, _ = self.__select(
+                device=device,
+                force_cached=force_cached,
+                browser=browser,
+                os=os,
+                min_browser_version=min_browser_version,
+                num=num,
+                )
 
-        return uas[:num]
+        return uas
 
     def get(
             self,
@@ -963,9 +2675,14 @@ class UserAgents:
             mobile: bool = False,
             shuffle: bool = False,
             force_cached: bool = None,
+            browser: str = None,
+            os: str = None,
+            min_browser_version: int = None,
             ) -> list[UserAgent]:
         """
-        Fetches a list of usage weighted user agents as instances.
+        Fetches a list of usage weighted user agents as instances. The
+        instances are parsed once per pool refresh and are read-only,
+        as they are shared between all calls.
 
         :param num: The number of user agents to fetch (default:
             desktop=45, mobile=23).
@@ -978,6 +2695,15 @@ class UserAgents:
         :param force_cached: If True, forces the use of local file
             cached user agents, if False, forces the use of the API
             (default=None).
+        :param browser: Only user agents of this browser, e.g. 'Chrome'
+            (default=None).
+        :type browser: str
+        :param os: Only user agents of this OS, e.g. 'Windows'
+            (default=None).
+        :type os: str
+        :param min_browser_version: Only user agents with at least this
+            major browser version, e.g. 120 (default=None).
+        :type min_browser_version: int
         :return: A list of UserAgent instances.
         :rtype: list[UserAgent]
         """
@@ -985,22 +2711,355 @@ class UserAgents:
         # Check if the requested number of user agents is valid.
         num, device = self.__check_num(num, mobile)
 
-        uas = self.get_dict(
+        # The instances are parsed once per pool refresh and shared.
+        _, agents = self.__select(
+                device=device,
                 force_cached=force_cached,
-                )[device]
+                browser=browser,
+                os=os,
+                min_browser_version=min_browser_version,
+                num=None if shuffle else num,
+                )
 
-        if shuffle:
-            uas = random.SystemRandom().choices(uas, k=num)
+        if shuffle and agents:
+            return random.SystemRandom().choices(agents, k=num)
+
+        return list(agents)
+
+    def sample_indices(
+            self,
+            k: int,
+            mobile: bool = False,
+            seed: int = None,
+            force_cached: bool = None,
+            ):
+        """
+        Draws k usage weighted user agents (with replacement) at once,
+        e.g. to assign user agents to millions of planned requests. The
+        samples are returned as a compact index array into the string
+        table of the pool, so no Python string references are created.
+        Uses NumPy if it is installed. The number of samples is not
+        limited to the size of the pool.
+
+        - Assign user agents to a million requests:
+        indices, table = user_agents.sample_indices(1_000_000) \n
+        table[indices[0]]  >>  'Mozilla/5.0 (Windows ...'
+
+        :param k: The number of samples to draw.
+        :type k: int
+        :param mobile: Samples mobile user agents (default=False).
+        :type mobile: bool
+        :param seed: Seed for reproducible samples (default=None).
+        :type seed: int
+        :param force_cached: If True, forces the use of local file
+            cached user agents, if False, forces the use of the API
+            (default=None).
+        :type force_cached: bool
+        :return: The indices (numpy.ndarray or array.array) and the
+            string table they refer to.
+        :rtype: tuple[numpy.ndarray | array.array, tuple[str]]
+        """
+
+        # Catch invalid k parameter.
+        try:
+            k = int(k)
+        except (TypeError, ValueError):
+            LOGGER.warning(
+                    "Could not convert '%s' to int. Returning no samples ...",
+                    k
+                    )
+            k = 0
+
+        if k < 0:
+            LOGGER.warning(
+                    "You requested '%s' samples. Returning no samples ...", k
+                    )
+            k = 0
+
+        device = "mobile" if mobile else "desktop"
+        pool = self.__pool(self.get_dict(force_cached=force_cached))
+        sampler = pool.sampler(device)
+
+        return sampler.sample(k, seed=seed), sampler.table
+
+    def generate(
+            self,
+            num: int = None,
+            mobile: bool = False,
+            seed: int = None,
+            spread: int = 2,
+            force_cached: bool = None,
+            ) -> Iterator[str]:
+        """
+        Lazily generates realistic, internally consistent variants of
+        the fetched user agents, drawn by usage, e.g. for large crawls,
+        in which the few real world strings would be repeated too often.
+        Browser versions are lowered by up to spread releases, build,
+        patch and iOS versions vary (see synthetic.py). The number of
+        variants is not limited to the size of the pool.
+
+        - Stream a reproducible million variants:
+        for ua in user_agents.generate(1_000_000, seed=42): ...
+
+        :param num: The number of variants (default=None -> endless).
+        :type num: int
+        :param mobile: Generates mobile user agents (default=False).
+        :type mobile: bool
+        :param seed: Seed for reproducible variants (default=None).
+        :type seed: int
+        :param spread: The maximal number of lowered browser releases
+            and iOS minor versions (default=2).
+        :type spread: int
+        :param force_cached: If True, forces the use of local file
+            cached user agents, if False, forces the use of the API
+            (default=None).
+        :type force_cached: bool
+        :return: The user agent strings.
+        :rtype: Iterator[str]
+        """
+
+        # Catch invalid num parameter.
+        if num is not None:
+            try:
+                num = int(num)
+            except (TypeError, ValueError):
+                LOGGER.warning(
+                        "Could not convert '%s' to int. Returning no "
+                        "user agents ...", num
+                        )
+                num = 0
+
+            if num < 0:
+                LOGGER.warning(
+                        "You requested '%s' user agents. Returning no "
+                        "user agents ...", num
+                        )
+                num = 0
+
+        device = "mobile" if mobile else "desktop"
+        pool = self.__pool(self.get_dict(force_cached=force_cached))
+
+        return pool.generator(device, spread).stream(num, seed=seed)
+
+    def get_sticky(
+            self,
+            key: str,
+            mobile: bool = False,
+            force_cached: bool = None,
+            ) -> UserAgent:
+        """
+        Fetches the user agent assigned to the given key, e.g. a session
+        id or a domain. The same key always gets the same user agent in
+        every process and mostly keeps it across pool refreshes. Keys
+        are distributed by usage percentage (consistent hashing).
+
+        :param key: The key to assign a user agent to.
+        :type key: str
+        :param mobile: Fetches mobile user agents (default=False).
+        :type mobile: bool
+        :param force_cached: If True, forces the use of local file
+            cached user agents, if False, forces the use of the API
+            (default=None).
+        :type force_cached: bool
+        :return: The UserAgent instance assigned to the key.
+        :rtype: UserAgent
+        """
+
+        device = "mobile" if mobile else "desktop"
+        pool = self.__pool(self.get_dict(force_cached=force_cached))
+
+        return pool.agents(device)[pool.ring(device).index(key)]
+
+    def get_headers(
+            self,
+            mobile: bool = False,
+            key: str = None,
+            language: str = DEFAULT_LANGUAGE,
+            force_cached: bool = None,
+            ) -> MappingProxyType[str, str]:
+        """
+        Fetches a usage weighted, ready-to-send set of request headers:
+        The user agent with matching client hints ('Sec-CH-UA*'),
+        'Accept*' and 'Sec-Fetch-*' headers in the order of its browser
+        (see headers.py). The bundles are built once per pool refresh,
+        so a call only draws one of them. The result is read-only and
+        shared, copy it with dict(...) to modify it.
+
+        - requests.get(url, headers=user_agents.get_headers())
+
+        :param mobile: Fetches the headers of mobile user agents
+            (default=False).
+        :type mobile: bool
+        :param key: Always returns the headers of the user agent
+            assigned to this key, e.g. a session id (see get_sticky)
+            (default=None -> random).
+        :type key: str
+        :param language: The preferred language, e.g. 'de-DE'
+            (default='en-US').
+        :type language: str
+        :param force_cached: If True, forces the use of local file
+            cached user agents, if False, forces the use of the API
+            (default=None).
+        :type force_cached: bool
+        :return: The read-only request headers.
+        :rtype: MappingProxyType[str, str]
+        """
+
+        device = "mobile" if mobile else "desktop"
+        pool = self.__pool(self.get_dict(force_cached=force_cached))
+        bundles, cum_weights = pool.headers(device, language)
+
+        if key is not None:
+            return bundles[pool.ring(device).index(key)]
+
+        return random.SystemRandom().choices(
+                bundles, cum_weights=cum_weights
+                )[0]
 
-        return [UserAgent(ua) for ua in uas[:num] if ua]
 
+# Shared instance of the convenience functions, created on first call.
+_DEFAULT_USER_AGENTS = None
+
+
+def _default_user_agents() -> UserAgents:
+    """
+    Returns the UserAgents instance with the default settings, which is
+    shared by the convenience functions.
+
+    :return: The shared UserAgents instance.
+    :rtype: UserAgents
+    """
+
+    global _DEFAULT_USER_AGENTS
+
+    if _DEFAULT_USER_AGENTS is None:
+        _DEFAULT_USER_AGENTS = UserAgents()
+
+    return _DEFAULT_USER_AGENTS
+
+
+# Convenience functions (for more settings, initialize the class). They
+# keep the signatures and docstrings of the UserAgents methods.
+def get_list(
+        num: int = None,
+        mobile: bool = False,
+        shuffle: bool = False,
+        force_cached: bool = None,
+        browser: str = None,
+        os: str = None,
+        min_browser_version: int = None,
+        ) -> tuple[str, ...]:
+    return _default_user_agents().get_list(
+            num=num,
+            mobile=mobile,
+            shuffle=shuffle,
+            force_cached=force_cached,
+            browser=browser,
+            os=os,
+            min_browser_version=min_browser_version,
+            )
+
+
+def get_dict(
+        force_cached: bool = None,
+        ) -> MappingProxyType[str, tuple[str, ...] | int]:
+    return _default_user_agents().get_dict(force_cached=force_cached)
+
+
+def get(
+        num: int = None,
+        mobile: bool = False,
+        shuffle: bool = False,
+        force_cached: bool = None,
+        browser: str = None,
+        os: str = None,
+        min_browser_version: int = None,
+        ) -> list[UserAgent]:
+    return _default_user_agents().get(
+            num=num,
+            mobile=mobile,
+            shuffle=shuffle,
+            force_cached=force_cached,
+            browser=browser,
+            os=os,
+            min_browser_version=min_browser_version,
+            )
+
+
+def get_headers(
+        mobile: bool = False,
+        key: str = None,
+        language: str = DEFAULT_LANGUAGE,
+        force_cached: bool = None,
+        ) -> MappingProxyType[str, str]:
+    return _default_user_agents().get_headers(
+            mobile=mobile,
+            key=key,
+            language=language,
+            force_cached=force_cached,
+            )
+
+
+get_list.__doc__ = UserAgents.get_list.__doc__
+get_dict.__doc__ = UserAgents.get_dict.__doc__
+get.__doc__ = UserAgents.get.__doc__
+get_headers.__doc__ = UserAgents.get_headers.__doc__
 
-# Convenience functions (for more settings, initialize the class).
-get_list = UserAgents().get_list
-get_dict = UserAgents().get_dict
-get = UserAgents().get
 parse = UserAgent
 
+
+def pack_many(agents: Iterable[UserAgent]) -> bytes:
+    """
+    Packs user agents to concatenated binary records (see
+    UserAgent.to_bytes).
+
+    :param agents: The user agents to pack.
+    :type agents: Iterable[UserAgent]
+    :return: The binary records.
+    :rtype: bytes
+    """
+
+    return b"".join([agent.to_bytes() for agent in agents])
+
+
+def unpack_many(data: bytes | bytearray | memoryview) -> Iterator[UserAgent]:
+    """
+    Lazily restores the user agents of pack_many. The records are read
+    from a memoryview of the data, so only the yielded objects are
+    allocated.
+
+    :param data: The binary records.
+    :type data: bytes or bytearray or memoryview
+    :return: The restored UserAgent instances.
+    :rtype: Iterator[UserAgent]
+    :raises ValueError: If the data contains an invalid record.
+    """
+
+    view = memoryview(data).cast("B")
+    offset = 0
+
+    while offset < len(view):
+        agent, offset = UserAgent._unpack(view, offset)
+        yield agent
+
+
+@functools.lru_cache(maxsize=65536)
+def attribute_values(string: str) -> tuple:
+    """
+    Returns the attribute values of a user agent string in the order of
+    the attributes of UserAgent.__dict__, e.g. for records. Logs and
+    services repeat the same few user agents, so the values are cached.
+
+    :param string: The user agent string.
+    :type string: str
+    :return: The attribute values.
+    :rtype: tuple
+    """
+
+    agent = UserAgent(string)
+    return tuple(getattr(agent, attribute) for attribute in _ATTRIBUTES)
+
+
 if __name__ == "__main__":
     # Test the package.
     ua = get(num=5)
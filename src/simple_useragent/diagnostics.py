@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+
+"""
+diagnostics.py: Memory diagnostics of the simple-useragent package.
+
+This module reports the bytes retained by each subsystem of the package
+(pool snapshot, parsed UserAgent objects, memory cache, parse template
+cache, regex set and the structures of ua_parser), by walking the
+referenced objects with sys.getsizeof. Objects shared between
+subsystems are only counted once. For allocations of a workload,
+tracemalloc probes can be used.
+
+# Report the retained memory per subsystem:
+import simple_useragent as sua
+from simple_useragent import diagnostics
+
+user_agents = sua.UserAgents()
+user_agents.get()
+diagnostics.memory_report(user_agents)
+>> {'subsystems': {'parsed_objects': 52104, 'pool': 31688, ...}, ...}
+
+# Trace the allocations of a workload:
+with diagnostics.trace_memory() as report:
+    [sua.UserAgent(s) for s in strings]
+report['net'], report['peak'], report['top']
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import contextlib
+import gc
+import sys
+import tracemalloc
+import types
+from typing import Any, Callable, Iterator
+
+from . import core
+
+# Shared objects, which are not owned by any subsystem.
+_SKIP_TYPES = (
+        type,
+        types.ModuleType,
+        types.FunctionType,
+        types.BuiltinFunctionType,
+        types.CodeType,
+        )
+
+# Additional caches, which report their retained objects by name.
+_CACHES = {}
+
+
+def register_cache(name: str, getter: Callable[[], Any]) -> None:
+    """
+    Registers a cache of the package to be included in memory_report.
+
+    :param name: The name of the subsystem in the report.
+    :type name: str
+    :param getter: Returns the objects retained by the cache.
+    :type getter: Callable
+    :return: None
+    """
+
+    _CACHES[name] = getter
+
+
+def deep_sizeof(obj: Any, seen: set[int] = None) -> int:
+    """
+    Returns the size in bytes of an object and all objects it references,
+    which are not in seen yet. Types, modules and functions are skipped.
+
+    :param obj: The object to measure.
+    :type obj: Any
+    :param seen: The ids of objects already counted, which is updated
+        (default=None).
+    :type seen: set[int]
+    :return: The retained size in bytes.
+    :rtype: int
+    """
+
+    if seen is None:
+        seen = set()
+
+    size = 0
+    stack = [obj]
+
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SKIP_TYPES):
+            continue
+
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        stack.extend(gc.get_referents(current))
+
+    return size
+
+
+def _subsystems(user_agents: core.UserAgents | None) -> dict[str, Any]:
+    """
+    Returns the objects retained by each subsystem. Subsystems listed
+    first own the objects they share with later ones.
+    """
+
+    pool = getattr(user_agents, "_pool", None)
+    regex_set = core._REGEX_SET or None
+    subsystems = {
+            "parsed_objects": pool._agents if pool is not None else None,
+            "memory_cache": getattr(user_agents, "_user_agents_cached", None),
+            "pool": pool,
+            "parse_templates": getattr(regex_set, "_templates", None),
+            "regex_set": regex_set,
+            }
+
+    for name, getter in _CACHES.items():
+        subsystems[name] = getter()
+
+    # The legacy parser of ua_parser is only loaded, if it was used.
+    parser = sys.modules.get("ua_parser.user_agent_parser")
+    builtins = (sys.modules.get("ua_parser_builtins.regexes")
+                or sys.modules.get("ua_parser._regexes"))
+    subsystems["ua_parser"] = [
+            getattr(parser, "_PARSE_CACHE", None),
+            getattr(builtins, "USER_AGENT_PARSERS", None),
+            getattr(builtins, "OS_PARSERS", None),
+            getattr(builtins, "DEVICE_PARSERS", None),
+            ]
+
+    return subsystems
+
+
+def memory_report(user_agents: core.UserAgents = None) -> dict[str, Any]:
+    """
+    Reports the bytes retained by each subsystem of the package.
+
+    :param user_agents: The UserAgents instance to inspect
+        (default=None -> the instance of the convenience functions).
+    :type user_agents: UserAgents
+    :return: The retained 'subsystems' bytes by name, their 'total' and
+        the number of 'parsed_records'.
+    :rtype: dict
+    """
+
+    if user_agents is None:
+        user_agents = core._DEFAULT_USER_AGENTS
+
+    subsystems = _subsystems(user_agents)
+    pool = subsystems["pool"]
+
+    seen = set()
+    sizes = {}
+    for name, objects in subsystems.items():
+        sizes[name] = 0 if objects is None else deep_sizeof(objects, seen)
+
+    return {
+            "subsystems": sizes,
+            "total": sum(sizes.values()),
+            "parsed_records": sum(
+                    len(agents) for agents in pool._agents.values()
+                    ) if pool is not None else 0,
+            }
+
+
+@contextlib.contextmanager
+def trace_memory(top: int = 10) -> Iterator[dict[str, Any]]:
+    """
+    Traces the allocations of the enclosed workload with tracemalloc.
+    The yielded dict is filled when the block exits.
+
+    :param top: The number of largest allocation sites (default=10).
+    :type top: int
+    :return: A dict with the 'net' and 'peak' bytes and the 'top'
+        allocation sites.
+    :rtype: dict
+    """
+
+    report = {}
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+
+    before = tracemalloc.take_snapshot()
+
+    # Python 3.8 can not reset the peak, it is measured from the start.
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+    current = tracemalloc.get_traced_memory()[0]
+
+    try:
+        yield report
+    finally:
+        # Read the counters first, the snapshot allocates memory itself.
+        now, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        if started:
+            tracemalloc.stop()
+
+        report["net"] = now - current
+        report["peak"] = peak - current
+        report["top"] = [
+                {
+                        "site": str(stat.traceback[0]),
+                        "size": stat.size_diff,
+                        "count": stat.count_diff,
+                        }
+                for stat in after.compare_to(before, "lineno")[:top]
+                ]
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+"""
+hashing.py: Stable hashing and consistent hash ring for user agents.
+
+This module contains a process independent 64-bit hash function and the
+HashRing class, which maps arbitrary keys (session ids, domains, ...) to
+a user agent of the pool. Every worker and process computes the same
+mapping without any coordination and most keys keep their user agent
+when the pool is refreshed.
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import bisect
+import hashlib
+from typing import Sequence
+
+# Average number of virtual nodes per user agent on the ring. More nodes
+# spread the keys more evenly, but cost memory and build time.
+_REPLICAS = 160
+
+
+def stable_hash64(value: str | bytes) -> int:
+    """
+    Returns a stable, unsigned 64-bit hash of the given value. Unlike
+    the builtin hash(), it does not depend on PYTHONHASHSEED and is the
+    same in every process and on every machine.
+
+    :param value: The string or bytes to hash.
+    :type value: str or bytes
+    :return: The 64-bit hash as int.
+    :rtype: int
+    """
+
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+
+    return int.from_bytes(
+            hashlib.blake2b(value, digest_size=8).digest(), "big"
+            )
+
+
+class HashRing:
+    """
+    A weighted consistent hash ring over a sequence of user agents.
+
+    Each user agent gets a number of virtual nodes proportional to its
+    usage weight. The positions of the virtual nodes only depend on the
+    user agent string, so a refreshed pool moves only the keys of the
+    user agents that were added, removed or re-weighted.
+    """
+
+    def __init__(
+            self,
+            nodes: Sequence[str],
+            weights: Sequence[float] | None = None,
+            replicas: int = _REPLICAS,
+            ) -> None:
+        """
+        Creates a new HashRing from the given nodes and their weights.
+
+        :param nodes: The user agent strings to place on the ring.
+        :type nodes: Sequence[str]
+        :param weights: The usage weights of the nodes (default=None,
+            all nodes are weighted equally).
+        :type weights: Sequence[float]
+        :param replicas: Average number of virtual nodes per node
+            (default=160).
+        :type replicas: int
+        :return: None
+        """
+
+        if weights is None:
+            weights = [1.0] * len(nodes)
+
+        if len(weights) != len(nodes):
+            raise ValueError(
+                    "Number of weights must match the number of nodes."
+                    )
+
+        self.nodes = tuple(nodes)
+
+        points = []
+        total = sum(w for w in weights if w > 0)
+        for index, (node, weight) in enumerate(zip(self.nodes, weights)):
+            if not node:
+                continue
+
+            # Every node gets at least one virtual node, so rare user
+            # agents are still reachable.
+            if total:
+                vnodes = max(1, round(weight / total * replicas * len(nodes)))
+            else:
+                vnodes = replicas
+
+            for replica in range(vnodes):
+                points.append((stable_hash64(f"{node}#{replica}"), index))
+
+        points.sort()
+        self._points = [point for point, _ in points]
+        self._indices = [index for _, index in points]
+
+    def __repr__(self) -> str:
+        """
+        Returns the HashRing instance as a short representation.
+        """
+
+        return (
+                f"{self.__class__.__name__}(nodes={len(self.nodes)}, "
+                f"vnodes={len(self._points)})"
+        )
+
+    def __len__(self) -> int:
+        """
+        Returns the number of virtual nodes on the ring.
+        """
+
+        return len(self._points)
+
+    def index(self, key: str | bytes) -> int:
+        """
+        Returns the index of the node the given key is assigned to in
+        O(log n) time.
+
+        :param key: The key to look up, e.g. a session id or domain.
+        :type key: str or bytes
+        :return: The index of the assigned node in `nodes`.
+        :rtype: int
+        """
+
+        if not self._points:
+            raise LookupError("Can not look up a key on an empty ring.")
+
+        pos = bisect.bisect(self._points, stable_hash64(key))
+        if pos == len(self._points):
+            pos = 0
+
+        return self._indices[pos]
+
+    def get(self, key: str | bytes) -> str:
+        """
+        Returns the node the given key is assigned to.
+
+        :param key: The key to look up, e.g. a session id or domain.
+        :type key: str or bytes
+        :return: The assigned user agent string.
+        :rtype: str
+        """
+
+        return self.nodes[self.index(key)]
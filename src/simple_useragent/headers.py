@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+
+"""
+headers.py: Consistent request header bundles for parsed user agents.
+
+A browser does not only send its user agent string, but a set of
+headers, which must match it: Chromium based browsers send the
+'Sec-CH-UA' client hints with the same versions and platform, and the
+'Accept', 'Accept-Encoding' and 'Accept-Language' values and the order
+of the headers differ between Chromium, Firefox and Safari. This module
+derives the complete, consistent header set of a parsed user agent once
+and returns it as read-only mapping, so it can be shared and sent
+without any per-request work.
+
+# Get a ready-to-send, usage weighted header bundle:
+import simple_useragent as sua
+requests.get(url, headers=sua.get_headers())
+
+# Or build the bundle of a single user agent:
+from simple_useragent import headers
+headers.build(sua.UserAgent('Mozilla/5.0 (Windows NT 10.0; ...'))
+>> {'Sec-CH-UA': '"Not_A Brand";v="8", "Chromium";v="120", "Google
+Chrome";v="120"', 'Sec-CH-UA-Mobile': '?0', ...}
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from .tokens import products
+
+if TYPE_CHECKING:
+    from .core import UserAgent
+
+DEFAULT_LANGUAGE = "en-US"
+
+# The brands of Chromium based browsers in the 'Sec-CH-UA' client hint.
+_BRANDS = {
+        "Chrome": "Google Chrome",
+        "Edge": "Microsoft Edge",
+        "Opera": "Opera",
+        "Samsung Browser": "Samsung Internet",
+        "Whale": "Whale",
+        }
+
+# The platforms of the 'Sec-CH-UA-Platform' client hint.
+_PLATFORMS = {
+        "Windows": "Windows",
+        "macOS": "macOS",
+        "Linux": "Linux",
+        "Android": "Android",
+        "Chrome OS": "Chrome OS",
+        }
+
+# Chromium sends the client hints by default since this major version.
+_CLIENT_HINTS = 89
+
+# The GREASE brand of Chromium, which is derived from its major version
+# (see GetGreasedUserAgentBrandVersion of Chromium).
+_GREASE_CHARS = (" ", "(", ":", "-", ".", "/", ")", ";", "=", "?", "_")
+_GREASE_VERSIONS = ("8", "99", "24")
+_GREASE_ORDERS = ((0, 1, 2), (0, 2, 1), (1, 0, 2), (1, 2, 0), (2, 0, 1),
+                  (2, 1, 0))
+
+_ACCEPT_CHROMIUM = (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,"
+        "image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;"
+        "q=0.7"
+)
+_ACCEPT_FIREFOX = (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,"
+        "image/webp,*/*;q=0.8"
+)
+_ACCEPT_DEFAULT = (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+)
+
+
+def _major(version: str | None) -> int | None:
+    """
+    Returns the major version of a product version, e.g. 120.
+    """
+
+    major = (version or "").split(".")[0]
+    return int(major) if major.isdigit() else None
+
+
+def client_hint_brands(chromium: int, brand: str = None,
+                       version: int = None) -> str:
+    """
+    Returns the 'Sec-CH-UA' value of a Chromium based browser: The
+    GREASE brand, Chromium and the browser brand in the order, which
+    Chromium derives from its major version.
+
+    :param chromium: The Chromium major version.
+    :type chromium: int
+    :param brand: The brand of the browser, e.g. 'Google Chrome'
+        (default=None -> only GREASE and Chromium).
+    :type brand: str
+    :param version: The major version of the browser (default=None ->
+        the Chromium version).
+    :type version: int
+    :return: The client hint value.
+    :rtype: str
+    """
+
+    order = _GREASE_ORDERS[chromium % len(_GREASE_ORDERS)]
+    grease = (
+            f"Not{_GREASE_CHARS[chromium % len(_GREASE_CHARS)]}A"
+            f"{_GREASE_CHARS[(chromium + 1) % len(_GREASE_CHARS)]}Brand"
+    )
+
+    # Sorted by position. Without a brand, the relative order is kept.
+    entries = [
+            (order[0], grease,
+             _GREASE_VERSIONS[chromium % len(_GREASE_VERSIONS)]),
+            (order[1], "Chromium", str(chromium)),
+            ]
+    if brand is not None:
+        entries.append((order[2], brand, str(version or chromium)))
+    entries.sort()
+
+    return ", ".join(f'"{name}";v="{value}"' for _, name, value in entries)
+
+
+def _languages(language: str, q: str) -> str:
+    """
+    Returns the 'Accept-Language' value of a language, e.g.
+    'en-US,en;q=0.9'.
+    """
+
+    primary = language.split("-")[0]
+    if primary == language:
+        return language
+
+    return f"{language},{primary};q={q}"
+
+
+def build(agent: UserAgent,
+          language: str = DEFAULT_LANGUAGE) -> MappingProxyType[str, str]:
+    """
+    Builds the consistent request headers of a top-level navigation of
+    the browser of a parsed user agent, in the order the browser sends
+    them. The rendering engine decides the header set: Blink (with the
+    client hints since Chromium 89), Gecko, WebKit or a minimal set for
+    other clients.
+
+    :param agent: The parsed user agent.
+    :type agent: UserAgent
+    :param language: The preferred language, e.g. 'de-DE'
+        (default='en-US').
+    :type language: str
+    :return: The read-only headers.
+    :rtype: MappingProxyType[str, str]
+    """
+
+    engine = agent.engine
+    versions = products(agent.tokens)
+    major = agent.browser_version_tuple[0] \
+        if agent.browser_version_tuple else None
+
+    if engine == "Blink":
+        chromium = _major(versions.get("Chrome")) or major or 0
+        headers = {}
+        if chromium >= _CLIENT_HINTS:
+            brand = _BRANDS.get(agent.browser)
+            platform = _PLATFORMS.get(agent.os, "Unknown")
+            headers = {
+                    "Sec-CH-UA": client_hint_brands(chromium, brand, major),
+                    "Sec-CH-UA-Mobile": "?1" if agent.mobile else "?0",
+                    "Sec-CH-UA-Platform": f'"{platform}"',
+                    }
+        headers.update({
+                "Upgrade-Insecure-Requests": "1",
+                "User-Agent": agent.string,
+                "Accept": _ACCEPT_CHROMIUM,
+                "Sec-Fetch-Site": "none",
+                "Sec-Fetch-Mode": "navigate",
+                "Sec-Fetch-User": "?1",
+                "Sec-Fetch-Dest": "document",
+                "Accept-Encoding": "gzip, deflate, br, zstd"
+                if chromium >= 123 else "gzip, deflate, br",
+                "Accept-Language": _languages(language, "0.9"),
+                })
+
+    elif engine == "Gecko":
+        firefox = _major(versions.get("Firefox")) or major or 0
+        headers = {
+                "User-Agent": agent.string,
+                "Accept": _ACCEPT_DEFAULT
+                if firefox >= 128 else _ACCEPT_FIREFOX,
+                "Accept-Language": _languages(language, "0.5"),
+                "Accept-Encoding": "gzip, deflate, br, zstd"
+                if firefox >= 126 else "gzip, deflate, br",
+                "Upgrade-Insecure-Requests": "1",
+                "Sec-Fetch-Dest": "document",
+                "Sec-Fetch-Mode": "navigate",
+                "Sec-Fetch-Site": "none",
+                "Sec-Fetch-User": "?1",
+                }
+
+    elif engine == "WebKit":
+        headers = {
+                "Accept": _ACCEPT_DEFAULT,
+                "Sec-Fetch-Site": "none",
+                "Sec-Fetch-Dest": "document",
+                "Accept-Language": language,
+                "Sec-Fetch-Mode": "navigate",
+                "User-Agent": agent.string,
+                "Accept-Encoding": "gzip, deflate, br",
+                }
+
+    else:
+        headers = {
+                "User-Agent": agent.string,
+                "Accept": _ACCEPT_DEFAULT,
+                "Accept-Language": _languages(language, "0.9"),
+                "Accept-Encoding": "gzip, deflate, br",
+                }
+
+    return MappingProxyType(headers)
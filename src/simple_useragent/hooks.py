@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+"""
+hooks.py: Lifecycle event hooks of the simple-useragent package.
+
+This module contains a registry for callbacks, which are called on the
+lifecycle events of fetching, caching and parsing user agents. Every
+callback receives a single dict with the event name and its structured
+payload (timings, status codes, cache tier, ...). This allows tracing
+(e.g. OpenTelemetry) or profiling without patching private methods. If
+no callback is registered, emitting an event costs a single attribute
+check.
+
+# Trace all requests to 'useragents.me':
+import simple_useragent as sua
+
+@sua.HOOKS.register("on_fetch_end")
+def trace(payload):
+    print(payload["url"], payload["status"], payload["duration"])
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import logging
+import threading
+from typing import Any, Callable
+
+# Logging.
+LOGGER = logging.getLogger(__name__)
+
+# Supported events and the keys of their payloads.
+EVENTS = {
+        "on_refresh_start": (),
+        "on_refresh_end": ("duration", "success"),
+        "on_fetch_start": ("url", "attempt", "max_retries"),
+        "on_fetch_end": ("url", "attempt", "status", "duration", "error"),
+        "on_retry": ("url", "attempt", "delay", "reason"),
+        "on_rate_limit": ("url", "attempt"),
+        "on_cache_hit": ("tier",),
+        "on_fallback": ("tier",),
+        "on_parse": ("string", "duration"),
+        }
+
+
+class HookRegistry:
+    """
+    A thread-safe registry of callbacks for the lifecycle events.
+
+    :var active: True if at least one callback is registered. Callers
+        check it before building payloads or measuring timings.
+    :type active: bool
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new, empty HookRegistry.
+
+        :return: None
+        """
+
+        self.active = False
+        self._lock = threading.Lock()
+        self._hooks = {}
+
+    def __repr__(self) -> str:
+        """
+        Returns the HookRegistry instance as a representation.
+        """
+
+        events = sorted(event for event in self._hooks if self._hooks[event])
+        return f"{self.__class__.__name__}(events={events})"
+
+    def register(
+            self,
+            event: str,
+            callback: Callable[[dict[str, Any]], Any] = None,
+            ) -> Callable:
+        """
+        Registers a callback for an event. Can also be used as decorator
+        by omitting the callback.
+
+        :param event: The event name, e.g. 'on_fetch_end'.
+        :type event: str
+        :param callback: The callable, which receives the payload dict.
+        :type callback: Callable
+        :return: The registered callback.
+        :rtype: Callable
+        """
+
+        if event not in EVENTS:
+            raise ValueError(
+                    f"Unknown event '{event}'. Supported events: "
+                    f"{', '.join(EVENTS)}."
+                    )
+
+        if callback is None:
+            return lambda func: self.register(event, func)
+
+        if not callable(callback):
+            raise TypeError("Callback must be callable.")
+
+        # Copy on write, so emitting never needs the lock.
+        with self._lock:
+            self._hooks[event] = self._hooks.get(event, ()) + (callback,)
+            self.active = True
+
+        return callback
+
+    def unregister(
+            self,
+            event: str,
+            callback: Callable[[dict[str, Any]], Any],
+            missing_ok: bool = False,
+            ) -> None:
+        """
+        Removes a registered callback of an event.
+
+        :param event: The event name, e.g. 'on_fetch_end'.
+        :type event: str
+        :param callback: The registered callable.
+        :type callback: Callable
+        :param missing_ok: If True, a callback, which is not registered
+            (e.g. after clear()), is ignored (default=False).
+        :type missing_ok: bool
+        :return: None
+        :raises ValueError: If the callback is not registered and
+            missing_ok is False.
+        """
+
+        with self._lock:
+            callbacks = self._hooks.get(event, ())
+            if callback not in callbacks:
+                if missing_ok:
+                    return
+                raise ValueError(
+                        f"Callback is not registered for event '{event}'."
+                        )
+
+            index = callbacks.index(callback)
+            self._hooks[event] = callbacks[:index] + callbacks[index + 1:]
+            self.active = any(self._hooks.values())
+
+    def clear(self) -> None:
+        """
+        Removes all registered callbacks.
+
+        :return: None
+        """
+
+        with self._lock:
+            self._hooks.clear()
+            self.active = False
+
+    def emit(self, event: str, **payload: Any) -> None:
+        """
+        Calls all callbacks of an event with the payload. Exceptions of
+        callbacks are logged and never interrupt the package.
+
+        :param event: The event name, e.g. 'on_fetch_end'.
+        :type event: str
+        :param payload: The payload of the event.
+        :type payload: Any
+        :return: None
+        """
+
+        callbacks = self._hooks.get(event)
+        if not callbacks:
+            return
+
+        payload["event"] = event
+        for callback in callbacks:
+            try:
+                callback(payload)
+            except Exception as e:
+                LOGGER.warning(
+                        "Hook %r for event '%s' raised an exception: %s: %s",
+                        callback, event, e.__class__.__name__, e
+                        )
+
+
+# Registry used by the package.
+HOOKS = HookRegistry()
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+
+"""
+metrics.py: Built-in metrics of the simple-useragent package.
+
+This module contains a small, dependency free metrics registry, which
+counts the cache tier hits, the fetch attempts, retries and rate limits
+of 'useragents.me', and records refresh and parse latencies. The
+registry subscribes to the lifecycle hooks of the package, if enabled.
+Metrics are disabled by default and cost nothing then. They can be
+exported as a snapshot dict or in the Prometheus text format.
+
+# Enable the metrics and export them:
+import simple_useragent as sua
+sua.METRICS.enable()
+sua.get_list()
+sua.METRICS.snapshot()
+>> {'counters': {'simple_useragent_cache_hits_total': [...]}, ...}
+print(sua.METRICS.to_prometheus())
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import bisect
+import math
+import os
+import threading
+
+from .hooks import HOOKS, HookRegistry
+
+# Upper bounds of the latency histogram buckets in seconds, covering
+# parsing (microseconds) up to fetching (seconds).
+_BUCKETS = (
+        0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+        0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, math.inf,
+        )
+
+# Help texts of the metrics recorded by the package.
+_HELP = {
+        "simple_useragent_cache_hits_total":
+            "User agent requests answered per cache tier.",
+        "simple_useragent_fetch_attempts_total":
+            "Requests sent to 'useragents.me'.",
+        "simple_useragent_fetch_retries_total":
+            "Failed requests to 'useragents.me', which were retried.",
+        "simple_useragent_fetch_rate_limited_total":
+            "Requests to 'useragents.me' answered with status 429.",
+        "simple_useragent_fetch_duration_seconds":
+            "Duration of single requests to 'useragents.me'.",
+        "simple_useragent_refresh_duration_seconds":
+            "Duration of refreshing the user agents from 'useragents.me'.",
+        "simple_useragent_parse_total":
+            "User agent strings parsed.",
+        "simple_useragent_parse_duration_seconds":
+            "Duration of parsing a single user agent string.",
+        }
+
+
+class MetricsRegistry:
+    """
+    A thread-safe registry of counters and latency histograms.
+
+    :var enabled: If False, nothing is recorded (default=False, or
+        True if the environment variable SIMPLE_USERAGENT_METRICS is
+        set to '1').
+    :type enabled: bool
+    """
+
+    def __init__(
+            self,
+            enabled: bool = False,
+            hooks: HookRegistry = HOOKS,
+            ) -> None:
+        """
+        Creates a new, empty MetricsRegistry.
+
+        :param enabled: Records metrics if True (default=False).
+        :type enabled: bool
+        :param hooks: The hooks to record the package metrics from
+            (default=HOOKS).
+        :type hooks: HookRegistry
+        :return: None
+        """
+
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._hooks = hooks
+        self._handlers = {
+                "on_refresh_end": self._on_refresh_end,
+                "on_fetch_start": self._on_fetch_start,
+                "on_fetch_end": self._on_fetch_end,
+                "on_retry": self._on_retry,
+                "on_rate_limit": self._on_rate_limit,
+                "on_cache_hit": self._on_cache_hit,
+                "on_fallback": self._on_cache_hit,
+                "on_parse": self._on_parse,
+                }
+
+        if enabled:
+            self.enable()
+
+    def __repr__(self) -> str:
+        """
+        Returns the MetricsRegistry instance as a representation.
+        """
+
+        return f"{self.__class__.__name__}(enabled={self.enabled!r})"
+
+    def enable(self) -> None:
+        """
+        Starts recording metrics. Handlers, which were removed from the
+        hook registry (e.g. by HOOKS.clear()), are registered again, so
+        every handler is registered exactly once.
+
+        :return: None
+        """
+
+        self.enabled = True
+        for event, handler in self._handlers.items():
+            self._hooks.unregister(event, handler, missing_ok=True)
+            self._hooks.register(event, handler)
+
+    def disable(self) -> None:
+        """
+        Stops recording metrics. Recorded values are kept. Handlers,
+        which are not registered anymore, are skipped.
+
+        :return: None
+        """
+
+        if not self.enabled:
+            return
+
+        self.enabled = False
+        for event, handler in self._handlers.items():
+            self._hooks.unregister(event, handler, missing_ok=True)
+
+    def reset(self) -> None:
+        """
+        Deletes all recorded values.
+
+        :return: None
+        """
+
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        """
+        Increments a counter.
+
+        :param name: The name of the counter.
+        :type name: str
+        :param value: The value to add (default=1).
+        :type value: float
+        :param labels: The labels of the counter, e.g. tier='memory'.
+        :type labels: str
+        :return: None
+        """
+
+        if not self.enabled:
+            return
+
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """
+        Records a value (e.g. a duration in seconds) in a histogram.
+
+        :param name: The name of the histogram.
+        :type name: str
+        :param value: The value to record.
+        :type value: float
+        :param labels: The labels of the histogram.
+        :type labels: str
+        :return: None
+        """
+
+        if not self.enabled:
+            return
+
+        key = (name, tuple(sorted(labels.items())))
+        pos = bisect.bisect_left(_BUCKETS, value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * len(_BUCKETS), 0.0]
+
+            histogram[0][pos] += 1
+            histogram[1] += value
+
+    def snapshot(self) -> dict[str, dict[str, list[dict]]]:
+        """
+        Returns a JSON serializable copy of all recorded values.
+
+        :return: A dict with the 'counters' and 'histograms' by name.
+        :rtype: dict
+        """
+
+        counters = {}
+        histograms = {}
+
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                counters.setdefault(name, []).append(
+                        {"labels": dict(labels), "value": value}
+                        )
+
+            for (name, labels), (counts, total) in sorted(
+                    self._histograms.items()
+                    ):
+                histograms.setdefault(name, []).append(
+                        {
+                                "labels": dict(labels),
+                                "count": sum(counts),
+                                "sum": total,
+                                "buckets": {
+                                        _format_le(le): count
+                                        for le, count in zip(_BUCKETS, counts)
+                                        },
+                                }
+                        )
+
+        return {"counters": counters, "histograms": histograms}
+
+    def to_prometheus(self) -> str:
+        """
+        Returns all recorded values in the Prometheus text exposition
+        format.
+
+        :return: The metrics as Prometheus text.
+        :rtype: str
+        """
+
+        snapshot = self.snapshot()
+        lines = []
+
+        for name, series in snapshot["counters"].items():
+            lines.extend(_header(name, "counter"))
+            for entry in series:
+                lines.append(
+                        f"{name}{_format_labels(entry['labels'])} "
+                        f"{_format_value(entry['value'])}"
+                        )
+
+        for name, series in snapshot["histograms"].items():
+            lines.extend(_header(name, "histogram"))
+            for entry in series:
+                cumulative = 0
+                for le, count in entry["buckets"].items():
+                    cumulative += count
+                    labels = _format_labels({**entry["labels"], "le": le})
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+
+                labels = _format_labels(entry["labels"])
+                lines.append(
+                        f"{name}_sum{labels} {_format_value(entry['sum'])}"
+                        )
+                lines.append(f"{name}_count{labels} {entry['count']}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _on_refresh_end(self, payload: dict) -> None:
+        """
+        Records the duration and result of a refresh.
+        """
+
+        self.observe(
+                "simple_useragent_refresh_duration_seconds",
+                payload["duration"],
+                success=str(payload["success"]).lower(),
+                )
+
+    def _on_fetch_start(self, payload: dict) -> None:
+        """
+        Counts a request to 'useragents.me' (or the sidecar).
+        """
+
+        self.inc("simple_useragent_fetch_attempts_total")
+
+    def _on_fetch_end(self, payload: dict) -> None:
+        """
+        Records the duration of a request by status code.
+        """
+
+        status = payload["status"]
+        self.observe(
+                "simple_useragent_fetch_duration_seconds",
+                payload["duration"],
+                status="error" if status is None else str(status),
+                )
+
+    def _on_retry(self, payload: dict) -> None:
+        """
+        Counts a retried request.
+        """
+
+        self.inc("simple_useragent_fetch_retries_total")
+
+    def _on_rate_limit(self, payload: dict) -> None:
+        """
+        Counts a rate limited request.
+        """
+
+        self.inc("simple_useragent_fetch_rate_limited_total")
+
+    def _on_cache_hit(self, payload: dict) -> None:
+        """
+        Counts the cache tier (or fallback), which answered get_dict.
+        """
+
+        self.inc("simple_useragent_cache_hits_total", tier=payload["tier"])
+
+    def _on_parse(self, payload: dict) -> None:
+        """
+        Counts a parse and records its duration.
+        """
+
+        self.inc("simple_useragent_parse_total")
+        self.observe(
+                "simple_useragent_parse_duration_seconds", payload["duration"]
+                )
+
+
+def _header(name: str, kind: str) -> list[str]:
+    """
+    Returns the Prometheus HELP and TYPE lines of a metric.
+    """
+
+    return [
+            f"# HELP {name} {_HELP.get(name, name)}",
+            f"# TYPE {name} {kind}",
+            ]
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    """
+    Returns the labels in the Prometheus format, e.g. '{tier="api"}'.
+    """
+
+    if not labels:
+        return ""
+
+    escaped = []
+    for key, value in labels.items():
+        value = (
+                str(value)
+                .replace("\\", "\\\\")
+                .replace('"', '\\"')
+                .replace("\n", "\\n")
+        )
+        escaped.append(f'{key}="{value}"')
+
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_le(value: float) -> str:
+    """
+    Returns the upper bound of a histogram bucket as label value.
+    """
+
+    return "+Inf" if math.isinf(value) else repr(value)
+
+
+def _format_value(value: float) -> str:
+    """
+    Returns a sample value without a trailing '.0' for integers.
+    """
+
+    if float(value).is_integer():
+        return str(int(value))
+
+    return repr(float(value))
+
+
+# Registry used by the package (disabled by default).
+METRICS = MetricsRegistry(
+        enabled=os.environ.get("SIMPLE_USERAGENT_METRICS") == "1"
+        )
@@ -0,0 +1,903 @@
+#!/usr/bin/env python3
+
+"""
+regexes.py: Persisted, lazily compiled regex set of ua_parser.
+
+Importing ua_parser compiles its whole regex list (~650 browser and OS
+patterns), which every new process pays before its first parse. This
+module instead prepares the ordered patterns, their replacement
+templates and a literal prefilter per pattern once. With a cache
+location (the one of UserAgents, see RegexSet.persist), they are
+persisted in a versioned JSON file, which loads quickly. Superseded
+versions of the file are removed.
+A pattern is only compiled, if its literal occurs in a parsed string,
+so a process, which only sees Chrome strings, never compiles the rest.
+
+Parse results are cached per template, the string with its digit runs
+replaced, so new browser and OS versions of a known user agent reuse
+the matching rules. A hit only reruns the matching rule, to extract the
+concrete versions, and the few rules before it, whose result depends on
+the digit values (e.g. 'Windows NT 6\\.1'). The results match the
+'user_agent' and 'os' parts of ua_parser.user_agent_parser.Parse.
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import ast
+import importlib.util
+import json
+import logging
+import os
+import pathlib
+import re
+import threading
+from typing import Any
+
+# Logging.
+LOGGER = logging.getLogger(__name__)
+
+# Version of the persisted format. Increment on every change of it.
+FORMAT_VERSION = 2
+
+# Modules of the regex sources (ua-parser>=1.0 and older versions).
+_SOURCES = ("ua_parser_builtins.regexes", "ua_parser._regexes")
+
+_REPLACE_PATTERN = re.compile(r"\$(\d)")
+
+# Digit runs of the parse templates, the maximal number of templates and
+# of entries per template (e.g. for 'Windows NT 6.1' and '10.0').
+_DIGITS = "0123456789"
+_DIGITS_PATTERN = re.compile(r"[0-9]+")
+_DIGIT_PATTERN = re.compile(r"[0-9]")
+_TEMPLATE_CACHE_SIZE = 20000
+_TEMPLATE_ENTRIES = 4
+
+
+def _source_path() -> pathlib.Path | None:
+    """
+    Returns the path of the generated regex module of ua_parser without
+    importing (and compiling) it.
+
+    :return: The path of the module or None, if it was not found.
+    :rtype: pathlib.Path or None
+    """
+
+    for name in _SOURCES:
+        try:
+            spec = importlib.util.find_spec(name)
+        except ImportError:
+            continue
+
+        if spec is not None and spec.origin:
+            return pathlib.Path(spec.origin)
+
+    return None
+
+
+def _sre() -> tuple:
+    """
+    Returns the regex parser, constants and compiler modules of the
+    standard library, which were renamed in Python 3.11.
+    """
+
+    try:
+        from re import _compiler as sre_compile
+        from re import _parser as sre_parse
+        from re import _constants as sre_constants
+    except ImportError:
+        import sre_compile
+        import sre_constants
+        import sre_parse
+
+    return sre_parse, sre_constants, sre_compile
+
+
+def _literal(pattern: str) -> str:
+    """
+    Returns the longest literal, which every match of the pattern must
+    contain, or an empty string if there is none. Only the top-level
+    sequence and plain groups are considered, so the result is always
+    safe to use as prefilter.
+
+    :param pattern: The regular expression.
+    :type pattern: str
+    :return: The required literal.
+    :rtype: str
+    """
+
+    sre_parse, sre_constants, _ = _sre()
+
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return ""
+
+    if parsed.state.flags & (re.IGNORECASE | re.VERBOSE):
+        return ""
+
+    best = ""
+    run = []
+
+    def flush() -> None:
+        nonlocal best
+        if len(run) > len(best):
+            best = "".join(run)
+        run.clear()
+
+    def walk(items) -> None:
+        for op, av in items:
+            if op is sre_constants.LITERAL:
+                run.append(chr(av))
+            elif op is sre_constants.AT:
+                continue
+            elif (op is sre_constants.SUBPATTERN
+                  and not av[1] and not av[2]):
+                walk(av[3])
+            else:
+                flush()
+
+    walk(parsed)
+    flush()
+
+    return best
+
+
+def _digit_kind(op, av, c) -> str | None:
+    """
+    Returns, which digits a single character item of a parsed pattern
+    matches: 'all', 'none' or 'some', or None for other items.
+    """
+
+    if op is c.LITERAL:
+        return "some" if chr(av) in _DIGITS else "none"
+    if op is c.NOT_LITERAL:
+        return "some" if chr(av) in _DIGITS else "all"
+    if op is c.ANY:
+        return "all"
+    if op is not c.IN:
+        return None
+
+    def in_set(code: int) -> bool | None:
+        negate = hit = False
+        for item_op, item_av in av:
+            if item_op is c.NEGATE:
+                negate = True
+            elif item_op is c.LITERAL:
+                hit |= item_av == code
+            elif item_op is c.RANGE:
+                hit |= item_av[0] <= code <= item_av[1]
+            elif item_op is c.CATEGORY and item_av in (
+                    c.CATEGORY_DIGIT, c.CATEGORY_WORD,
+                    c.CATEGORY_NOT_SPACE, c.CATEGORY_NOT_LINEBREAK,
+                    ):
+                hit = True
+            elif not (item_op is c.CATEGORY and item_av in (
+                    c.CATEGORY_NOT_DIGIT, c.CATEGORY_NOT_WORD,
+                    c.CATEGORY_SPACE, c.CATEGORY_LINEBREAK,
+                    )):
+                return None
+
+        return hit != negate
+
+    hits = {in_set(ord(digit)) for digit in _DIGITS}
+    if hits == {True}:
+        return "all"
+    if hits == {False}:
+        return "none"
+
+    return "some"
+
+
+def _uniform(pattern: str) -> int:
+    """
+    Returns, how far the matches of the pattern are independent of the
+    digits of a string: 2, if it matches two strings, which only differ
+    in the values and lengths of their digit runs, either both or none.
+    This holds, if digits are only matched by unbounded repeats of
+    character classes, which contain all or none of the digits, and no
+    digit run must be shared by two repeats. 1, if this only holds for
+    digit runs of the same lengths, and 0 otherwise. Unsupported
+    constructs are never independent.
+
+    :param pattern: The regular expression.
+    :type pattern: str
+    :return: 2 for independent of the digit values and lengths, 1 for
+        only of the values, 0 for dependent.
+    :rtype: int
+    """
+
+    sre_parse, c, _ = _sre()
+
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return 0
+
+    def alike(items) -> bool:
+        # Whether all items treat all digits alike.
+        for op, av in items:
+            kind = _digit_kind(op, av, c)
+            if kind is not None:
+                if kind == "some":
+                    return False
+            elif op in (c.MAX_REPEAT, c.MIN_REPEAT):
+                if not alike(av[2]):
+                    return False
+            elif op is c.SUBPATTERN:
+                if not alike(av[-1]):
+                    return False
+            elif op is c.BRANCH:
+                if not all(alike(branch) for branch in av[1]):
+                    return False
+            elif op in (c.ASSERT, c.ASSERT_NOT):
+                if not alike(av[1]):
+                    return False
+            elif op is not c.AT:
+                return False
+
+        return True
+
+    def touches(items) -> bool:
+        # Whether any item of a subpattern can match a digit.
+        for op, av in items:
+            kind = _digit_kind(op, av, c)
+            if kind is not None:
+                if kind != "none":
+                    return True
+            elif op in (c.MAX_REPEAT, c.MIN_REPEAT):
+                if touches(av[2]):
+                    return True
+            elif op is c.SUBPATTERN:
+                if touches(av[-1]):
+                    return True
+            elif op is c.BRANCH:
+                if any(touches(branch) for branch in av[1]):
+                    return True
+            elif op in (c.ASSERT, c.ASSERT_NOT):
+                if touches(av[1]):
+                    return True
+            elif op is not c.AT:
+                return True
+
+        return False
+
+    # Whether a repeat, which needs at least one digit, was seen since
+    # the last item, which needs a character, but no digit.
+    pending = False
+
+    def walk(items) -> bool:
+        nonlocal pending
+        for op, av in items:
+            kind = _digit_kind(op, av, c)
+            if kind == "none":
+                pending = False
+            elif kind is not None:
+                return False
+            elif op in (c.MAX_REPEAT, c.MIN_REPEAT):
+                low, high, body = av
+                kind = _digit_kind(*body[0], c) if len(body) == 1 else None
+                if kind in ("all", "some"):
+                    if kind == "some" or high != c.MAXREPEAT or low > 1:
+                        return False
+                    if low:
+                        if pending:
+                            return False
+                        pending = True
+                elif touches(body):
+                    return False
+            elif op is c.SUBPATTERN:
+                if not walk(av[-1]):
+                    return False
+            elif op is c.AT:
+                if av is c.AT_NON_BOUNDARY:
+                    return False
+            elif op is c.BRANCH:
+                if any(touches(branch) for branch in av[1]):
+                    return False
+            elif op in (c.ASSERT, c.ASSERT_NOT):
+                if touches(av[1]):
+                    return False
+            else:
+                return False
+
+        return True
+
+    if not alike(parsed):
+        return 0
+
+    return 2 if walk(parsed) else 1
+
+
+def _widened(pattern: str) -> re.Pattern | None:
+    """
+    Compiles the pattern with every digit literal and character class,
+    which contains some digits, widened to all digits. The widened
+    pattern matches a superset and treats all digits alike, so if it
+    does not match a string, the pattern matches no string with other
+    digits of the same lengths either.
+
+    :param pattern: The regular expression.
+    :type pattern: str
+    :return: The widened pattern or None, if it can not be widened.
+    :rtype: re.Pattern or None
+    """
+
+    sre_parse, c, sre_compile = _sre()
+    digit = (c.IN, [(c.CATEGORY, c.CATEGORY_DIGIT)])
+
+    def widen(items) -> bool:
+        for pos, (op, av) in enumerate(items):
+            if op is c.LITERAL:
+                if chr(av) in _DIGITS:
+                    items[pos] = digit
+            elif op is c.NOT_LITERAL:
+                if chr(av) in _DIGITS:
+                    items[pos] = (c.IN, [(c.CATEGORY, c.CATEGORY_DIGIT),
+                                         (c.CATEGORY, c.CATEGORY_NOT_DIGIT)])
+            elif op is c.IN:
+                if _digit_kind(op, av, c) == "some":
+                    if av and av[0][0] is c.NEGATE:
+                        return False
+                    items[pos] = (c.IN, digit[1] + list(av))
+            elif op in (c.MAX_REPEAT, c.MIN_REPEAT):
+                if not widen(av[2]):
+                    return False
+            elif op is c.SUBPATTERN:
+                if not widen(av[-1]):
+                    return False
+            elif op is c.BRANCH:
+                if not all(widen(branch) for branch in av[1]):
+                    return False
+            elif op in (c.ASSERT, c.ASSERT_NOT):
+                if not widen(av[1]):
+                    return False
+            elif op not in (c.ANY, c.AT):
+                return False
+
+        return True
+
+    try:
+        parsed = sre_parse.parse(pattern)
+        return sre_compile.compile(parsed) if widen(parsed) else None
+    except Exception:
+        return None
+
+
+def _build(path: pathlib.Path) -> dict[str, Any]:
+    """
+    Prepares the browser and OS rules from the source module of
+    ua_parser, without importing it.
+
+    :param path: The path of the source module.
+    :type path: pathlib.Path
+    :return: The ordered rules as [pattern, literal, *replacements,
+        uniform].
+    :rtype: dict
+    """
+
+    with open(path, "r", encoding="utf-8") as fh:
+        tree = ast.parse(fh.read())
+
+    rules = {"USER_AGENT_PARSERS": [], "OS_PARSERS": []}
+    for node in tree.body:
+        if (
+                not isinstance(node, ast.Assign)
+                or len(node.targets) != 1
+                or not isinstance(node.targets[0], ast.Name)
+                or node.targets[0].id not in rules
+        ):
+            continue
+
+        for call in node.value.elts:
+            args = [ast.literal_eval(arg) for arg in call.args]
+            rules[node.targets[0].id].append(
+                    [args[0], _literal(args[0])] + args[1:]
+                    )
+
+    if not rules["USER_AGENT_PARSERS"] or not rules["OS_PARSERS"]:
+        raise ValueError(f"No rules found in '{path}'.")
+
+    return {
+            "user_agent": [(rule + [None] * 5)[:5] + [_uniform(rule[0])]
+                           for rule in rules["USER_AGENT_PARSERS"]],
+            "os": [(rule + [None] * 7)[:7] + [_uniform(rule[0])]
+                   for rule in rules["OS_PARSERS"]],
+            }
+
+
+def _multi_replace(template: str, match: re.Match) -> str | None:
+    """
+    Fills the $1 to $9 placeholders of a template with the groups of a
+    match, like ua_parser does for OS replacements.
+    """
+
+    groups = match.groups()
+
+    def repl(m: re.Match) -> str:
+        index = int(m[1]) - 1
+        return groups[index] if index < len(groups) else ""
+
+    return _REPLACE_PATTERN.sub(repl, template).strip() or None
+
+
+def _user_agent_values(rule: list, match: re.Match) -> tuple | None:
+    """
+    Returns the family and versions of a matching browser rule, or None
+    if it yields no family, like ua_parser.
+    """
+
+    family_repl, v1_repl, v2_repl = rule[2:5]
+
+    if family_repl:
+        if "$1" in family_repl:
+            family = re.sub(r"\$1", match[1], family_repl)
+        else:
+            family = family_repl
+    else:
+        family = match[1]
+
+    if not family:
+        return None
+
+    last = match.lastindex or 0
+    return (
+            family,
+            v1_repl or (match[2] or None if last >= 2 else None),
+            v2_repl or (match[3] or None if last >= 3 else None),
+            match[4] or None if last >= 4 else None,
+            )
+
+
+def _os_values(rule: list, match: re.Match) -> list | None:
+    """
+    Returns the family and versions of a matching OS rule, or None if it
+    yields no family, like ua_parser.
+    """
+
+    values = [None] * 5
+    last = match.lastindex or 0
+
+    for pos, replacement in enumerate(rule[2:7]):
+        if replacement:
+            values[pos] = _multi_replace(replacement, match)
+        elif pos == 0:
+            values[pos] = match[1] if last else None
+        else:
+            values[pos] = match[pos + 1] if last >= pos + 1 else None
+
+    return values if values[0] else None
+
+
+def _user_agent_dict(values: tuple | None) -> dict[str, str | None]:
+    family, v1, v2, v3 = values or (None,) * 4
+
+    return {
+            "family": family or "Other",
+            "major": v1 or None,
+            "minor": v2 or None,
+            "patch": v3 or None,
+            }
+
+
+def _os_dict(values: list | None) -> dict[str, str | None]:
+    values = values or [None] * 5
+
+    return {
+            "family": values[0] or "Other",
+            "major": values[1],
+            "minor": values[2],
+            "patch": values[3],
+            "patch_minor": values[4],
+            }
+
+
+_VALUES = {"user_agent": _user_agent_values, "os": _os_values}
+
+# Marks a template hit, which needs a full scan.
+_MISS = object()
+
+
+class RegexSet:
+    """
+    The ordered browser and OS rules of ua_parser with literal
+    prefilters. Patterns are compiled on first use.
+    """
+
+    def __init__(self, cache_location: str = None) -> None:
+        """
+        Creates a new RegexSet. The rules are loaded from the persisted
+        file in cache_location or prepared and persisted on first parse.
+
+        :param cache_location: Folder to persist the prepared rules in
+            (default=None -> in memory only).
+        :type cache_location: str
+        :return: None
+        """
+
+        self.cache_location = cache_location
+        self._lock = threading.Lock()
+        self._user_agent = None
+        self._os = None
+        self._compiled = {}
+
+        # Matching rules per template of the parsed strings.
+        self._templates = {}
+        self._widened_patterns = {}
+        self.template_hits = 0
+        self.template_misses = 0
+
+    def __repr__(self) -> str:
+        """
+        Returns the RegexSet instance as a representation.
+        """
+
+        return (
+                f"{self.__class__.__name__}"
+                f"(cache_location={self.cache_location!r})"
+        )
+
+    @property
+    def compiled(self) -> int:
+        """
+        Returns the number of patterns compiled so far.
+        """
+
+        return len(self._compiled)
+
+    def _cache_file(self) -> pathlib.Path | None:
+        if self.cache_location is None:
+            return None
+
+        return pathlib.Path(
+                self.cache_location, f"ua_regexes-v{FORMAT_VERSION}.json"
+                )
+
+    @staticmethod
+    def _source() -> tuple[pathlib.Path, dict[str, Any]]:
+        """
+        Returns the path of the regex module of ua_parser and its stamp,
+        which invalidates the persisted rules on an update.
+        """
+
+        path = _source_path()
+        if path is None:
+            raise ImportError("Could not find the regexes of 'ua_parser'.")
+
+        stat = path.stat()
+        return path, {"path": str(path), "size": stat.st_size,
+                      "mtime": stat.st_mtime_ns}
+
+    def _load(self) -> None:
+        """
+        Loads the persisted rules, if they are still valid for the
+        installed ua_parser, or prepares and persists them.
+
+        :return: None
+        """
+
+        path, source = self._source()
+        cache_file = self._cache_file()
+
+        if cache_file is not None:
+            try:
+                with open(cache_file, "r", encoding="utf-8") as fh:
+                    data = json.load(fh)
+
+                if (
+                        data.get("format") == FORMAT_VERSION
+                        and data.get("source") == source
+                ):
+                    self._user_agent = data["user_agent"]
+                    self._os = data["os"]
+                    return
+
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                LOGGER.debug(
+                        "Could not load persisted regexes: %s: %s",
+                        e.__class__.__name__, e
+                        )
+
+        data = _build(path)
+        self._user_agent = data["user_agent"]
+        self._os = data["os"]
+
+        if cache_file is not None:
+            self._save(cache_file, source)
+
+    def _save(self, cache_file: pathlib.Path, source: dict[str, Any]) -> None:
+        """
+        Persists the prepared rules and removes the files of superseded
+        format versions. Errors are only logged, as the rules work in
+        memory as well.
+
+        :param cache_file: The file to persist the rules to.
+        :type cache_file: pathlib.Path
+        :param source: The stamp of the regex module of ua_parser.
+        :type source: dict
+        :return: None
+        """
+
+        data = {"format": FORMAT_VERSION, "source": source,
+                "user_agent": self._user_agent, "os": self._os}
+        tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+
+        # Write to a temporary file first, so concurrent processes never
+        # read a partial file.
+        try:
+            try:
+                with open(tmp, "w", encoding="utf-8") as fh:
+                    json.dump(data, fh)
+                os.replace(tmp, cache_file)
+            finally:
+                tmp.unlink(missing_ok=True)
+
+            for old in cache_file.parent.glob("ua_regexes-v*.json"):
+                if old.name != cache_file.name:
+                    old.unlink(missing_ok=True)
+
+        except Exception as e:
+            LOGGER.debug(
+                    "Could not persist regexes to '%s': %s: %s",
+                    self.cache_location, e.__class__.__name__, e
+                    )
+
+    def persist(self, cache_location: str) -> None:
+        """
+        Persists the rules in cache_location from now on. Rules, which
+        were already prepared in memory, are written, if the folder
+        does not contain them yet. Otherwise, they are loaded from there
+        on first parse.
+
+        :param cache_location: Folder to persist the prepared rules in.
+        :type cache_location: str
+        :return: None
+        """
+
+        with self._lock:
+            if self.cache_location is not None:
+                return
+
+            self.cache_location = cache_location
+            cache_file = self._cache_file()
+
+            if self._user_agent is not None and not cache_file.exists():
+                self._save(cache_file, self._source()[1])
+
+    def _pattern(self, key: tuple[str, int], regex: str) -> re.Pattern:
+        pattern = self._compiled.get(key)
+        if pattern is None:
+            pattern = self._compiled[key] = re.compile(regex)
+
+        return pattern
+
+    def _widened(self, kind: str, index: int) -> re.Pattern | None:
+        key = (kind, index)
+        if key not in self._widened_patterns:
+            rules = self._rules()[kind == "os"]
+            self._widened_patterns[key] = _widened(rules[index][0])
+
+        return self._widened_patterns[key]
+
+    def _rules(self) -> tuple[list, list]:
+        if self._user_agent is None:
+            with self._lock:
+                if self._user_agent is None:
+                    self._load()
+
+        return self._user_agent, self._os
+
+    def _scan(self, kind: str, string: str) -> tuple[int, Any, bool]:
+        """
+        Searches the rules of kind in order for the first match with a
+        family.
+
+        :return: The index of the matching rule (-1 for none), its
+            values and whether no earlier rule matched without a family.
+        :rtype: tuple[int, Any, bool]
+        """
+
+        rules = self._rules()[kind == "os"]
+        values = _VALUES[kind]
+        clean = True
+
+        for i, rule in enumerate(rules):
+            literal = rule[1]
+            if literal and literal not in string:
+                continue
+
+            match = self._pattern((kind, i), rule[0]).search(string)
+            if not match:
+                continue
+
+            result = values(rule, match)
+            if result is not None:
+                return i, result, clean
+
+            clean = False
+
+        return -1, None, clean
+
+    def _template(self, kind: str, string: str, index: int) -> tuple:
+        """
+        Returns the rule to rerun for a template hit and the earlier
+        rules to check: those, whose literal occurs in the string (or
+        contains digits itself) and whose result depends on the digit
+        values, or also on the digit lengths.
+        """
+
+        rules = self._rules()[kind == "os"]
+        end = index if index >= 0 else len(rules)
+        checks = [
+                j for j in range(end)
+                if rules[j][-1] < 2 and (
+                        not rules[j][1]
+                        or rules[j][1] in string
+                        or _DIGITS_PATTERN.search(rules[j][1])
+                )
+                ]
+
+        # Rules, whose widened pattern does not match, can not match
+        # other digit values of the same lengths.
+        value_checks = []
+        for j in checks:
+            if not rules[j][-1]:
+                widened = self._widened(kind, j)
+                if widened is None or widened.search(string):
+                    value_checks.append(j)
+
+        return index, tuple(value_checks), tuple(checks)
+
+    def _replay(
+            self,
+            kind: str,
+            string: str,
+            entry: tuple,
+            same_lengths: bool,
+            ) -> Any:
+        """
+        Reruns the rules of a template entry on a string, which only
+        differs from the template in its digits.
+
+        :return: The values of the matching rule, None for no match or
+            _MISS, if a full scan is needed.
+        """
+
+        if entry is None:
+            return _MISS
+
+        index, value_checks, length_checks = entry
+        rules = self._rules()[kind == "os"]
+
+        # The matching rule fails most often, so it is run first.
+        result = None
+        if index >= 0:
+            rule = rules[index]
+            match = self._pattern((kind, index), rule[0]).search(string)
+            if not match:
+                return _MISS
+
+            result = _VALUES[kind](rule, match)
+            if result is None:
+                return _MISS
+
+        for j in value_checks if same_lengths else length_checks:
+            literal = rules[j][1]
+            if literal and literal not in string:
+                continue
+
+            if self._pattern((kind, j), rules[j][0]).search(string):
+                return _MISS
+
+        return result
+
+    def cache_info(self) -> dict[str, int]:
+        """
+        Returns the 'hits', 'misses' and 'size' of the template cache.
+
+        :return: The statistics of the template cache.
+        :rtype: dict
+        """
+
+        return {
+                "hits": self.template_hits,
+                "misses": self.template_misses,
+                "size": len(self._templates),
+                }
+
+    def parse_user_agent(self, string: str) -> dict[str, str | None]:
+        """
+        Parses the browser of a user agent string.
+
+        :param string: The user agent string.
+        :type string: str
+        :return: The 'family', 'major', 'minor' and 'patch' values.
+        :rtype: dict
+        """
+
+        return _user_agent_dict(self._scan("user_agent", string)[1])
+
+    def parse_os(self, string: str) -> dict[str, str | None]:
+        """
+        Parses the OS of a user agent string.
+
+        :param string: The user agent string.
+        :type string: str
+        :return: The 'family', 'major', 'minor', 'patch' and
+            'patch_minor' values.
+        :rtype: dict
+        """
+
+        return _os_dict(self._scan("os", string)[1])
+
+    def parse(self, string: str) -> dict[str, dict[str, str | None]]:
+        """
+        Parses the browser and OS of a user agent string. The matching
+        rules are cached per template of the string, so other versions
+        of the same user agent skip most of the rules.
+
+        :param string: The user agent string.
+        :type string: str
+        :return: The 'user_agent' and 'os' results like
+            ua_parser.user_agent_parser.Parse.
+        :rtype: dict
+        """
+
+        template = _DIGITS_PATTERN.sub("0", string)
+        shape = _DIGIT_PATTERN.sub("0", string)
+        entries = self._templates.get(template, ())
+
+        for entry_shape, ua_entry, os_entry in entries:
+            same_lengths = shape == entry_shape
+            user_agent = self._replay(
+                    "user_agent", string, ua_entry, same_lengths
+                    )
+            if user_agent is _MISS:
+                continue
+
+            os_ = self._replay("os", string, os_entry, same_lengths)
+            if os_ is _MISS:
+                continue
+
+            self.template_hits += 1
+            return {
+                    "string": string,
+                    "user_agent": _user_agent_dict(user_agent),
+                    "os": _os_dict(os_),
+                    }
+
+        self.template_misses += 1
+        ua_index, user_agent, ua_clean = self._scan("user_agent", string)
+        os_index, os_, os_clean = self._scan("os", string)
+
+        # A rule, which matched without a family, may yield one for other
+        # digits, so such strings are never served from the template.
+        entry = (
+                shape,
+                self._template("user_agent", string, ua_index)
+                if ua_clean else None,
+                self._template("os", string, os_index)
+                if os_clean else None,
+                )
+
+        if len(self._templates) >= _TEMPLATE_CACHE_SIZE:
+            self._templates.clear()
+        self._templates[template] = (
+                (entry,) + entries[:_TEMPLATE_ENTRIES - 1]
+        )
+
+        return {
+                "string": string,
+                "user_agent": _user_agent_dict(user_agent),
+                "os": _os_dict(os_),
+                }
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+"""
+sampling.py: Vectorised, usage weighted sampling of user agents.
+
+This module draws large batches of weighted samples from a user agent
+pool at once and returns them as a compact index array, which refers to
+the string table of the pool. NumPy is used if it is installed, else
+the samples are drawn with the random module into an array.array.
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import array
+import itertools
+import random
+from typing import Sequence
+
+# NumPy is optional and imported on first use, as it is heavy to load.
+_NUMPY = None
+_NUMPY_CHECKED = False
+
+
+def _numpy():
+    """
+    Returns the numpy module or None, if it is not installed.
+
+    :return: The numpy module or None.
+    """
+
+    global _NUMPY, _NUMPY_CHECKED
+
+    if not _NUMPY_CHECKED:
+        try:
+            import numpy
+            _NUMPY = numpy
+        except ImportError:
+            _NUMPY = None
+        _NUMPY_CHECKED = True
+
+    return _NUMPY
+
+
+def _typecode(size: int) -> str:
+    """
+    Returns the smallest unsigned array typecode, which can index a
+    table of the given size.
+
+    :param size: The number of entries in the table.
+    :type size: int
+    :return: The array.array typecode.
+    :rtype: str
+    """
+
+    if size <= 0xFF + 1:
+        return "B"
+    if size <= 0xFFFF + 1:
+        return "H"
+
+    return "L"
+
+
+class Sampler:
+    """
+    A precomputed, usage weighted sampler over a table of user agents.
+    The cumulative weights are computed once, so every batch is a single
+    vectorised draw.
+    """
+
+    def __init__(
+            self,
+            table: Sequence[str],
+            weights: Sequence[float],
+            ) -> None:
+        """
+        Creates a new Sampler for the given table and weights.
+
+        :param table: The user agent strings to sample from.
+        :type table: Sequence[str]
+        :param weights: The usage weights of the table entries.
+        :type weights: Sequence[float]
+        :return: None
+        """
+
+        if len(table) != len(weights):
+            raise ValueError(
+                    "Number of weights must match the size of the table."
+                    )
+
+        self.table = tuple(table)
+        self._cum_weights = list(itertools.accumulate(weights))
+        self._typecode = _typecode(len(self.table))
+        self._probabilities = None
+
+    def __repr__(self) -> str:
+        """
+        Returns the Sampler instance as a short representation.
+        """
+
+        return f"{self.__class__.__name__}(table={len(self.table)})"
+
+    def sample(self, k: int, seed: int | None = None):
+        """
+        Draws k usage weighted samples (with replacement) at once.
+
+        :param k: The number of samples to draw.
+        :type k: int
+        :param seed: Seed for reproducible samples (default=None).
+        :type seed: int
+        :return: The indices into the table, as numpy.ndarray if NumPy
+            is installed, else as array.array.
+        :rtype: numpy.ndarray or array.array
+        """
+
+        np = _numpy()
+
+        if not self.table or k <= 0:
+            if np is not None:
+                return np.zeros(0, dtype=np.dtype(self._typecode))
+            return array.array(self._typecode)
+
+        if np is not None:
+            if self._probabilities is None:
+                cum = np.asarray(self._cum_weights, dtype=np.float64)
+                self._probabilities = cum / cum[-1]
+
+            # Inverse transform sampling on the cumulative weights.
+            rng = np.random.default_rng(seed)
+            indices = np.searchsorted(
+                    self._probabilities, rng.random(k), side="right"
+                    )
+            np.minimum(indices, len(self.table) - 1, out=indices)
+
+            return indices.astype(np.dtype(self._typecode), copy=False)
+
+        return array.array(
+                self._typecode,
+                random.Random(seed).choices(
+                        range(len(self.table)),
+                        cum_weights=self._cum_weights,
+                        k=k,
+                        ),
+                )
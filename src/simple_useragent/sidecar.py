@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+
+"""
+sidecar.py: Local HTTP service, which serves user agents to a fleet.
+
+Instead of every scraper process refreshing its own cache against
+'useragents.me', one sidecar holds a single pool, refreshes it on a
+schedule in the background and answers the clients from memory. The
+UserAgents class reads from a sidecar with UserAgents(sidecar_url=...).
+
+Endpoints (all GET, answering JSON):
+    /random?mobile=1&n=5    Random user agent strings.
+    /list?mobile=1&n=5      User agent strings sorted by usage.
+    /dict                   All user agents with their usage (client
+                            backend of UserAgents).
+    /parse?ua=...           The parsed attributes of a user agent (POST
+                            one user agent per line for many at once).
+    /health                 Status and age of the pool.
+/random and /list also accept browser, os and min_browser_version.
+
+# Serve on port 8555 with 4 preforked workers:
+$ simple-useragent serve --port 8555 --workers 4
+
+# Read the user agents from the sidecar:
+user_agents = sua.UserAgents(sidecar_url='http://127.0.0.1:8555/')
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import http.server
+import json
+import logging
+import os
+import signal
+import threading
+import time
+import urllib.parse
+from collections.abc import Mapping
+
+from .core import _ATTRIBUTES, UserAgents, attribute_values
+
+# Logging.
+LOGGER = logging.getLogger(__name__)
+
+# Maximal size of a POST /parse body.
+_MAX_BODY = 1 << 20
+
+
+def _plain(value):
+    """
+    Converts the read-only views of export_dict back to JSON serializable
+    dicts.
+    """
+
+    if isinstance(value, Mapping):
+        return {k: _plain(v) for k, v in value.items()}
+
+    return value
+
+
+def _flag(value: str | None) -> bool:
+    return value is not None and value.lower() in ("1", "true", "yes")
+
+
+class Sidecar:
+    """
+    A local HTTP server, which holds one user agent pool and answers
+    the requests of many clients from memory.
+    """
+
+    def __init__(
+            self,
+            user_agents: UserAgents = None,
+            host: str = "127.0.0.1",
+            port: int = 8555,
+            refresh_interval: float = 60,
+            ) -> None:
+        """
+        Creates a new Sidecar and binds its socket. Call start() or use
+        it as context manager to serve in the background, or call
+        serve_forever(). The sidecar takes over the refreshes of the
+        pool: Requests are answered from memory and only the background
+        thread refreshes it (auto_refresh of the instance is disabled).
+
+        :param user_agents: The UserAgents instance, which holds the
+            pool (default=None -> UserAgents with default settings).
+        :type user_agents: UserAgents
+        :param host: The host to bind to (default='127.0.0.1').
+        :type host: str
+        :param port: The port to bind to, 0 picks a free one
+            (default=8555).
+        :type port: int
+        :param refresh_interval: Seconds between the background checks
+            of the pool, which refresh it once it is older than the
+            cache duration (default=60).
+        :type refresh_interval: float
+        :return: None
+        """
+
+        self.user_agents = user_agents or UserAgents()
+        self.user_agents.auto_refresh = False
+        self.refresh_interval = refresh_interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._refresher = None
+
+        # Delay of the first background check, which staggers the checks
+        # of preforked workers.
+        self._phase = 0.0
+
+        # Serialized /dict response of the current pool snapshot.
+        self._dict_cache = (None, b"")
+
+        self._httpd = http.server.ThreadingHTTPServer(
+                (host, port), self._handler()
+                )
+        self._httpd.daemon_threads = True
+
+    def __enter__(self) -> Sidecar:
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        """
+        Returns the Sidecar instance as a representation.
+        """
+
+        return f"{self.__class__.__name__}(url={self.url!r})"
+
+    @property
+    def url(self) -> str:
+        """
+        Returns the URL of the server, e.g. 'http://127.0.0.1:8555/'.
+        """
+
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def refresh(self) -> None:
+        """
+        Loads the pool or refreshes it, if it is older than the cache
+        duration of the UserAgents instance.
+
+        :return: None
+        """
+
+        try:
+            self.user_agents.refresh()
+        except Exception as e:
+            LOGGER.warning(
+                    "Could not refresh the user agents: %s: %s",
+                    e.__class__.__name__, e
+                    )
+
+    def _refresh_loop(self) -> None:
+        if self._stop.wait(self._phase):
+            return
+
+        while not self._stop.wait(self.refresh_interval):
+            self.refresh()
+
+    def _start_refresher(self) -> None:
+        # Load the pool before the first request (unless it is loaded
+        # already, e.g. by the parent of the workers) and keep it fresh
+        # in the background, so requests never wait for a refresh.
+        self._stop.clear()
+        if self.user_agents.pool_age is None:
+            self.refresh()
+        self._refresher = threading.Thread(
+                target=self._refresh_loop, daemon=True
+                )
+        self._refresher.start()
+
+    def start(self) -> None:
+        """
+        Starts serving in a background thread.
+
+        :return: None
+        """
+
+        self._start_refresher()
+        self._thread = threading.Thread(
+                target=self._httpd.serve_forever, daemon=True
+                )
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """
+        Serves in the current thread until stop() is called.
+
+        :return: None
+        """
+
+        self._start_refresher()
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._stop.set()
+
+    def stop(self) -> None:
+        """
+        Stops serving and closes the socket.
+
+        :return: None
+        """
+
+        self._stop.set()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _dict_body(self) -> bytes:
+        # Answered from memory, only the refresher refreshes the pool.
+        view = self.user_agents.export_dict()
+        cached_view, body = self._dict_cache
+
+        if view is not cached_view:
+            body = json.dumps(_plain(view)).encode()
+            self._dict_cache = (view, body)
+
+        return body
+
+    def _select(self, query: dict[str, str], shuffle: bool) -> tuple:
+        n = query.get("n")
+
+        return self.user_agents.get_list(
+                num=int(n) if n is not None else (1 if shuffle else None),
+                mobile=_flag(query.get("mobile")),
+                shuffle=shuffle,
+                browser=query.get("browser"),
+                os=query.get("os"),
+                min_browser_version=query.get("min_browser_version"),
+                )
+
+    def _handler(self) -> type[http.server.BaseHTTPRequestHandler]:
+        sidecar = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _send(self, status: int, body) -> None:
+                if not isinstance(body, bytes):
+                    body = json.dumps(body).encode()
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _route(self, body: bytes = None) -> None:
+                url = urllib.parse.urlsplit(self.path)
+                query = dict(urllib.parse.parse_qsl(url.query))
+                path = url.path.rstrip("/")
+
+                if path == "/random":
+                    self._send(200, sidecar._select(query, shuffle=True))
+                elif path == "/list":
+                    self._send(200, sidecar._select(query, shuffle=False))
+                elif path == "/dict":
+                    self._send(200, sidecar._dict_body())
+                elif path == "/parse":
+                    if body is not None:
+                        strings = body.decode("utf-8", "replace").splitlines()
+                        self._send(200, [
+                                dict(zip(_ATTRIBUTES,
+                                         attribute_values(s.strip())))
+                                for s in strings if s.strip()
+                                ])
+                    elif query.get("ua", "").strip():
+                        self._send(200, dict(zip(
+                                _ATTRIBUTES,
+                                attribute_values(query["ua"].strip()),
+                                )))
+                    else:
+                        self._send(400, {"error": "Missing 'ua' parameter."})
+                elif path == "/health":
+                    age = sidecar.user_agents.pool_age
+                    self._send(200, {
+                            "status": "ok",
+                            "cached": int(time.time()) - age
+                            if age is not None else None,
+                            "age": age,
+                            })
+                else:
+                    self._send(404, {"error": f"Unknown path '{url.path}'."})
+
+            def _handle(self, body: bytes = None) -> None:
+                try:
+                    self._route(body)
+                except ValueError as e:
+                    self._send(400, {"error": str(e)})
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                except Exception as e:
+                    LOGGER.warning(
+                            "Could not answer '%s': %s: %s",
+                            self.path, e.__class__.__name__, e
+                            )
+                    self._send(500, {"error": "Internal server error."})
+
+            def do_GET(self) -> None:
+                self._handle()
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length > _MAX_BODY:
+                    self._send(413, {"error": "Request body too large."})
+                    self.close_connection = True
+                    return
+
+                self._handle(self.rfile.read(length))
+
+            def log_message(self, format: str, *args) -> None:
+                LOGGER.debug(format, *args)
+
+        return Handler
+
+
+def serve(
+        host: str = "127.0.0.1",
+        port: int = 8555,
+        workers: int = 1,
+        refresh_interval: float = 60,
+        **kwargs,
+        ) -> None:
+    """
+    Serves user agents until interrupted. With more than one worker,
+    the socket is bound once and the pool is loaded once, before the
+    workers are forked (POSIX only). Each worker then keeps its own copy
+    fresh in the background. The checks of the workers are staggered
+    over the refresh interval and they share the file cache, so usually
+    the first worker after the expiry refreshes from the website and
+    the others load its result from the file.
+
+    :param host: The host to bind to (default='127.0.0.1').
+    :type host: str
+    :param port: The port to bind to (default=8555).
+    :type port: int
+    :param workers: The number of preforked worker processes
+        (default=1).
+    :type workers: int
+    :param refresh_interval: Seconds between the background checks of
+        the pool (default=60).
+    :type refresh_interval: float
+    :param kwargs: The settings of the UserAgents instance, e.g.
+        cache_duration.
+    :return: None
+    """
+
+    sidecar = Sidecar(
+            UserAgents(**kwargs),
+            host=host,
+            port=port,
+            refresh_interval=refresh_interval,
+            )
+    LOGGER.info("Serving user agents on %s ...", sidecar.url)
+
+    if workers <= 1:
+        try:
+            sidecar.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            sidecar._httpd.server_close()
+        return
+
+    if not hasattr(os, "fork"):
+        raise OSError("Preforked workers need os.fork (POSIX only).")
+
+    # The workers inherit the loaded pool.
+    sidecar.refresh()
+
+    children = []
+    for worker in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            sidecar._phase = refresh_interval * worker / workers
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            try:
+                sidecar.serve_forever()
+            finally:
+                os._exit(0)
+        children.append(pid)
+
+    try:
+        for pid in children:
+            os.waitpid(pid, 0)
+    except KeyboardInterrupt:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+    finally:
+        sidecar._httpd.server_close()
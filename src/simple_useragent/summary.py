@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+
+"""
+summary.py: Parallel aggregation of user agents over large log files.
+
+This module counts the browser, browser version, OS, OS version and
+device (mobile/desktop) shares over uncompressed log files. The files
+are memory-mapped and split into line-aligned byte ranges. Worker
+processes count the unique user agent strings of their ranges with
+C-level splitting and regex scans, the counts are merged and only the
+distinct strings are parsed afterwards, so the work scales with the
+number of cores and not with the number of parsed records.
+
+# Summarize combined access logs on all cores:
+from simple_useragent import summary
+result = summary.summarize(['access.log'], input_format='combined')
+print(summary.format_table(result))
+
+# Or from the command line:
+$ simple-useragent summarize --input-format combined access.log
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import collections
+import mmap
+import multiprocessing
+import os
+import re
+from typing import Any, Iterator
+
+from . import bots
+from .core import UserAgent
+
+# The aggregated attributes and their titles in the summary table.
+SECTIONS = {
+        "browser": "Browser",
+        "browser_version": "Browser Version",
+        "os": "OS",
+        "os_version": "OS Version",
+        "device": "Device",
+        }
+
+# The user agent is the last quoted field of the combined log format of
+# Apache and nginx.
+_COMBINED_PATTERN = re.compile(
+        rb'"([^"\\\n]*(?:\\.[^"\\\n]*)*)"[ \t\r]*$', re.M
+        )
+
+# Byte range and parse batch sizes of the worker tasks.
+_RANGE_SIZE = 32 << 20
+_MIN_RANGE_SIZE = 1 << 16
+_PARSE_BATCH = 256
+
+
+def _ranges(path: str, size: int) -> Iterator[tuple[int, int]]:
+    """
+    Splits a file into byte ranges of about size bytes, which end on a
+    line break.
+
+    :param path: The file to split.
+    :type path: str
+    :param size: The approximate size of the ranges in bytes.
+    :type size: int
+    :return: The start and end offset of the ranges.
+    :rtype: Iterator[tuple[int, int]]
+    """
+
+    with open(path, "rb") as fh:
+        length = os.fstat(fh.fileno()).st_size
+        if not length:
+            return
+
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < length:
+                end = min(length, start + size)
+                if end < length:
+                    newline = mm.find(b"\n", end - 1)
+                    end = length if newline == -1 else newline + 1
+
+                yield start, end
+                start = end
+
+
+def _count_range(
+        path: str,
+        start: int,
+        end: int,
+        input_format: str,
+        ) -> tuple[int, collections.Counter]:
+    """
+    Counts the unique user agent strings of a byte range. Runs in the
+    worker processes.
+
+    :param path: The file to read.
+    :type path: str
+    :param start: The start offset of the range.
+    :type start: int
+    :param end: The end offset of the range.
+    :type end: int
+    :param input_format: 'ua' for one user agent per line or
+        'combined' for combined log format lines.
+    :type input_format: str
+    :return: The number of lines and the counts of the user agents as
+        bytes.
+    :rtype: tuple[int, collections.Counter]
+    """
+
+    with open(path, "rb") as fh, \
+            mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        block = mm[start:end]
+
+    lines = block.count(b"\n") + (not block.endswith(b"\n"))
+
+    if input_format == "combined":
+        counts = collections.Counter(_COMBINED_PATTERN.findall(block))
+    else:
+        # Count the raw lines first, only the unique ones are stripped.
+        counts = collections.Counter()
+        for line, count in collections.Counter(block.split(b"\n")).items():
+            counts[line.strip()] += count
+
+    counts.pop(b"", None)
+    counts.pop(b"-", None)
+
+    return lines, counts
+
+
+def _count_range_star(args: tuple) -> tuple[int, collections.Counter]:
+    return _count_range(*args)
+
+
+def _parse_batch(strings: list[bytes]) -> list[tuple]:
+    """
+    Parses distinct user agent strings to the summarized attributes.
+    Runs in the worker processes.
+    """
+
+    results = []
+    for string in strings:
+        agent = UserAgent(string.decode("utf-8", "replace"))
+        browser = agent.browser or "Other"
+        os_name = agent.os or "Other"
+        results.append((
+                browser,
+                f"{browser} {agent.browser_version}".rstrip(),
+                os_name,
+                f"{os_name} {agent.os_version}".rstrip(),
+                "mobile" if agent.mobile else "desktop",
+                ))
+
+    return results
+
+
+def summarize(
+        paths: list[str],
+        input_format: str = "ua",
+        workers: int = None,
+        range_size: int = _RANGE_SIZE,
+        skip_bots: bool = False,
+        ) -> dict[str, Any]:
+    """
+    Counts the browser, browser version, OS, OS version and device
+    shares of the user agents in uncompressed log files.
+
+    :param paths: The log files.
+    :type paths: list[str]
+    :param input_format: 'ua' for one user agent per line or
+        'combined' for combined log format lines (default='ua').
+    :type input_format: str
+    :param workers: The number of worker processes, 0 counts in the
+        current process (default=None -> number of CPUs).
+    :type workers: int
+    :param range_size: The maximal size of the byte ranges per task
+        (default=32 MiB).
+    :type range_size: int
+    :param skip_bots: Drops the records of bots, crawlers, headless
+        browsers and HTTP libraries before parsing (see bots.py)
+        (default=False).
+    :type skip_bots: bool
+    :return: The number of 'lines', 'records', dropped 'bots' and
+        'unique' user agents and the counts per section, sorted
+        descending.
+    :rtype: dict
+    """
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Smaller ranges for small files, so all workers get some.
+    total = sum(os.path.getsize(path) for path in paths)
+    size = max(_MIN_RANGE_SIZE,
+               min(range_size, -(-total // (max(1, workers) * 4))))
+
+    tasks = [(path, start, end, input_format)
+             for path in paths for start, end in _ranges(path, size)]
+
+    pool = multiprocessing.Pool(workers) if workers else None
+    try:
+        imap = pool.imap_unordered if pool is not None else map
+
+        lines = 0
+        counts = collections.Counter()
+        for task_lines, task_counts in imap(_count_range_star, tasks):
+            lines += task_lines
+            counts.update(task_counts)
+
+        # Bots are dropped cheaply, before the distinct strings are parsed.
+        skipped = 0
+        if skip_bots:
+            for string in [s for s in counts
+                           if bots.is_bot(s.decode("utf-8", "replace"))]:
+                skipped += counts.pop(string)
+
+        # Only the distinct strings are parsed.
+        strings = list(counts)
+        batches = [strings[i:i + _PARSE_BATCH]
+                   for i in range(0, len(strings), _PARSE_BATCH)]
+        imap = pool.imap if pool is not None else map
+        attributes = [values for batch in imap(_parse_batch, batches)
+                      for values in batch]
+
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    sections = {name: collections.Counter() for name in SECTIONS}
+    for string, values in zip(strings, attributes):
+        count = counts[string]
+        for name, value in zip(SECTIONS, values):
+            sections[name][value] += count
+
+    return {
+            "lines": lines,
+            "records": sum(counts.values()),
+            "bots": skipped,
+            "unique": len(counts),
+            **{name: dict(counter.most_common())
+               for name, counter in sections.items()},
+            }
+
+
+def format_table(result: dict[str, Any], top: int = 10) -> str:
+    """
+    Formats the result of summarize as compact text table.
+
+    :param result: The result of summarize.
+    :type result: dict
+    :param top: The number of rows per section, the rest is summed up
+        as 'Rest' (default=10).
+    :type top: int
+    :return: The table.
+    :rtype: str
+    """
+
+    records = result["records"]
+    rows = [
+            f"Records: {records:,} of {result['lines']:,} lines "
+            f"({result['unique']:,} unique user agents)",
+            ]
+    if result.get("bots"):
+        rows[0] += f", {result['bots']:,} bot records skipped"
+
+    for name, title in SECTIONS.items():
+        items = list(result[name].items())
+        if len(items) > top:
+            rest = sum(count for _, count in items[top:])
+            items = items[:top] + [(f"Rest ({len(items) - top})", rest)]
+
+        width = max([len(title)] + [len(str(value)) for value, _ in items])
+        rows.append("")
+        rows.append(f"{title:<{width}}  {'Count':>13}  {'Share':>6}")
+        for value, count in items:
+            share = count / records * 100 if records else 0.0
+            rows.append(f"{value:<{width}}  {count:>13,}  {share:>5.1f}%")
+
+    return "\n".join(rows)
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+
+"""
+synthetic.py: Seedable generator of realistic user agent variants.
+
+The pool of real world user agents is small (45 desktop and 23 mobile
+strings), so large crawls reuse every string very often. This module
+expands the pool to variants of its strings, which are still internally
+consistent: The browser major version (and every product version, which
+follows it, e.g. Chrome of Opera) is lowered by a few releases, the
+'rv:' of Firefox is derived from its lowered major, build numbers move
+with it, non-zero patch numbers vary and the iOS minor and patch
+versions change together with the Safari version. Frozen values, like
+'Windows NT 10.0', the reduced Chrome versions '120.0.0.0' and Android
+'K', are kept as they are.
+
+The variants are streamed lazily with bounded memory. The seed strings
+are drawn by usage and the stream is reproducible with a seed.
+
+# Generate variants of the pool:
+import simple_useragent as sua
+variants = sua.UserAgents().generate(num=100_000, seed=42)
+next(variants)  >>  'Mozilla/5.0 (Windows NT 10.0; Win64; x64) ...'
+
+# Or from any list of strings:
+from simple_useragent.synthetic import VariantGenerator
+generator = VariantGenerator(strings, weights)
+list(generator.stream(10, seed=1))
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import bisect
+import itertools
+import random
+import re
+from typing import Iterator, Sequence
+
+from .tokens import products, tokenize
+
+# Versions of products and the 'rv:' of Gecko, e.g. '120.0.6099.109'.
+_VERSION_PATTERN = re.compile(r"(?<=[/:])(\d+)((?:\.\d+)*)")
+
+# The iOS version, e.g. 'OS 17_2_1 like Mac OS X', and the Safari
+# version, e.g. 'Version/17.2', which follows the iOS version.
+_IOS_PATTERN = re.compile(r"(?<=OS )(\d+)_(\d+)(?:_(\d+))?(?= like Mac OS X)")
+_SAFARI_PATTERN = re.compile(r"(?<=Version/)(\d+)\.(\d+)(?:\.\d+)?")
+
+# Chromium build numbers grow by about 55 per major release.
+_BUILD_STEP = 55
+
+# Firefox 110 to 119 froze the 'rv:' of Gecko at 109.
+_GECKO_FROZEN = (110, 119, 109)
+
+# Probability decay per lowered release, e.g. 1, 0.5, 0.25 for 0-2.
+_DECAY = 0.5
+
+# Seed strings drawn per batch, the stream does not depend on it.
+_BATCH = 1024
+
+
+def _gecko_rv(major: int) -> int:
+    """
+    Returns the 'rv:' major, which Firefox sends with its major version.
+
+    :param major: The major version of Firefox.
+    :type major: int
+    :return: The 'rv:' major.
+    :rtype: int
+    """
+
+    low, high, frozen = _GECKO_FROZEN
+    if low <= major <= high:
+        return frozen
+
+    return major
+
+
+class _Template:
+    """
+    A seed string split into literal parts and version slots, which
+    are rendered with the drawn release and patch offsets.
+    """
+
+    __slots__ = ("parts",)
+
+    def __init__(self, string: str, spread: int) -> None:
+        """
+        Creates a new template from a seed string.
+
+        :param string: The seed string.
+        :type string: str
+        :param spread: The maximal number of lowered releases.
+        :type spread: int
+        :return: None
+        """
+
+        versions = products(tokenize(string))
+        ios = _IOS_PATTERN.search(string)
+        safari = "Version" in versions and "Safari" in versions \
+            and not any(name in versions for name in ("Chrome", "CriOS",
+                                                      "Firefox", "FxiOS"))
+
+        # The majors of the browser and its engine products move
+        # together. Safari follows the OS and is varied by its minor.
+        majors = set()
+        gecko = None
+        if not safari:
+            for name, version in versions.items():
+                if name in ("Mozilla", "AppleWebKit", "Safari", "Gecko",
+                            "Version", "Mobile", "Trident") or not version:
+                    continue
+                major = version.split(".")[0]
+                if major.isdigit() and int(major) > spread:
+                    majors.add(major)
+
+            # The 'rv:' of Firefox is derived from its lowered major, if
+            # the seed follows Firefox, otherwise it is kept. Without
+            # Firefox (e.g. IE 11), it is the browser major itself.
+            firefox = (versions.get("Firefox") or "").split(".")[0]
+            for part in string.split(";"):
+                part = part.strip().rstrip(")")
+                if not part.startswith("rv:"):
+                    continue
+                rv = part[3:].split(".")[0]
+                if not firefox.isdigit():
+                    majors.add(rv)
+                elif firefox in majors and rv == str(_gecko_rv(int(firefox))):
+                    gecko = int(firefox)
+
+        # Sorted slot positions: (start, end, kind, value).
+        slots = []
+        for match in _VERSION_PATTERN.finditer(string):
+            if gecko is not None and string.endswith("rv:", 0,
+                                                     match.start()):
+                slots.append((*match.span(1), "rv", gecko))
+                continue
+            if match.group(1) not in majors:
+                continue
+            slots.append((*match.span(1), "major", int(match.group(1))))
+
+            components = match.group(2).split(".")[1:]
+            if len(components) == 3 and components[1] != "0":
+                offset = match.start(2)
+                for pos, (kind, value) in enumerate(
+                        zip(("build", "patch"), components[1:]), 1):
+                    start = offset + len(".".join(components[:pos])) + 2
+                    if kind == "patch" and value == "0":
+                        break
+                    slots.append((start, start + len(value), kind,
+                                  int(value)))
+
+        if ios is not None:
+            end = ios.end(3) if ios.group(3) else ios.end(2)
+            slots.append((ios.start(2), end, "ios", int(ios.group(2))))
+        if safari:
+            match = _SAFARI_PATTERN.search(string)
+            if match is not None:
+                slots.append((match.start(2), match.end(), "minor",
+                              int(match.group(2))))
+
+        parts = []
+        last = 0
+        for start, end, kind, value in sorted(slots):
+            parts.append(string[last:start])
+            parts.append((kind, value))
+            last = end
+        parts.append(string[last:])
+
+        self.parts = tuple(parts)
+
+    def render(self, rng: random.Random, release: int, minor: int) -> str:
+        """
+        Renders a variant of the seed string.
+
+        :param rng: The random number generator for the patch numbers.
+        :type rng: random.Random
+        :param release: The number of lowered major releases.
+        :type release: int
+        :param minor: The number of lowered minor versions of iOS and
+            Safari.
+        :type minor: int
+        :return: The variant.
+        :rtype: str
+        """
+
+        if len(self.parts) == 1:
+            return self.parts[0]
+
+        out = []
+        ios_patch = None
+        for part in self.parts:
+            if type(part) is str:
+                out.append(part)
+                continue
+
+            kind, value = part
+            if kind == "major":
+                out.append(str(value - release))
+            elif kind == "rv":
+                out.append(str(_gecko_rv(value - release)))
+            elif kind == "build":
+                out.append(str(max(1, value - release * _BUILD_STEP)))
+            elif kind == "patch":
+                out.append(str(rng.randint(1, value * 2)))
+            else:
+                # iOS (with an optional patch) and Safari share the minor.
+                version = str(max(0, value - minor))
+                if kind == "ios":
+                    if ios_patch is None:
+                        ios_patch = rng.randint(0, 2)
+                    if ios_patch:
+                        version = f"{version}_{ios_patch}"
+                out.append(version)
+
+        return "".join(out)
+
+
+class VariantGenerator:
+    """
+    A usage weighted generator of realistic variants of seed strings.
+    The seed strings are analyzed once, so every variant is rendered
+    from precomputed templates.
+    """
+
+    def __init__(
+            self,
+            strings: Sequence[str],
+            weights: Sequence[float] = None,
+            spread: int = 2,
+            ) -> None:
+        """
+        Creates a new VariantGenerator for the given seed strings.
+
+        :param strings: The seed user agent strings.
+        :type strings: Sequence[str]
+        :param weights: The usage weights of the strings (default=None
+            -> equal weights).
+        :type weights: Sequence[float]
+        :param spread: The maximal number of lowered major releases and
+            iOS minor versions (default=2).
+        :type spread: int
+        :return: None
+        """
+
+        if weights is not None and len(weights) != len(strings):
+            raise ValueError(
+                    "Number of weights must match the number of strings."
+                    )
+        if spread < 0:
+            raise ValueError("Spread must not be negative.")
+
+        self.strings = tuple(strings)
+        self.spread = spread
+        self._templates = tuple(_Template(s, spread) for s in self.strings)
+        self._cum_weights = list(itertools.accumulate(
+                weights if weights is not None else [1] * len(self.strings)
+                ))
+        self._cum_offsets = list(itertools.accumulate(
+                _DECAY ** offset for offset in range(spread + 1)
+                ))
+
+    def __repr__(self) -> str:
+        """
+        Returns the VariantGenerator instance as a short representation.
+        """
+
+        return (
+                f"{self.__class__.__name__}"
+                f"(strings={len(self.strings)}, spread={self.spread})"
+        )
+
+    def _offset(self, rng: random.Random) -> int:
+        """
+        Draws a number of lowered releases, fewer ones are likelier.
+        """
+
+        return bisect.bisect(self._cum_offsets,
+                             rng.random() * self._cum_offsets[-1])
+
+    def _variants(self, seed: int | None) -> Iterator[str]:
+        """
+        Yields variants endlessly.
+        """
+
+        rng = random.Random(seed)
+        indices = range(len(self._templates))
+        templates = self._templates
+        offset = self._offset
+
+        while True:
+            for index in rng.choices(indices, cum_weights=self._cum_weights,
+                                     k=_BATCH):
+                yield templates[index].render(rng, offset(rng), offset(rng))
+
+    def stream(self, num: int = None, seed: int = None) -> Iterator[str]:
+        """
+        Lazily generates usage weighted variants of the seed strings.
+        The same seed yields the same variants, and a shorter stream is
+        a prefix of a longer one.
+
+        :param num: The number of variants (default=None -> endless).
+        :type num: int
+        :param seed: Seed for reproducible variants (default=None).
+        :type seed: int
+        :return: The variants.
+        :rtype: Iterator[str]
+        """
+
+        if not self._templates or (num is not None and num <= 0):
+            return iter(())
+
+        return itertools.islice(self._variants(seed), num)
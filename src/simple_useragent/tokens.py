@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+
+"""
+tokens.py: Tokenizer for the product and comment grammar of user agent
+strings.
+
+RFC 9110 defines a user agent string as a sequence of products
+('name/version') and comments ('(...)'), separated by whitespace. This
+module splits a string into these tokens in one regex pass, so parts
+that ua_parser does not expose (the rendering engine, the platform
+comment or the device model) can be read without running more regexes
+over the string. UserAgent exposes them as lazily computed properties.
+
+# Tokenize a user agent string:
+from simple_useragent import tokens
+tokens.tokenize('Mozilla/5.0 (Linux; Android 14; Pixel 8) ...')
+>> (Product(name='Mozilla', version='5.0'), Comment(text='Linux; Android
+14; Pixel 8', items=('Linux', 'Android 14', 'Pixel 8')), ...)
+
+# Or through the lazily computed UserAgent properties:
+ua = sua.UserAgent('Mozilla/5.0 (Linux; Android 14; Pixel 8) ...')
+ua.engine, ua.engine_version  >>  'Blink', '120.0.6099.230'
+ua.platform  >>  ('Linux', 'Android 14', 'Pixel 8')
+ua.device_model  >>  'Pixel 8'
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import re
+from typing import NamedTuple, Union
+
+# One match per token: A comment with one level of nested comments and
+# quoted pairs (an unclosed comment runs to the end), a product with an
+# optional version, or a stray character, which is skipped. The comment
+# loop is unrolled, which matches about 1.5x faster.
+_TOKEN_PATTERN = re.compile(
+        r"(\()([^()\\]*(?:(?:\\.|\([^()\\]*(?:\\.[^()\\]*)*\)?)"
+        r"[^()\\]*)*)\)?"
+        r"|([^\s/()]+)(?:/([^\s()]*))?"
+        r"|[^\s(]"
+        )
+
+# The 'rv:' revision of Gecko in the platform comment.
+_REVISION_PATTERN = re.compile(r"\brv:([\w.]+)")
+
+# Products of Chromium based browsers, which render with Blink.
+_BLINK_PRODUCTS = ("Chrome", "Chromium", "HeadlessChrome")
+
+# Platform comment items, which are no device model.
+_NOT_MODELS = {"u", "wv", "mobile", "tablet", "k"}
+_LOCALE_PATTERN = re.compile(r"^[a-z]{2}(?:[-_][a-z]{2})?$", re.I)
+
+
+class Product(NamedTuple):
+    """
+    A product token, e.g. 'Chrome/120.0.0.0'.
+
+    :ivar name: The product name.
+    :ivar version: The product version or None.
+    """
+
+    name: str
+    version: str | None = None
+
+
+class Comment(NamedTuple):
+    """
+    A comment token, e.g. '(Windows NT 10.0; Win64; x64)'.
+
+    :ivar text: The text between the parentheses.
+    :ivar items: The stripped, non-empty items separated by ';'.
+    """
+
+    text: str
+    items: tuple[str, ...] = ()
+
+
+Token = Union[Product, Comment]
+
+
+def tokenize(string: str) -> tuple[Token, ...]:
+    """
+    Splits a user agent string into its product and comment tokens in
+    one pass. Malformed parts (e.g. an unclosed comment) are tolerated
+    as real world user agents do not always follow the grammar.
+
+    :param string: The user agent string.
+    :type string: str
+    :return: The products and comments in order.
+    :rtype: tuple[Product or Comment, ...]
+    """
+
+    result = []
+    append = result.append
+
+    # Skips the argument handling of the NamedTuple constructors.
+    new = tuple.__new__
+
+    for paren, text, name, version in _TOKEN_PATTERN.findall(string):
+        if paren:
+            append(new(Comment, (text, tuple(
+                    [item for item in map(str.strip, text.split(";")) if item]
+                    ))))
+        elif name:
+            append(new(Product, (name, version or None)))
+
+    return tuple(result)
+
+
+def products(tokens: tuple[Token, ...]) -> dict[str, str | None]:
+    """
+    Returns the versions of the products by name. The first product of
+    a name wins.
+
+    :param tokens: The tokens of tokenize.
+    :type tokens: tuple[Product or Comment, ...]
+    :return: The versions by product name.
+    :rtype: dict[str, str or None]
+    """
+
+    result = {}
+    for token in tokens:
+        if type(token) is Product and token.name not in result:
+            result[token.name] = token.version
+
+    return result
+
+
+def platform(tokens: tuple[Token, ...]) -> tuple[str, ...]:
+    """
+    Returns the items of the platform comment, which is the first
+    comment, e.g. ('Windows NT 10.0', 'Win64', 'x64').
+
+    :param tokens: The tokens of tokenize.
+    :type tokens: tuple[Product or Comment, ...]
+    :return: The items of the platform comment or an empty tuple.
+    :rtype: tuple[str, ...]
+    """
+
+    for token in tokens:
+        if type(token) is Comment:
+            return token.items
+
+    return ()
+
+
+def engine(tokens: tuple[Token, ...]) -> tuple[str | None, str | None]:
+    """
+    Returns the rendering engine and its version: 'Blink' (with the
+    Chromium version), 'WebKit', 'Gecko' (with the 'rv:' revision),
+    'EdgeHTML', 'Trident' or 'Presto'.
+
+    :param tokens: The tokens of tokenize.
+    :type tokens: tuple[Product or Comment, ...]
+    :return: The engine and its version, or None for unknown ones.
+    :rtype: tuple[str or None, str or None]
+    """
+
+    versions = products(tokens)
+
+    if "Edge" in versions:
+        return "EdgeHTML", versions["Edge"]
+
+    if "AppleWebKit" in versions:
+        for name in _BLINK_PRODUCTS:
+            if name in versions:
+                return "Blink", versions[name]
+        return "WebKit", versions["AppleWebKit"]
+
+    # Internet Explorer lists Trident in the platform comment.
+    for item in platform(tokens):
+        if item.startswith("Trident/"):
+            return "Trident", item[8:]
+
+    if "Presto" in versions:
+        return "Presto", versions["Presto"]
+
+    if "Gecko" in versions:
+        match = _REVISION_PATTERN.search(" ".join(platform(tokens)))
+        return "Gecko", match.group(1) if match else versions["Gecko"]
+
+    return None, None
+
+
+def device_model(tokens: tuple[Token, ...]) -> str | None:
+    """
+    Returns the device model of the platform comment: The item before
+    'Build/' or after the 'Android' item on Android (e.g. 'Pixel 8'),
+    and 'iPhone', 'iPad' or 'iPod' on iOS. Reduced user agents, which
+    only contain the placeholder 'K', have no model.
+
+    :param tokens: The tokens of tokenize.
+    :type tokens: tuple[Product or Comment, ...]
+    :return: The device model or None.
+    :rtype: str or None
+    """
+
+    items = platform(tokens)
+    if not items:
+        return None
+
+    if items[0].startswith(("iPhone", "iPad", "iPod")):
+        return items[0].split(" ")[0]
+
+    for pos, item in enumerate(items):
+        build = item.find(" Build/")
+        if build > 0:
+            return item[:build]
+        if not item.startswith("Android"):
+            continue
+
+        for model in items[pos + 1:]:
+            if (
+                    model.lower() not in _NOT_MODELS
+                    and not _LOCALE_PATTERN.match(model)
+            ):
+                return model.split(" Build/")[0] or None
+        return None
+
+    return None
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+"""
+test_arrow.py: Test the Arrow and Parquet export of the simple-useragent
+package.
+
+This file contains tests for the column collection, the missing pyarrow
+handling and the round trip of Parquet files and Arrow IPC streams. The
+round trips are skipped, if pyarrow is not installed.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_arrow
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import io
+import json
+import pathlib
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from unittest import mock
+
+from simple_useragent import arrow, cli, core
+from simple_useragent.core import UserAgent
+
+
+class TestArrow(unittest.TestCase):
+    def setUp(self):
+        with open(core._FALLBACK_JSON, "r") as fh:
+            data = json.load(fh)
+        self.strings = data["desktop"] + data["mobile"] + ["curl/8.4.0"]
+        self.agents = [UserAgent(s) for s in self.strings]
+
+    def require_pyarrow(self):
+        if not arrow.available():
+            self.skipTest("pyarrow is not installed.")
+
+    def test_columns(self):
+        values = arrow.columns(self.agents)
+
+        self.assertEqual(tuple(values), arrow.COLUMNS)
+        self.assertEqual(values["string"], self.strings)
+        for pos, agent in enumerate(self.agents):
+            self.assertEqual(values["browser"][pos], agent.browser)
+            self.assertEqual(values["os"][pos], agent.os)
+            self.assertEqual(values["mobile"][pos], agent.mobile)
+            self.assertEqual(values["fingerprint"][pos], agent.fingerprint)
+
+            version = tuple(v for v in (values["browser_major"][pos],
+                                        values["browser_minor"][pos],
+                                        values["browser_patch"][pos])
+                            if v is not None)
+            self.assertEqual(version, agent.browser_version_tuple[:3])
+
+            version = tuple(v for v in (values["os_major"][pos],
+                                        values["os_minor"][pos],
+                                        values["os_patch"][pos],
+                                        values["os_patch_minor"][pos])
+                            if v is not None)
+            self.assertEqual(version, agent.os_version_tuple)
+
+    def test_columns_out_of_range(self):
+        string = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/"
+                  "537.36 (KHTML, like Gecko) Chrome/99999999999999999999.0."
+                  "9223372036854775807.0 Safari/537.36")
+        agent = UserAgent(string)
+        self.assertGreater(agent.browser_version_tuple[0], arrow._INT64_MAX)
+
+        values = arrow.columns([agent])
+        self.assertIsNone(values["browser_major"][0])
+        self.assertEqual(values["browser_minor"][0], 0)
+        self.assertEqual(values["browser_patch"][0], arrow._INT64_MAX)
+
+    def test_missing_pyarrow(self):
+        with mock.patch.dict(sys.modules, {"pyarrow": None}), \
+                mock.patch.object(arrow, "_PYARROW", None):
+            self.assertFalse(arrow.available())
+            with self.assertRaisesRegex(ImportError, "simple-useragent"):
+                arrow.ArrowWriter(io.BytesIO())
+
+            stderr = io.StringIO()
+            with redirect_stderr(stderr), self.assertRaises(SystemExit):
+                cli.main(["parse", "--format", "parquet", "-o", "out"])
+            self.assertIn("pyarrow", stderr.getvalue())
+
+    def test_unknown_format(self):
+        self.require_pyarrow()
+        with self.assertRaises(ValueError):
+            arrow.ArrowWriter(io.BytesIO(), output_format="feather")
+
+    def check_table(self, table):
+        self.assertEqual(table.num_rows, len(self.agents))
+        self.assertEqual(table.column_names, list(arrow.COLUMNS))
+        self.assertEqual(table.column("browser").to_pylist(),
+                         [agent.browser for agent in self.agents])
+        self.assertEqual(table.column("os").to_pylist(),
+                         [agent.os for agent in self.agents])
+        self.assertEqual(table.column("fingerprint").to_pylist(),
+                         [agent.fingerprint for agent in self.agents])
+
+    def test_parquet_round_trip(self):
+        self.require_pyarrow()
+        import pyarrow.parquet as pq
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp, "agents.parquet")
+            rows = arrow.write(iter(self.agents), str(path), batch_size=7)
+            self.assertEqual(rows, len(self.agents))
+
+            reader = pq.ParquetFile(path)
+            self.assertGreater(reader.num_row_groups, 1)
+            self.check_table(reader.read())
+
+    def test_ipc_round_trip(self):
+        self.require_pyarrow()
+        import pyarrow as pa
+
+        sink = io.BytesIO()
+        arrow.write(self.agents, sink, output_format="arrow", batch_size=7)
+        self.check_table(pa.ipc.open_stream(sink.getvalue()).read_all())
+
+    def test_cli_parquet(self):
+        self.require_pyarrow()
+        import pyarrow.parquet as pq
+
+        with tempfile.TemporaryDirectory() as tmp:
+            source = pathlib.Path(tmp, "agents.txt")
+            source.write_text("\n".join(self.strings) + "\n")
+            output = pathlib.Path(tmp, "agents.parquet")
+
+            with redirect_stderr(io.StringIO()):
+                code = cli.main(["parse", str(source), "-w", "0",
+                                 "-f", "parquet", "-o", str(output)])
+
+            self.assertEqual(code, 0)
+            self.check_table(pq.read_table(output))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+"""
+test_benchmarks.py: Test the benchmark suite of the simple-useragent package.
+
+This file contains smoke tests for the local stand-in server, the
+synthetic corpus of the benchmarks and the concurrency load test, so
+they keep working offline.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_benchmarks
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from benchmarks import bench, loadtest
+from benchmarks.server import FakeServer
+from simple_useragent import core
+from simple_useragent.core import UserAgents
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_corpus_is_reproducible(self):
+        strings = bench.corpus(100, seed=1)
+        self.assertEqual(len(strings), 100)
+        self.assertEqual(strings, bench.corpus(100, seed=1))
+        self.assertGreater(len(set(strings)), 50)
+
+    def test_refresh_from_fake_server(self):
+        with FakeServer() as server, \
+                tempfile.TemporaryDirectory() as cache_dir, \
+                patch.object(core, "_API_URL", server.url):
+            user_agents = UserAgents(cache_location=cache_dir, max_retries=1)
+            data = user_agents.get_dict(force_cached=False)
+
+            self.assertEqual(server.requests, 2)
+            self.assertTrue(data["desktop"])
+            self.assertTrue(data["mobile"])
+            self.assertTrue(data["cached"])
+
+    def test_stats(self):
+        result = bench.stats([3.0, 1.0, 2.0])
+        self.assertEqual(result["runs"], 3)
+        self.assertEqual(result["min"], 1.0)
+        self.assertEqual(result["median"], 2.0)
+        self.assertEqual(result["max"], 3.0)
+
+    def test_fake_server_injects_errors(self):
+        with FakeServer(failure_rate=0.5, rate_limit_rate=0.5,
+                        seed=1
+                        ) as server:
+            codes = {requests.get(server.url, timeout=5).status_code
+                     for _ in range(20)}
+
+        self.assertEqual(codes, {429, 500})
+        self.assertEqual(server.failures + server.rate_limited, 20)
+
+    def test_loadtest(self):
+        report = loadtest.run(processes=1, threads=2, calls=5)
+
+        self.assertEqual(report["calls"], 10)
+        self.assertEqual(report["errors"], 0)
+        self.assertGreaterEqual(report["upstream"]["requests"], 2)
+        self.assertIn("p99", report["latency"])
+        self.assertIn("corrupt_files_seen", report["corruption"])
+
+    def test_import_is_lazy(self):
+        result = bench.bench_import(1)
+
+        self.assertEqual(result["eager_modules"], [])
+        self.assertEqual(result["runs"], 1)
+
+    def test_bots(self):
+        result = bench.bench_bots(bench.corpus(200), repeat=1)
+
+        # Only the structure, the speedup depends on the machine.
+        self.assertEqual(result["records"], 200)
+        self.assertLessEqual({"classify", "parse", "speedup"}, result.keys())
+        self.assertGreater(result["classify"]["median"], 0)
+        self.assertGreater(result["parse"]["median"], 0)
+        self.assertGreater(result["speedup"], 0)
+
+    def test_parse_templates(self):
+        result = bench.bench_parse_templates(bench.corpus(200), repeat=1)
+
+        self.assertEqual(result["records"], 200)
+        self.assertGreater(result["template_hit_rate"],
+                           result["exact_hit_rate"]
+                           )
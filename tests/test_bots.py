@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+"""
+test_bots.py: Test the pre-parse bot classification of the
+simple-useragent package.
+
+This file contains tests for the verdicts and reason codes of known
+crawlers, headless browsers and HTTP libraries and for the absence of
+false positives on real browser user agents.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_bots
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import json
+import unittest
+
+from simple_useragent import bots, core
+
+
+class TestBots(unittest.TestCase):
+    def test_browsers_are_not_bots(self):
+        with open(core._FALLBACK_JSON, "r") as fh:
+            data = json.load(fh)
+
+        for string in data["desktop"] + data["mobile"] + [
+                "Mozilla/5.0 (Linux; Android 10; Cubot X19) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Mobile Safari/537.36",
+                ]:
+            with self.subTest(string=string):
+                verdict = bots.classify(string)
+                self.assertFalse(verdict)
+                self.assertEqual(verdict, bots.Verdict(False, None, None))
+
+    def test_classify(self):
+        cases = {
+                "Mozilla/5.0 (compatible; Googlebot/2.1; "
+                "+http://www.google.com/bot.html)":
+                    ("crawler", "Googlebot/2.1"),
+                "Mozilla/5.0 (compatible; bingbot/2.0)":
+                    ("crawler", "bingbot/2.0"),
+                "facebookexternalhit/1.1":
+                    ("crawler", "facebookexternalhit/1.1"),
+                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, "
+                "like Gecko) HeadlessChrome/120.0.0.0 Safari/537.36":
+                    ("headless", "HeadlessChrome/120.0.0.0"),
+                "curl/8.4.0": ("library", "curl/8.4.0"),
+                "python-requests/2.31.0":
+                    ("library", "python-requests/2.31.0"),
+                "Java/1.8.0_151": ("library", "Java/1.8.0_151"),
+                "": ("empty", None),
+                "-": ("empty", None),
+                }
+
+        for string, (reason, token) in cases.items():
+            with self.subTest(string=string):
+                verdict = bots.classify(string)
+                self.assertTrue(verdict)
+                self.assertTrue(bots.is_bot(string))
+                self.assertIn(verdict.reason, bots.REASONS)
+                self.assertEqual((verdict.reason, verdict.token),
+                                 (reason, token))
+
+    def test_anchored_tokens(self):
+        self.assertFalse(bots.is_bot("Mozilla/5.0 (Nokia) Java/1.0"))
+        self.assertTrue(bots.is_bot("Ruby"))
+
+    def test_reasons_are_covered(self):
+        # Every literal token is classified with the reason of its list.
+        for reason, tokens in bots._TOKENS.items():
+            for token in tokens:
+                if "\\" in token or "(" in token:
+                    continue
+                with self.subTest(token=token):
+                    self.assertEqual(bots.classify(token.lstrip("^")).reason,
+                                     reason)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+"""
+test_cli.py: Test the command line interface of the simple-useragent
+package.
+
+This file contains tests for the 'parse' subcommand, which streams user
+agent strings or log lines through a worker pool to JSONL or CSV.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_cli
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import csv
+import io
+import json
+import pathlib
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+from simple_useragent import cli, core
+from simple_useragent.core import UserAgent
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        with open(core._FALLBACK_JSON, "r") as fh:
+            data = json.load(fh)
+        self.strings = data["desktop"] + data["mobile"]
+
+        self.input = pathlib.Path(self.tmp.name, "agents.txt")
+        self.input.write_text("\n".join(self.strings * 3) + "\n\n")
+
+    def run_cli(self, *args: str) -> tuple[str, str]:
+        output = pathlib.Path(self.tmp.name, "out")
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            code = cli.main(["parse", *args, "-o", str(output)])
+
+        self.assertEqual(code, 0)
+        return output.read_text(), stderr.getvalue()
+
+    def test_parse_jsonl_ordered(self):
+        for workers in ("0", "2"):
+            with self.subTest(workers=workers):
+                text, summary = self.run_cli(
+                        str(self.input), "-w", workers, "--chunk-size", "7"
+                        )
+                records = [json.loads(line) for line in text.splitlines()]
+
+                self.assertEqual([r["string"] for r in records],
+                                 self.strings * 3)
+                self.assertEqual(records[0]["browser"],
+                                 UserAgent(self.strings[0]).browser)
+                self.assertEqual(set(records[0]), set(cli.FIELDS))
+                self.assertIn(f"{len(records):,} records", summary)
+
+    def test_parse_unordered(self):
+        text, _ = self.run_cli(str(self.input), "-w", "2", "--unordered",
+                               "--chunk-size", "5", "--queue-size", "1"
+                               )
+        strings = [json.loads(line)["string"] for line in text.splitlines()]
+
+        self.assertEqual(sorted(strings), sorted(self.strings * 3))
+
+    def test_parse_csv(self):
+        text, _ = self.run_cli(str(self.input), "-w", "0", "-f", "csv")
+        rows = list(csv.DictReader(io.StringIO(text)))
+
+        self.assertEqual(tuple(rows[0]), cli.FIELDS)
+        self.assertEqual(len(rows), len(self.strings) * 3)
+        self.assertEqual(rows[0]["string"], self.strings[0])
+
+    def test_parse_skip_bots(self):
+        self.input.write_text("\n".join(
+                ["curl/8.4.0", self.strings[0], "Googlebot/2.1"]) + "\n")
+        text, _ = self.run_cli(str(self.input), "-w", "0", "--skip-bots")
+
+        self.assertEqual([json.loads(line)["string"]
+                          for line in text.splitlines()], [self.strings[0]])
+
+    def test_parse_combined_log(self):
+        line = ('127.0.0.1 - - [10/Oct/2026:13:55:36 +0000] "GET / HTTP/1.1" '
+                '200 2326 "-" "{}"\n')
+        self.input.write_text(
+                "".join(line.format(s) for s in self.strings[:3])
+                + line.format("-") + "garbage\n"
+                )
+
+        text, summary = self.run_cli(str(self.input), "-w", "0",
+                                     "--input-format", "combined"
+                                     )
+        strings = [json.loads(line)["string"] for line in text.splitlines()]
+
+        self.assertEqual(strings, self.strings[:3])
+        self.assertIn("5 lines, 3 records", summary)
+
+    def test_extract(self):
+        self.assertEqual(cli._extract("  ua string \n", "ua"), "ua string")
+        self.assertIsNone(cli._extract("\n", "ua"))
+        self.assertEqual(
+                cli._extract('x "GET /" 200 1 "ref" "Mozilla \\"a\\""',
+                             "combined"
+                             ),
+                'Mozilla \\"a\\"',
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,17 +25,26 @@ __status__ = "Development"
 __github__ = "https://github.com/Lennolium/simple-useragent"
 
 # Imports.
+import inspect
 import json
 import os.path
 import pathlib
+import pickle
+import tempfile
 import time
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from requests.models import Response
 import unittest
 from unittest.mock import Mock, patch, mock_open
+from simple_useragent import core, regexes
+from simple_useragent.hashing import stable_hash64
 from simple_useragent.core import (UserAgent, UserAgents,
                                    _FALLBACK_DESKTOP,
-                                   _FALLBACK_MOBILE, user_agent_parser)
+                                   _FALLBACK_MOBILE, _FrozenUserAgent,
+                                   _version_tuple, pack_many, unpack_many,
+                                   user_agent_parser)
 import responses
 
 
@@ -139,7 +148,28 @@ class TestUserAgent(unittest.TestCase):
                 )
         self.assertTrue(self.user_agent.__eq__(ua_same))
         self.assertFalse(self.user_agent.__eq__(ua_diff))
-        self.assertRaises(TypeError, self.user_agent.__eq__, "StringClass")
+        self.assertIs(self.user_agent.__eq__("StringClass"), NotImplemented)
+        self.assertNotEqual(self.user_agent, self.user_agent_string)
+        self.assertIn(ua_same, ["StringClass", 1, None, self.user_agent])
+        self.assertNotIn(ua_diff, ["StringClass", 1, None, self.user_agent])
+
+    def test_hash(self):
+        ua_same = UserAgent(self.user_agent_string)
+        self.assertEqual(hash(ua_same), hash(self.user_agent))
+        self.assertEqual(len({self.user_agent, ua_same}), 1)
+        self.assertEqual({self.user_agent: 1}[ua_same], 1)
+
+    def test_fingerprint(self):
+        self.assertEqual(self.user_agent.fingerprint,
+                         stable_hash64(self.user_agent_string)
+                         )
+        self.assertTrue(0 <= self.user_agent.fingerprint < 2 ** 64)
+        self.assertIsNone(UserAgent('').fingerprint)
+
+        # Stable across processes, machines and PYTHONHASHSEED.
+        self.assertEqual(UserAgent('Mozilla/5.0').fingerprint,
+                         0x124bec85a619bb22
+                         )
 
     def test_getitem(self):
         self.assertEqual(self.user_agent.__getitem__('string'),
@@ -356,6 +386,132 @@ class TestUserAgent(unittest.TestCase):
         user_agent = UserAgent(user_agent_string)
         self.assertEqual(user_agent.os, 'Other')
 
+    def test_version_tuples(self):
+        self.assertEqual(self.user_agent.browser_version_tuple, (110, 0, 1587))
+        self.assertEqual(self.user_agent.os_version_tuple, (10,))
+
+        mac = UserAgent('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+                        'AppleWebKit/605.1.15 (KHTML, like Gecko) '
+                        'Version/17.1 Safari/605.1.15')
+        self.assertEqual(mac.os_version_tuple, (10, 15, 7))
+        self.assertEqual(mac.browser_version_tuple, (17, 1))
+
+        self.assertEqual(UserAgent('').browser_version_tuple, ())
+        self.assertEqual(_version_tuple('120.0b2.1'), (120, 0))
+        self.assertEqual(_version_tuple('beta'), ())
+
+    def test_version_sort(self):
+        agents = [UserAgent(f'Mozilla/5.0 (X11; Linux x86_64) Chrome/{v} '
+                            f'Safari/537.36') for v in ('99.0', '120.0', '9.1')]
+        agents.sort(key=lambda a: a.browser_version_tuple)
+        self.assertEqual([a.browser_version for a in agents],
+                         ['9', '99', '120'])
+
+    def test_version_at_least(self):
+        self.assertTrue(self.user_agent.browser_version_at_least(110))
+        self.assertTrue(self.user_agent.browser_version_at_least(110, 0, 1587))
+        self.assertFalse(self.user_agent.browser_version_at_least(110, 0, 1588))
+        self.assertTrue(self.user_agent.browser_version_at_least('109.9'))
+        self.assertFalse(self.user_agent.browser_version_at_least(111))
+
+        # Missing components count as 0, unknown versions never match.
+        self.assertTrue(self.user_agent.os_version_at_least(10, 0, 0))
+        self.assertFalse(self.user_agent.os_version_at_least(10, 0, 1))
+        self.assertFalse(UserAgent('').os_version_at_least(0))
+
+    def assertSameAgent(self, restored, agent):
+        self.assertEqual(restored.__dict__(), agent.__dict__())
+        self.assertEqual(restored.browser_version_tuple,
+                         agent.browser_version_tuple
+                         )
+        self.assertEqual(restored.os_version_tuple, agent.os_version_tuple)
+        self.assertEqual(restored.fingerprint, agent.fingerprint)
+
+    def test_to_bytes(self):
+        data = self.user_agent.to_bytes()
+        restored = UserAgent.from_bytes(data)
+
+        self.assertIsInstance(data, bytes)
+        self.assertLess(len(data), len(pickle.dumps(
+                self.user_agent.__dict__()
+                )))
+        self.assertIs(type(restored), UserAgent)
+        self.assertSameAgent(restored, self.user_agent)
+
+        # Values, which the header can not represent.
+        custom = UserAgent('Custom/0b2 (Windows NT 10.0) Chrome/08.1 ü')
+        custom['browser'] = 'Custom'
+        custom['mobile'] = 'maybe'
+        custom.os_version_tuple = (1 << 40,)
+        self.assertSameAgent(UserAgent.from_bytes(custom.to_bytes()), custom)
+        self.assertSameAgent(UserAgent.from_bytes(UserAgent('').to_bytes()),
+                             UserAgent('')
+                             )
+
+    def test_from_bytes_with_invalid_data(self):
+        data = self.user_agent.to_bytes()
+
+        for invalid in (data[:-1], data[:10], data + b'\x00',
+                        b'\x09' + data[1:]):
+            with self.assertRaises(ValueError):
+                UserAgent.from_bytes(invalid)
+
+    def test_pickle(self):
+        restored = pickle.loads(pickle.dumps(self.user_agent))
+        self.assertSameAgent(restored, self.user_agent)
+
+        frozen = pickle.loads(pickle.dumps(
+                _FrozenUserAgent(self.user_agent_string)
+                ))
+        self.assertIsInstance(frozen, _FrozenUserAgent)
+        self.assertSameAgent(frozen, self.user_agent)
+        with self.assertRaises(AttributeError):
+            frozen.browser = 'Firefox'
+
+    def test_tokens(self):
+        string = ('Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/120.0.6099.230 Mobile '
+                  'Safari/537.36')
+
+        for user_agent in (UserAgent(string), _FrozenUserAgent(string)):
+            with self.subTest(cls=type(user_agent).__name__):
+                self.assertIs(user_agent.tokens, user_agent.tokens)
+                self.assertEqual(user_agent.engine, 'Blink')
+                self.assertEqual(user_agent.engine_version, '120.0.6099.230')
+                self.assertEqual(user_agent.platform,
+                                 ('Linux', 'Android 14', 'Pixel 8'))
+                self.assertEqual(user_agent.device_model, 'Pixel 8')
+
+        # The cached tokens follow a new string.
+        user_agent = UserAgent(string)
+        user_agent.tokens
+        user_agent.parse('Mozilla/5.0 (Windows NT 10.0; Win64; x64; '
+                         'rv:121.0) Gecko/20100101 Firefox/121.0')
+        self.assertEqual(user_agent.engine, 'Gecko')
+        self.assertIsNone(user_agent.device_model)
+        self.assertEqual(UserAgent(None).tokens, ())
+
+    def test_pack_many(self):
+        agents = [UserAgent(s) for s in _FALLBACK_DESKTOP + _FALLBACK_MOBILE]
+        agents.append(self.user_agent)
+        data = pack_many(agents)
+
+        self.assertEqual(data, b''.join(a.to_bytes() for a in agents))
+        self.assertEqual(pack_many([]), b'')
+        self.assertEqual(list(unpack_many(b'')), [])
+
+        for buffer in (data, bytearray(data), memoryview(data)):
+            restored = unpack_many(buffer)
+            self.assertNotIsInstance(restored, list)
+            restored = list(restored)
+
+            self.assertEqual(len(restored), len(agents))
+            for restored_agent, agent in zip(restored, agents):
+                self.assertSameAgent(restored_agent, agent)
+
+        with self.assertRaises(ValueError):
+            list(unpack_many(data[:-1]))
+
     @patch('simple_useragent.core.UserAgent._UserAgent__parse_mobile')
     def test_parse_with_occurring_exception(self, mock_parse_mobile):
         # Mock the __parse_mobile method to raise an exception
@@ -375,26 +531,28 @@ class TestUserAgent(unittest.TestCase):
         self.assertEqual(self.user_agent.browser_version_minor, '')
         self.assertEqual(self.user_agent.os_version, '')
         self.assertEqual(self.user_agent.os_version_minor, '')
+        self.assertEqual(self.user_agent.browser_version_tuple, ())
 
 
 class TestUserAgents(unittest.TestCase):
     @responses.activate
     def setUp(self):
-        # Cleanup local cache before we start
-        self.test_cache_path = pathlib.Path(os.path.dirname(__file__), "cache")
+        # Use an empty local cache in a temporary folder.
+        self.tmp = tempfile.TemporaryDirectory()
+        self.test_cache_path = pathlib.Path(self.tmp.name)
         self.test_cache_file = pathlib.Path(self.test_cache_path,
                                             "user_agents.json"
                                             )
 
-        if os.path.exists(self.test_cache_file):
-            os.remove(self.test_cache_file)
-
         # Create instance with test cache path.
         self.user_agents = UserAgents(cache_location=str(self.test_cache_path),
                                       timeout=1,
                                       max_retries=1,
                                       )
 
+    def tearDown(self):
+        self.tmp.cleanup()
+
     def test_repr(self):
         expected_repr = (
                 f"UserAgents(max_retries={self.user_agents._max_retries}, "
@@ -447,6 +605,16 @@ class TestUserAgents(unittest.TestCase):
         self.assertIsInstance(result, list)
         self.assertEqual(result, [])
 
+    def test_convert_to_pct(self):
+        response_data = [{"ua": "ua1", "pct": 0.2},
+                         {"ua": "ua2", "pct": 0.1},
+                         {"ua": "ua3", "pct": 0.3}]
+        result = self.user_agents._UserAgents__convert_to_pct(response_data)
+        self.assertEqual(result, [0.3, 0.2, 0.1])
+
+        result = self.user_agents._UserAgents__convert_to_pct([{"ua": "ua"}])
+        self.assertEqual(result, [])
+
     def test_convert_to_list_with_incorrect_data(self):
         response_data = [{"wrong": "SampleValue",
                           "key": "SampleValue"
@@ -493,8 +661,8 @@ class TestUserAgents(unittest.TestCase):
                                                mock_fallback
                                                ):
         result = self.user_agents.get_dict()
-        expected_result = {"desktop": _FALLBACK_DESKTOP,
-                           "mobile": _FALLBACK_MOBILE
+        expected_result = {"desktop": tuple(_FALLBACK_DESKTOP),
+                           "mobile": tuple(_FALLBACK_MOBILE)
                            }
         self.assertEqual(result, expected_result)
 
@@ -698,8 +866,8 @@ class TestUserAgents(unittest.TestCase):
                                  "mobile": ["Mozilla/5.0"]
                                  }
         result = self.user_agents.get_dict()
-        self.assertEqual(result, {"desktop": ["Mozilla/5.0"],
-                                  "mobile": ["Mozilla/5.0"]
+        self.assertEqual(result, {"desktop": ("Mozilla/5.0",),
+                                  "mobile": ("Mozilla/5.0",)
                                   }
                          )
 
@@ -710,8 +878,8 @@ class TestUserAgents(unittest.TestCase):
                                    "mobile": ["Mozilla/5.0"]
                                    }
         result = self.user_agents.get_dict(force_cached=True)
-        self.assertEqual(result, {"desktop": ["Mozilla/5.0"],
-                                  "mobile": ["Mozilla/5.0"]
+        self.assertEqual(result, {"desktop": ("Mozilla/5.0",),
+                                  "mobile": ("Mozilla/5.0",)
                                   }
                          )
         mock_api.assert_not_called()
@@ -724,8 +892,8 @@ class TestUserAgents(unittest.TestCase):
         result = self.user_agents.get_dict(force_cached=True)
 
         # Check that the result is the fallback user agents
-        self.assertEqual(result, {"desktop": _FALLBACK_DESKTOP,
-                                  "mobile": _FALLBACK_MOBILE
+        self.assertEqual(result, {"desktop": tuple(_FALLBACK_DESKTOP),
+                                  "mobile": tuple(_FALLBACK_MOBILE)
                                   }
                          )
 
@@ -771,8 +939,8 @@ class TestUserAgents(unittest.TestCase):
         result = self.user_agents.get_dict(force_cached=True)
 
         # Check that the result is the mocked user agents
-        self.assertEqual(result, {"desktop": ["Mozilla/5.0"],
-                                  "mobile": ["Mozilla/5.0"]
+        self.assertEqual(result, {"desktop": ("Mozilla/5.0",),
+                                  "mobile": ("Mozilla/5.0",)
                                   }
                          )
 
@@ -792,6 +960,37 @@ class TestUserAgents(unittest.TestCase):
         # Check that the result is the fallback user agents
         self.assertEqual(result, "fake_cached_return_data")
 
+    # Test get_dict and get_list return shared, read-only views.
+    @patch.object(UserAgents, '_UserAgents__useragents_cached')
+    @patch.object(UserAgents, '_UserAgents__check_cached', return_value=True)
+    def test_get_dict_and_get_list_are_read_only(self, mock_check_cached,
+                                                 mock_cache
+                                                 ):
+        mock_cache.return_value = {"desktop": ["ua1", "ua2", "ua3"],
+                                   "mobile": ["ua4"],
+                                   "cached": int(time.time())
+                                   }
+        result1 = self.user_agents.get_dict()
+        result2 = self.user_agents.get_dict()
+
+        self.assertIs(result1, result2)
+        self.assertEqual(result1["desktop"], ("ua1", "ua2", "ua3"))
+        with self.assertRaises(TypeError):
+            result1["desktop"] = []
+        with self.assertRaises(AttributeError):
+            result1["desktop"].append("ua5")
+
+        # The internal cache is not affected by the callers.
+        self.assertEqual(self.user_agents._user_agents_cached["desktop"],
+                         ["ua1", "ua2", "ua3"]
+                         )
+
+        self.assertIs(self.user_agents.get_list(), result1["desktop"])
+        self.assertIs(self.user_agents.get_list(num=2),
+                      self.user_agents.get_list(num=2)
+                      )
+        self.assertEqual(self.user_agents.get_list(num=2), ("ua1", "ua2"))
+
     # Test shuffle of get_list method.
     def test_get_list_shuffle(self):
         with patch.object(UserAgents, 'get_dict') as mock_get_dict:
@@ -831,6 +1030,360 @@ class TestUserAgents(unittest.TestCase):
                                 [ua.string for ua in result4]
                                 )
 
+    # Test attribute filters of get and get_list methods.
+    def test_get_with_filters(self):
+        with patch.object(UserAgents, 'get_dict') as mock_get_dict:
+            with open(pathlib.Path(os.path.dirname(__file__), "..", "src",
+                                   "simple_useragent", "data",
+                                   "fallback.json"
+                                   ), 'r') as fh:
+                mock_get_dict.return_value = json.load(fh)
+
+            result = self.user_agents.get(browser="Chrome", os="Windows",
+                                          min_browser_version=110, num=5
+                                          )
+            self.assertGreater(len(result), 0)
+            self.assertLessEqual(len(result), 5)
+            for ua in result:
+                self.assertEqual(ua.browser, "Chrome")
+                self.assertEqual(ua.os, "Windows")
+                self.assertGreaterEqual(int(ua.browser_version), 110)
+
+            # Same result as filtering all parsed user agents by hand.
+            expected = tuple(ua.string for ua in self.user_agents.get()
+                             if ua.browser == "Firefox")
+            self.assertEqual(self.user_agents.get_list(browser="firefox"),
+                             expected
+                             )
+
+            result = self.user_agents.get(os="iOS", mobile=True)
+            self.assertGreater(len(result), 0)
+            for ua in result:
+                self.assertEqual(ua.os, "iOS")
+
+            result = self.user_agents.get_list(min_browser_version=10000)
+            self.assertEqual(result, ())
+            result = self.user_agents.get_list(browser="Unknown",
+                                               shuffle=True
+                                               )
+            self.assertEqual(result, ())
+            result = self.user_agents.get_list(min_browser_version="invalid")
+            self.assertEqual(result, ())
+
+    # Test only indexed filter values are memorized.
+    def test_selections_are_bounded(self):
+        pool = core._Pool({"desktop": _FALLBACK_DESKTOP,
+                           "mobile": _FALLBACK_MOBILE})
+        pool.select("desktop", browser="Chrome")
+        count = len(pool._selections)
+
+        for i in range(100):
+            self.assertEqual(pool.select("desktop", browser=f"x{i}"), ((), ()))
+            self.assertEqual(pool.select("desktop", os=f"x{i}", num=1),
+                             ((), ())
+                             )
+            self.assertEqual(
+                    pool.select("desktop", min_browser_version=10000 + i),
+                    ((), ())
+                    )
+
+        self.assertEqual(len(pool._selections), count)
+
+        # Equal queries share one selection.
+        self.assertIs(pool.select("desktop", browser="chrome"),
+                      pool.select("desktop", browser="CHROME")
+                      )
+        self.assertIs(pool.select("desktop", min_browser_version=1),
+                      pool.select("desktop", min_browser_version=2)
+                      )
+
+    # Test get returns pre-built, shared and read-only instances.
+    def test_get_returns_shared_instances(self):
+        with patch.object(UserAgents, 'get_dict') as mock_get_dict:
+            mock_get_dict.return_value = {
+                    "desktop": _FALLBACK_DESKTOP * 3,
+                    "mobile": _FALLBACK_MOBILE,
+                    }
+
+            with patch('simple_useragent.core.UserAgent.parse') as mock_parse:
+                self.user_agents.get()
+                parse_count = mock_parse.call_count
+                self.user_agents.get()
+                self.user_agents.get(num=1, shuffle=True)
+                self.assertEqual(mock_parse.call_count, parse_count)
+
+        with patch.object(UserAgents, 'get_dict') as mock_get_dict:
+            mock_get_dict.return_value = {
+                    "desktop": _FALLBACK_DESKTOP,
+                    "mobile": _FALLBACK_MOBILE,
+                    }
+            result1 = self.user_agents.get(num=1)[0]
+            result2 = self.user_agents.get(num=1)[0]
+
+        self.assertIs(result1, result2)
+        self.assertIsInstance(result1, UserAgent)
+        self.assertEqual(repr(result1), f"UserAgent('{_FALLBACK_DESKTOP[0]}')")
+        self.assertEqual(result1, UserAgent(_FALLBACK_DESKTOP[0]))
+        self.assertEqual(UserAgent(_FALLBACK_DESKTOP[0]), result1)
+
+        # Shared instances can not be modified.
+        with self.assertRaises(AttributeError):
+            result1.browser = "Firefox"
+        self.assertRaises(AttributeError, result1.__setitem__, "os", "iOS")
+        self.assertRaises(AttributeError, result1.__delitem__, "os")
+        self.assertRaises(AttributeError, result1.parse, _FALLBACK_MOBILE[0])
+        self.assertEqual(result1.string, _FALLBACK_DESKTOP[0])
+
+    # Test batch sampling of sample_indices method.
+    def test_sample_indices(self):
+        with patch.object(UserAgents, 'get_dict') as mock_get_dict:
+            mock_get_dict.return_value = {
+                    "desktop": [f"ua_desktop{i}" for i in range(45)],
+                    "mobile": [f"ua_mobile{i}" for i in range(23)],
+                    }
+
+            indices, table = self.user_agents.sample_indices(1000, seed=1)
+            self.assertEqual(len(indices), 1000)
+            self.assertEqual(table, tuple(f"ua_desktop{i}"
+                                          for i in range(45))
+                             )
+            self.assertTrue(all(0 <= i < 45 for i in indices))
+
+            indices, table = self.user_agents.sample_indices(100, mobile=True)
+            self.assertEqual(len(indices), 100)
+            self.assertTrue(table[indices[0]].startswith("ua_mobile"))
+
+            indices, _ = self.user_agents.sample_indices(-1)
+            self.assertEqual(len(indices), 0)
+            indices, _ = self.user_agents.sample_indices("invalid")
+            self.assertEqual(len(indices), 0)
+
+    # Test the variant stream of generate method.
+    def test_generate(self):
+        with patch.object(UserAgents, 'get_dict') as mock_get_dict:
+            mock_get_dict.return_value = {
+                    "desktop": list(_FALLBACK_DESKTOP),
+                    "mobile": list(_FALLBACK_MOBILE),
+                    }
+
+            variants = self.user_agents.generate(1000, seed=1)
+            self.assertNotIsInstance(variants, list)
+            variants = list(variants)
+            self.assertEqual(len(variants), 1000)
+            self.assertEqual(variants,
+                             list(self.user_agents.generate(1000, seed=1)))
+            self.assertGreater(len(set(variants)), len(_FALLBACK_DESKTOP))
+
+            mobile = next(self.user_agents.generate(mobile=True, seed=1))
+            self.assertTrue(UserAgent(mobile).mobile)
+
+            self.assertEqual(list(self.user_agents.generate(-1)), [])
+            self.assertEqual(list(self.user_agents.generate("invalid")), [])
+
+    # Test that the regexes are only persisted in the cache location.
+    def test_persist_regexes(self):
+        cache_file = pathlib.Path(
+                self.test_cache_path,
+                f"ua_regexes-v{regexes.FORMAT_VERSION}.json"
+                )
+
+        with patch.object(core, "_REGEX_SET", None), \
+                patch.object(UserAgents, 'get_dict') as mock_get_dict:
+            mock_get_dict.return_value = {
+                    "desktop": list(_FALLBACK_DESKTOP),
+                    "mobile": list(_FALLBACK_MOBILE),
+                    }
+
+            core._parse(_FALLBACK_DESKTOP[0])
+            self.assertIsNone(core._REGEX_SET.cache_location)
+            self.assertFalse(cache_file.exists())
+
+            self.user_agents.get()
+            self.assertEqual(core._REGEX_SET.cache_location,
+                             str(self.test_cache_path))
+            self.assertTrue(cache_file.exists())
+
+    # Test the precomputed header bundles of get_headers method.
+    def test_get_headers(self):
+        with patch.object(UserAgents, 'get_dict') as mock_get_dict:
+            mock_get_dict.return_value = {
+                    "desktop": list(_FALLBACK_DESKTOP),
+                    "mobile": list(_FALLBACK_MOBILE),
+                    }
+
+            headers = self.user_agents.get_headers()
+            self.assertIsInstance(headers, MappingProxyType)
+            self.assertIn(headers["User-Agent"], _FALLBACK_DESKTOP)
+            with self.assertRaises(TypeError):
+                headers["User-Agent"] = "changed"
+
+            # The bundles are built once and shared.
+            sticky = self.user_agents.get_headers(key="example.com")
+            self.assertIs(sticky,
+                          self.user_agents.get_headers(key="example.com"))
+            self.assertEqual(
+                    sticky["User-Agent"],
+                    self.user_agents.get_sticky("example.com").string,
+                    )
+
+            mobile = self.user_agents.get_headers(mobile=True)
+            self.assertIn(mobile["User-Agent"], _FALLBACK_MOBILE)
+            if "Sec-CH-UA-Mobile" in mobile:
+                self.assertEqual(mobile["Sec-CH-UA-Mobile"], "?1")
+
+            german = self.user_agents.get_headers(key="example.com",
+                                                  language="de-DE")
+            self.assertEqual(german["Accept-Language"].split(",")[0],
+                             "de-DE")
+
+    # Test the explicit refreshes without auto_refresh.
+    def test_auto_refresh(self):
+        data = {"desktop": _FALLBACK_DESKTOP, "mobile": _FALLBACK_MOBILE,
+                "cached": int(time.time()) - 10}
+        fresh = {**data, "cached": int(time.time())}
+        user_agents = UserAgents(cache_location=str(self.test_cache_path),
+                                 cache_duration=5, auto_refresh=False)
+        self.assertIsNone(user_agents.pool_age)
+
+        with patch.object(
+                UserAgents, '_UserAgents__useragents_api',
+                side_effect=[data, fresh]
+                ) as mock_api:
+            user_agents.get_dict()
+            self.assertEqual(user_agents.pool_age, 10)
+
+            # Outdated, but only refresh() refreshes.
+            user_agents.get_dict()
+            self.assertEqual(mock_api.call_count, 1)
+            user_agents.refresh()
+            self.assertEqual(mock_api.call_count, 2)
+            self.assertEqual(user_agents.pool_age, 0)
+
+        # The file cache is written atomically.
+        self.assertFalse(list(self.test_cache_path.glob("*.tmp")))
+        with open(self.test_cache_file, "r") as fh:
+            self.assertEqual(json.load(fh), fresh)
+
+    # Test a failed refresh keeps the user agents in memory.
+    def test_refresh_keeps_pool(self):
+        data = {"desktop": ["ua1"], "mobile": ["ua2"],
+                "cached": int(time.time()) - 10}
+        user_agents = UserAgents(cache_location=str(self.test_cache_path),
+                                 cache_duration=5, auto_refresh=False)
+        seen = []
+
+        def api():
+            # Other threads still see the old user agents meanwhile.
+            seen.append(user_agents._user_agents_cached)
+            return None
+
+        with patch.object(UserAgents, '_UserAgents__useragents_api',
+                          side_effect=[data]
+                          ):
+            view = user_agents.get_dict()
+
+        with patch.object(UserAgents, '_UserAgents__useragents_api',
+                          side_effect=api
+                          ), \
+                patch.object(UserAgents,
+                             '_UserAgents__fallback') as mock_fallback:
+            self.assertIs(user_agents.refresh(), view)
+
+        self.assertEqual(seen, [data])
+        self.assertIs(user_agents._user_agents_cached, data)
+        mock_fallback.assert_not_called()
+
+    # Test the cached attribute values of attribute_values.
+    def test_attribute_values(self):
+        agent = UserAgent(_FALLBACK_DESKTOP[0])
+        values = core.attribute_values(_FALLBACK_DESKTOP[0])
+
+        self.assertEqual(dict(zip(core._ATTRIBUTES, values)),
+                         agent.__dict__())
+        self.assertIs(core.attribute_values(_FALLBACK_DESKTOP[0]), values)
+
+    # Test the pool is reused, if unchanged data is loaded again.
+    def test_pool_reused_for_unchanged_data(self):
+        # Hard-coded fallback (no file cache).
+        with patch('simple_useragent.core.UserAgent.parse') as mock_parse:
+            result = self.user_agents.get(force_cached=True)
+            parse_count = mock_parse.call_count
+            pool = self.user_agents._pool
+
+            for _ in range(4):
+                self.assertEqual(self.user_agents.get(force_cached=True),
+                                 result)
+            self.assertIs(self.user_agents._pool, pool)
+            self.assertEqual(mock_parse.call_count, parse_count)
+
+        # Stale file cache, which is loaded again on every call.
+        with open(self.test_cache_file, "w") as fh:
+            json.dump({"desktop": _FALLBACK_DESKTOP * 2,
+                       "mobile": _FALLBACK_MOBILE, "cached": 0}, fh)
+
+        self.user_agents.get(force_cached=True)
+        pool = self.user_agents._pool
+        self.user_agents.get(force_cached=True)
+        self.assertIs(self.user_agents._pool, pool)
+
+        # Changed data builds a new pool.
+        with open(self.test_cache_file, "w") as fh:
+            json.dump({"desktop": _FALLBACK_DESKTOP,
+                       "mobile": _FALLBACK_MOBILE, "cached": 1}, fh)
+        self.user_agents.get(force_cached=True)
+        self.assertIsNot(self.user_agents._pool, pool)
+
+    # Test sticky assignment of get_sticky method.
+    def test_get_sticky(self):
+        with patch.object(UserAgents, 'get_dict') as mock_get_dict:
+            mock_get_dict.return_value = {
+                    "desktop": [f"ua_desktop{i}" for i in range(45)],
+                    "mobile": [f"ua_mobile{i}" for i in range(23)],
+                    "pct": {"desktop": [45 - i for i in range(45)],
+                            "mobile": [23 - i for i in range(23)]}
+                    }
+
+            result1 = self.user_agents.get_sticky("example.com")
+            result2 = self.user_agents.get_sticky("example.com")
+            result3 = self.user_agents.get_sticky("example.com", mobile=True)
+
+            self.assertIsInstance(result1, UserAgent)
+            self.assertEqual(result1, result2)
+            self.assertTrue(result3.string.startswith("ua_mobile"))
+
+            # A new instance (or process) assigns the same user agent.
+            other = UserAgents(cache_location=str(self.test_cache_path))
+            self.assertEqual(other.get_sticky("example.com"), result1)
+
+    def test_get_sticky_without_pct(self):
+        with patch.object(UserAgents, 'get_dict') as mock_get_dict:
+            mock_get_dict.return_value = {
+                    "desktop": [f"ua_desktop{i}" for i in range(45)],
+                    "mobile": [f"ua_mobile{i}" for i in range(23)],
+                    }
+            assigned = {self.user_agents.get_sticky(f"key{i}").string
+                        for i in range(500)}
+
+            self.assertGreater(len(assigned), 10)
+            self.assertIn("ua_desktop0", assigned)
+
+    # Test the usage percentages are only exported by export_dict.
+    def test_export_dict(self):
+        data = {"desktop": ["ua1", "ua2"], "mobile": ["ua3"],
+                "cached": int(time.time()), "snapshot": 1,
+                "pct": {"desktop": [60.0, 40.0], "mobile": [100.0]}}
+        with patch.object(UserAgents, '_UserAgents__useragents_cached',
+                          return_value=data
+                          ):
+            view = self.user_agents.get_dict()
+            export = self.user_agents.export_dict()
+
+        self.assertEqual(view.keys(), {"desktop", "mobile", "cached"})
+        self.assertEqual(export.keys(), {"desktop", "mobile", "cached", "pct"})
+        self.assertEqual(export["pct"]["desktop"], (60.0, 40.0))
+        self.assertIs(export["desktop"], view["desktop"])
+        self.assertIs(self.user_agents.export_dict(), export)
+
     # Test all public methods of the module with correct data.
     def test_user_agents_are_returned_in_correct_format(self):
 
@@ -866,13 +1419,13 @@ class TestUserAgents(unittest.TestCase):
             self.assertEqual(ua2.mobile, True)
 
         # List.
-        self.assertIsInstance(result_list1, list)
+        self.assertIsInstance(result_list1, tuple)
         self.assertIsInstance(result_list1[0], str)
         self.assertEqual(len(result_list1), 1)
-        self.assertIsInstance(result_list2, list)
+        self.assertIsInstance(result_list2, tuple)
         self.assertIsInstance(result_list2[0], str)
         self.assertEqual(len(result_list2), 2)
-        self.assertIsInstance(result_list3, list)
+        self.assertIsInstance(result_list3, tuple)
         self.assertIsInstance(result_list3[0], str)
         self.assertGreaterEqual(len(result_list3), 10)
         self.assertEqual(len(result_list4), 20)
@@ -880,11 +1433,39 @@ class TestUserAgents(unittest.TestCase):
 
         # Dict (as get and get_list are getting the data from get_dict,
         # we do not test it as much).
-        self.assertIsInstance(result_dict, dict)
+        self.assertIsInstance(result_dict, Mapping)
         self.assertEqual(len(result_dict), 3)
         self.assertEqual(result_dict.keys(), {"desktop", "mobile", "cached"})
-        self.assertIsInstance(result_dict["desktop"], list)
+        self.assertIsInstance(result_dict["desktop"], tuple)
         self.assertIsInstance(result_dict["desktop"][0], str)
-        self.assertIsInstance(result_dict["mobile"], list)
+        self.assertIsInstance(result_dict["mobile"], tuple)
         self.assertIsInstance(result_dict["mobile"][0], str)
         self.assertIsInstance(result_dict["cached"], int)
+
+    def test_convenience_functions(self):
+        for name in ("get_list", "get_dict", "get", "get_headers"):
+            function = getattr(core, name)
+            method = getattr(UserAgents, name)
+            parameters = list(inspect.signature(method).parameters.values())
+
+            self.assertEqual(
+                    list(inspect.signature(function).parameters.values()),
+                    parameters[1:],
+                    )
+            self.assertEqual(function.__doc__, method.__doc__)
+
+        instance = Mock()
+        with patch.object(core, "_default_user_agents",
+                          return_value=instance
+                          ):
+            core.get_list(2, mobile=True)
+            core.get_headers(key="abc")
+
+        instance.get_list.assert_called_once_with(
+                num=2, mobile=True, shuffle=False, force_cached=None,
+                browser=None, os=None, min_browser_version=None,
+                )
+        instance.get_headers.assert_called_once_with(
+                mobile=False, key="abc", language=core.DEFAULT_LANGUAGE,
+                force_cached=None,
+                )
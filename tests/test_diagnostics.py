@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+"""
+test_diagnostics.py: Test the memory diagnostics of the simple-useragent
+package.
+
+This file contains tests for the retained memory report per subsystem
+and the tracemalloc probes. The user agents are served by the local
+stand-in server, so the tests run offline.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_diagnostics
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from benchmarks.server import FakeServer
+from simple_useragent import core, diagnostics
+from simple_useragent.core import UserAgent, UserAgents
+
+
+class TestDiagnostics(unittest.TestCase):
+    def test_memory_report(self):
+        with FakeServer() as server, \
+                tempfile.TemporaryDirectory() as cache_dir, \
+                patch.object(core, "_API_URL", server.url):
+            user_agents = UserAgents(cache_location=cache_dir, max_retries=1)
+            empty = diagnostics.memory_report(user_agents)
+            user_agents.get()
+            report = diagnostics.memory_report(user_agents)
+
+        self.assertEqual(empty["parsed_records"], 0)
+        self.assertGreater(report["parsed_records"], 0)
+        for name in ("parsed_objects", "pool", "memory_cache", "regex_set",
+                     "ua_parser"):
+            self.assertIn(name, report["subsystems"])
+        self.assertGreater(report["subsystems"]["parsed_objects"], 0)
+        self.assertGreater(report["subsystems"]["pool"], 0)
+        self.assertEqual(report["total"], sum(report["subsystems"].values()))
+
+    def test_register_cache(self):
+        data = {"key": "value" * 100}
+        diagnostics.register_cache("test_cache", lambda: data)
+        self.addCleanup(diagnostics._CACHES.pop, "test_cache")
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            report = diagnostics.memory_report(
+                    UserAgents(cache_location=cache_dir)
+                    )
+
+        self.assertGreaterEqual(
+                report["subsystems"]["test_cache"],
+                diagnostics.deep_sizeof(data),
+                )
+
+    def test_deep_sizeof_counts_shared_objects_once(self):
+        shared = "x" * 10000
+        single = diagnostics.deep_sizeof([shared])
+        double = diagnostics.deep_sizeof([shared, shared])
+        self.assertLess(double - single, 100)
+
+        seen = set()
+        diagnostics.deep_sizeof(shared, seen)
+        self.assertLess(diagnostics.deep_sizeof([shared], seen), 100)
+
+    def test_trace_memory(self):
+        with diagnostics.trace_memory(top=3) as report:
+            agents = [UserAgent(s) for s in core._FALLBACK_DESKTOP]
+
+        self.assertTrue(agents)
+        self.assertGreater(report["net"], 0)
+        self.assertGreaterEqual(report["peak"], report["net"])
+        self.assertLessEqual(len(report["top"]), 3)
+        self.assertEqual(set(report["top"][0]), {"site", "size", "count"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+"""
+test_hashing.py: Test the stable hashing of the simple-useragent package.
+
+This file contains the test cases for the stable 64-bit hash function
+and the consistent HashRing class, which is used to assign the same
+user agent to the same key in every process.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_hashing
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import collections
+import unittest
+
+from simple_useragent.hashing import HashRing, stable_hash64
+
+
+class TestStableHash(unittest.TestCase):
+    def test_stable_hash64_is_deterministic(self):
+        # Fixed values, must never change between releases or processes.
+        self.assertEqual(stable_hash64("example.com"), 0x13c51305c1cf2666)
+        self.assertEqual(stable_hash64(b"example.com"), 0x13c51305c1cf2666)
+        self.assertEqual(stable_hash64(""), 0xe4a6a0577479b2b4)
+        self.assertNotEqual(stable_hash64("example.com"),
+                            stable_hash64("example.org")
+                            )
+
+    def test_stable_hash64_range(self):
+        for key in ("", "a", "Mozilla/5.0", "ä" * 100):
+            self.assertGreaterEqual(stable_hash64(key), 0)
+            self.assertLess(stable_hash64(key), 2 ** 64)
+
+
+class TestHashRing(unittest.TestCase):
+    def setUp(self):
+        self.nodes = [f"ua{i}" for i in range(10)]
+        self.ring = HashRing(self.nodes)
+
+    def test_get_is_sticky(self):
+        for i in range(100):
+            key = f"session-{i}"
+            self.assertEqual(self.ring.get(key), self.ring.get(key))
+            self.assertEqual(self.ring.get(key),
+                             HashRing(self.nodes).get(key)
+                             )
+
+    def test_get_covers_all_nodes(self):
+        assigned = {self.ring.get(f"key-{i}") for i in range(2000)}
+        self.assertEqual(assigned, set(self.nodes))
+
+    def test_weights(self):
+        weights = [50.0] + [1.0] * 9
+        ring = HashRing(self.nodes, weights)
+        counts = collections.Counter(ring.get(f"key-{i}")
+                                     for i in range(5000)
+                                     )
+        self.assertGreater(counts["ua0"], 2500)
+
+    def test_refresh_moves_few_keys(self):
+        keys = [f"key-{i}" for i in range(2000)]
+        before = [self.ring.get(key) for key in keys]
+
+        # Replace a single user agent of the pool.
+        nodes = self.nodes[:-1] + ["ua_new"]
+        after = [HashRing(nodes).get(key) for key in keys]
+
+        moved = sum(1 for b, a in zip(before, after) if b != a)
+        self.assertLess(moved, len(keys) * 0.25)
+        # Only keys of the removed or the added user agent move.
+        for b, a in zip(before, after):
+            if b != a:
+                self.assertTrue(b == "ua9" or a == "ua_new")
+
+    def test_invalid_input(self):
+        self.assertRaises(ValueError, HashRing, self.nodes, [1.0])
+        self.assertRaises(LookupError, HashRing([]).get, "key")
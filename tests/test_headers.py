@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+"""
+test_headers.py: Test the request header bundles of the simple-useragent
+package.
+
+This file contains tests for the GREASE brand order of the client hints
+and the consistent header sets of Chromium, Firefox, Safari and other
+clients.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_headers
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import unittest
+
+from simple_useragent import headers
+from simple_useragent.core import UserAgent
+
+CHROME = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+          "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36")
+EDGE = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 "
+        "Edg/120.0.2210.91")
+ANDROID = ("Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, "
+           "like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36")
+FIREFOX = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) "
+           "Gecko/20100101 Firefox/121.0")
+SAFARI = ("Mozilla/5.0 (iPhone; CPU iPhone OS 17_2 like Mac OS X) "
+          "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 "
+          "Mobile/15E148 Safari/604.1")
+
+
+class TestHeaders(unittest.TestCase):
+    def test_client_hint_brands(self):
+        # The values of real Chrome releases.
+        self.assertEqual(
+                headers.client_hint_brands(119, "Google Chrome"),
+                '"Google Chrome";v="119", "Chromium";v="119", '
+                '"Not?A_Brand";v="24"',
+                )
+        self.assertEqual(
+                headers.client_hint_brands(120, "Google Chrome"),
+                '"Not_A Brand";v="8", "Chromium";v="120", '
+                '"Google Chrome";v="120"',
+                )
+        self.assertEqual(
+                headers.client_hint_brands(124, "Google Chrome"),
+                '"Chromium";v="124", "Google Chrome";v="124", '
+                '"Not-A.Brand";v="99"',
+                )
+        self.assertEqual(
+                headers.client_hint_brands(120, "Microsoft Edge", 121),
+                '"Not_A Brand";v="8", "Chromium";v="120", '
+                '"Microsoft Edge";v="121"',
+                )
+        self.assertEqual(headers.client_hint_brands(120),
+                         '"Not_A Brand";v="8", "Chromium";v="120"')
+
+    def test_chromium(self):
+        result = headers.build(UserAgent(CHROME))
+
+        self.assertEqual(result["User-Agent"], CHROME)
+        self.assertIn('"Google Chrome";v="124"', result["Sec-CH-UA"])
+        self.assertEqual(result["Sec-CH-UA-Mobile"], "?0")
+        self.assertEqual(result["Sec-CH-UA-Platform"], '"Windows"')
+        self.assertEqual(result["Accept-Encoding"], "gzip, deflate, br, zstd")
+        self.assertEqual(result["Accept-Language"], "en-US,en;q=0.9")
+        self.assertEqual(list(result)[0], "Sec-CH-UA")
+
+        edge = headers.build(UserAgent(EDGE))
+        self.assertIn('"Microsoft Edge";v="120"', edge["Sec-CH-UA"])
+        self.assertEqual(edge["Accept-Encoding"], "gzip, deflate, br")
+
+        android = headers.build(UserAgent(ANDROID))
+        self.assertEqual(android["Sec-CH-UA-Mobile"], "?1")
+        self.assertEqual(android["Sec-CH-UA-Platform"], '"Android"')
+
+    def test_chromium_without_client_hints(self):
+        old = CHROME.replace("124.0.0.0", "88.0.4324.150")
+        result = headers.build(UserAgent(old))
+
+        self.assertNotIn("Sec-CH-UA", result)
+        self.assertNotIn("Sec-CH-UA-Platform", result)
+        self.assertEqual(list(result)[0], "Upgrade-Insecure-Requests")
+        self.assertIn("Sec-CH-UA",
+                      headers.build(UserAgent(CHROME.replace("124.", "89.")))
+                      )
+
+    def test_firefox(self):
+        result = headers.build(UserAgent(FIREFOX), language="de-DE")
+
+        self.assertEqual(list(result)[0], "User-Agent")
+        self.assertNotIn("Sec-CH-UA", result)
+        self.assertIn("image/avif", result["Accept"])
+        self.assertEqual(result["Accept-Language"], "de-DE,de;q=0.5")
+        self.assertEqual(result["Sec-Fetch-Mode"], "navigate")
+
+    def test_safari(self):
+        result = headers.build(UserAgent(SAFARI))
+
+        self.assertEqual(list(result)[0], "Accept")
+        self.assertNotIn("Sec-CH-UA", result)
+        self.assertNotIn("Upgrade-Insecure-Requests", result)
+        self.assertEqual(result["Accept-Language"], "en-US")
+        self.assertEqual(result["Accept-Encoding"], "gzip, deflate, br")
+
+    def test_other(self):
+        result = headers.build(UserAgent("curl/8.4.0"), language="fr")
+
+        self.assertEqual(set(result), {"User-Agent", "Accept",
+                                       "Accept-Language", "Accept-Encoding"})
+        self.assertEqual(result["Accept-Language"], "fr")
+
+    def test_read_only(self):
+        result = headers.build(UserAgent(CHROME))
+
+        with self.assertRaises(TypeError):
+            result["User-Agent"] = "changed"
+
+        # A copy can be changed.
+        copy = dict(result)
+        copy["Referer"] = "https://example.com/"
+        self.assertNotIn("Referer", result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+"""
+test_hooks.py: Test the lifecycle hooks of the simple-useragent package.
+
+This file contains the test cases for the HookRegistry class and the
+events emitted by the UserAgent and UserAgents classes while fetching,
+caching and parsing user agents.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_hooks
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from requests.models import Response
+
+from simple_useragent.core import UserAgent, UserAgents, _FALLBACK_DESKTOP
+from simple_useragent.hooks import EVENTS, HOOKS, HookRegistry
+
+
+class TestHookRegistry(unittest.TestCase):
+    def setUp(self):
+        self.hooks = HookRegistry()
+        self.payloads = []
+
+    def test_register_and_emit(self):
+        self.assertFalse(self.hooks.active)
+        self.hooks.register("on_cache_hit", self.payloads.append)
+        self.assertTrue(self.hooks.active)
+
+        self.hooks.emit("on_cache_hit", tier="memory")
+        self.hooks.emit("on_parse", string="ua", duration=0.1)
+        self.assertEqual(self.payloads,
+                         [{"event": "on_cache_hit", "tier": "memory"}]
+                         )
+
+    def test_register_as_decorator(self):
+        @self.hooks.register("on_parse")
+        def callback(payload):
+            self.payloads.append(payload)
+
+        self.hooks.emit("on_parse", string="ua", duration=0.1)
+        self.assertEqual(len(self.payloads), 1)
+        self.assertTrue(callable(callback))
+
+    def test_unregister(self):
+        self.hooks.register("on_parse", self.payloads.append)
+        self.hooks.unregister("on_parse", self.payloads.append)
+        self.assertFalse(self.hooks.active)
+
+        self.hooks.emit("on_parse", string="ua", duration=0.1)
+        self.assertEqual(self.payloads, [])
+        self.assertRaises(ValueError, self.hooks.unregister, "on_parse",
+                          self.payloads.append
+                          )
+        self.hooks.unregister("on_parse", self.payloads.append,
+                              missing_ok=True)
+
+    def test_clear(self):
+        for event in EVENTS:
+            self.hooks.register(event, self.payloads.append)
+
+        self.hooks.clear()
+        self.assertFalse(self.hooks.active)
+
+    def test_invalid_input(self):
+        self.assertRaises(ValueError, self.hooks.register, "on_unknown",
+                          self.payloads.append
+                          )
+        self.assertRaises(TypeError, self.hooks.register, "on_parse", 42)
+
+    def test_exception_in_callback_is_logged(self):
+        def broken(payload):
+            raise RuntimeError("broken")
+
+        self.hooks.register("on_parse", broken)
+        self.hooks.register("on_parse", self.payloads.append)
+
+        with self.assertLogs("simple_useragent.hooks", level="WARNING"):
+            self.hooks.emit("on_parse", string="ua", duration=0.1)
+
+        self.assertEqual(len(self.payloads), 1)
+
+
+class TestEmittedEvents(unittest.TestCase):
+    def setUp(self):
+        self.payloads = []
+        for event in EVENTS:
+            HOOKS.register(event, self.payloads.append)
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.user_agents = UserAgents(
+                cache_location=self.tmp.name,
+                timeout=0,
+                max_retries=2,
+                )
+
+    def tearDown(self):
+        HOOKS.clear()
+        self.tmp.cleanup()
+
+    def events(self):
+        return [payload["event"] for payload in self.payloads]
+
+    def test_parse_event(self):
+        UserAgent(_FALLBACK_DESKTOP[0])
+
+        self.assertEqual(self.events(), ["on_parse"])
+        self.assertEqual(self.payloads[0]["string"], _FALLBACK_DESKTOP[0])
+        self.assertGreaterEqual(self.payloads[0]["duration"], 0)
+
+    @patch('requests.get')
+    def test_fetch_events(self, mock_get):
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 500
+        mock_get.return_value = mock_response
+        self.user_agents._UserAgents__response_data('https://example.com')
+
+        self.assertEqual(self.events(), ["on_fetch_start", "on_fetch_end",
+                                         "on_retry"] * 2
+                         )
+        self.assertEqual(self.payloads[1]["status"], 500)
+        self.assertEqual(self.payloads[1]["url"], 'https://example.com')
+        self.assertEqual(self.payloads[4]["attempt"], 2)
+
+        self.payloads.clear()
+        mock_get.side_effect = ConnectionError("offline")
+        self.user_agents._UserAgents__response_data('https://example.com')
+        self.assertIsNone(self.payloads[1]["status"])
+        self.assertIsInstance(self.payloads[1]["error"], ConnectionError)
+
+        self.payloads.clear()
+        mock_get.side_effect = None
+        mock_response.status_code = 429
+        self.user_agents._UserAgents__response_data('https://example.com')
+        self.assertEqual(self.events(), ["on_fetch_start", "on_fetch_end",
+                                         "on_rate_limit"]
+                         )
+
+    @patch.object(UserAgents, '_UserAgents__useragents_api',
+                  return_value=None
+                  )
+    @patch.object(UserAgents, '_UserAgents__useragents_cached',
+                  return_value=None
+                  )
+    def test_refresh_and_fallback_events(self, mock_cache, mock_api):
+        self.user_agents.get_dict()
+
+        self.assertEqual(self.events(), ["on_refresh_start", "on_refresh_end",
+                                         "on_fallback"]
+                         )
+        self.assertFalse(self.payloads[1]["success"])
+        self.assertEqual(self.payloads[2]["tier"], "fallback_file")
+
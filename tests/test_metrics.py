@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+
+"""
+test_metrics.py: Test the metrics of the simple-useragent package.
+
+This file contains the test cases for the MetricsRegistry class and the
+metrics recorded by the UserAgent and UserAgents classes, including the
+snapshot and Prometheus text exports.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_metrics
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import json
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from requests.models import Response
+
+from simple_useragent.core import UserAgent, UserAgents, _FALLBACK_DESKTOP
+from simple_useragent.hooks import HOOKS, HookRegistry
+from simple_useragent.metrics import METRICS, MetricsRegistry
+
+
+def counter(snapshot, name, **labels):
+    for entry in snapshot["counters"].get(name, []):
+        if entry["labels"] == labels:
+            return entry["value"]
+
+    return 0
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry(enabled=True, hooks=HookRegistry())
+
+    def test_disabled_records_nothing(self):
+        registry = MetricsRegistry()
+        registry.inc("test_total")
+        registry.observe("test_seconds", 0.1)
+        self.assertEqual(registry.snapshot(),
+                         {"counters": {}, "histograms": {}}
+                         )
+        self.assertEqual(registry.to_prometheus(), "")
+
+    def test_counters(self):
+        self.registry.inc("test_total", tier="memory")
+        self.registry.inc("test_total", tier="memory")
+        self.registry.inc("test_total", 3, tier="api")
+
+        snapshot = self.registry.snapshot()
+        self.assertEqual(counter(snapshot, "test_total", tier="memory"), 2)
+        self.assertEqual(counter(snapshot, "test_total", tier="api"), 3)
+
+        # Snapshot must be JSON serializable.
+        json.dumps(snapshot)
+
+    def test_histograms(self):
+        self.registry.observe("test_seconds", 0.0002)
+        self.registry.observe("test_seconds", 3.0)
+        self.registry.observe("test_seconds", 100.0)
+
+        histogram = self.registry.snapshot()["histograms"]["test_seconds"][0]
+        self.assertEqual(histogram["count"], 3)
+        self.assertAlmostEqual(histogram["sum"], 103.0002)
+        self.assertEqual(histogram["buckets"]["0.00025"], 1)
+        self.assertEqual(histogram["buckets"]["5.0"], 1)
+        self.assertEqual(histogram["buckets"]["+Inf"], 1)
+
+    def test_to_prometheus(self):
+        self.registry.inc("simple_useragent_cache_hits_total", tier="api")
+        self.registry.observe("simple_useragent_parse_duration_seconds",
+                              0.0002
+                              )
+        text = self.registry.to_prometheus()
+
+        self.assertIn("# TYPE simple_useragent_cache_hits_total counter\n",
+                      text
+                      )
+        self.assertIn('simple_useragent_cache_hits_total{tier="api"} 1\n',
+                      text
+                      )
+        self.assertIn("# TYPE simple_useragent_parse_duration_seconds "
+                      "histogram\n", text
+                      )
+        self.assertIn('simple_useragent_parse_duration_seconds_bucket'
+                      '{le="0.0001"} 0\n', text
+                      )
+        self.assertIn('simple_useragent_parse_duration_seconds_bucket'
+                      '{le="0.00025"} 1\n', text
+                      )
+        self.assertIn('simple_useragent_parse_duration_seconds_bucket'
+                      '{le="+Inf"} 1\n', text
+                      )
+        self.assertIn("simple_useragent_parse_duration_seconds_count 1\n",
+                      text
+                      )
+
+    def test_enable_subscribes_to_hooks(self):
+        hooks = HookRegistry()
+        registry = MetricsRegistry(hooks=hooks)
+        self.assertFalse(hooks.active)
+
+        registry.enable()
+        hooks.emit("on_cache_hit", tier="memory")
+        registry.disable()
+        hooks.emit("on_cache_hit", tier="memory")
+
+        self.assertFalse(hooks.active)
+        self.assertEqual(counter(registry.snapshot(),
+                                 "simple_useragent_cache_hits_total",
+                                 tier="memory"
+                                 ), 1
+                         )
+
+    def test_enable_after_hooks_cleared(self):
+        hooks = HookRegistry()
+        registry = MetricsRegistry(hooks=hooks, enabled=True)
+
+        # Re-enabling registers the removed handlers again, only once.
+        hooks.clear()
+        registry.enable()
+        registry.enable()
+        hooks.emit("on_cache_hit", tier="memory")
+        self.assertEqual(counter(registry.snapshot(),
+                                 "simple_useragent_cache_hits_total",
+                                 tier="memory"
+                                 ), 1
+                         )
+
+        # Disabling tolerates removed handlers.
+        hooks.clear()
+        registry.disable()
+        self.assertFalse(registry.enabled)
+        self.assertFalse(hooks.active)
+
+    def test_reset(self):
+        self.registry.inc("test_total")
+        self.registry.reset()
+        self.assertEqual(self.registry.snapshot()["counters"], {})
+
+
+class TestRecordedMetrics(unittest.TestCase):
+    def setUp(self):
+        METRICS.reset()
+        METRICS.enable()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.user_agents = UserAgents(
+                cache_location=self.tmp.name,
+                timeout=0,
+                max_retries=2,
+                )
+
+    def tearDown(self):
+        METRICS.disable()
+        METRICS.reset()
+        self.tmp.cleanup()
+        self.assertFalse(HOOKS.active)
+
+    def test_parse_metrics(self):
+        UserAgent(_FALLBACK_DESKTOP[0])
+        UserAgent(_FALLBACK_DESKTOP[0])
+
+        snapshot = METRICS.snapshot()
+        self.assertEqual(counter(snapshot, "simple_useragent_parse_total"), 2)
+        self.assertEqual(snapshot["histograms"][
+                             "simple_useragent_parse_duration_seconds"][0][
+                             "count"], 2
+                         )
+
+    @patch('requests.get')
+    def test_fetch_metrics(self, mock_get):
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 500
+        mock_get.return_value = mock_response
+        self.user_agents._UserAgents__response_data('https://example.com')
+
+        mock_response.status_code = 429
+        self.user_agents._UserAgents__response_data('https://example.com')
+
+        snapshot = METRICS.snapshot()
+        self.assertEqual(
+                counter(snapshot, "simple_useragent_fetch_attempts_total"), 3
+                )
+        self.assertEqual(
+                counter(snapshot, "simple_useragent_fetch_retries_total"), 2
+                )
+        self.assertEqual(
+                counter(snapshot, "simple_useragent_fetch_rate_limited_total"),
+                1
+                )
+
+    @patch.object(UserAgents, '_UserAgents__useragents_api',
+                  return_value=None
+                  )
+    @patch.object(UserAgents, '_UserAgents__useragents_cached',
+                  return_value=None
+                  )
+    def test_cache_tier_metrics(self, mock_cache, mock_api):
+        self.user_agents.get_dict()
+
+        # Memory cache of the fallback is too old, but the API fails
+        # again, so it is kept.
+        self.user_agents.get_dict()
+
+        mock_cache.return_value = {"desktop": ["ua1"], "mobile": ["ua2"],
+                                   "cached": int(time.time())
+                                   }
+        self.user_agents.get_dict()
+        self.user_agents.get_dict()
+
+        snapshot = METRICS.snapshot()
+        name = "simple_useragent_cache_hits_total"
+        self.assertEqual(counter(snapshot, name, tier="fallback_file"), 1)
+        self.assertEqual(counter(snapshot, name, tier="file"), 1)
+        self.assertEqual(counter(snapshot, name, tier="memory"), 2)
+        self.assertEqual(snapshot["histograms"][
+                             "simple_useragent_refresh_duration_seconds"][0][
+                             "labels"], {"success": "false"}
+                         )
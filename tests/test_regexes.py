@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+
+"""
+test_regexes.py: Test the persisted regex set of the simple-useragent package.
+
+This file contains the test cases for the RegexSet class, which must
+parse user agents exactly like ua_parser (also from its template cache),
+persist its prepared rules in a versioned file and compile patterns only
+on demand.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_regexes
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import json
+import os.path
+import pathlib
+import random
+import re
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from ua_parser import user_agent_parser
+
+from simple_useragent import regexes
+from simple_useragent.core import _FALLBACK_JSON
+from simple_useragent.regexes import RegexSet
+
+
+def load_user_agents():
+    with open(_FALLBACK_JSON, "r") as fh:
+        data = json.load(fh)
+
+    with open(pathlib.Path(os.path.dirname(__file__), "data",
+                           "fake_website_resp.html"
+                           ), "r") as fh:
+        html = fh.read()
+
+    return (
+            data["desktop"] + data["mobile"]
+            + re.findall(r'"ua": "([^"]+)"', html)
+            + [
+                    "curl/7.64.1",
+                    "Googlebot/2.1 (+http://www.google.com/bot.html)",
+                    "Mozilla/5.0 (compatible; MSIE 10.0; Windows NT 6.2; "
+                    "Trident/6.0)",
+                    "Opera/9.80 (Windows NT 6.1) Presto/2.12.388 "
+                    "Version/12.16",
+                    "Mozilla/5.0 (Linux; U; Android 2.2; en-us; Nexus One "
+                    "Build/FRF91) AppleWebKit/533.1 (KHTML, like Gecko) "
+                    "Version/4.0 Mobile Safari/533.1",
+                    "Dalvik/2.1.0 (Linux; U; Android 9; SM-G960F "
+                    "Build/PPR1.180610.011)",
+                    "UnsupportedBrowser/111.0.0.0",
+                    ]
+    )
+
+
+class TestRegexSet(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.regex_set = RegexSet(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_matches_ua_parser(self):
+        for string in load_user_agents():
+            expected = user_agent_parser.Parse(string)
+            parsed = self.regex_set.parse(string)
+
+            self.assertEqual(parsed["user_agent"], expected["user_agent"],
+                             string
+                             )
+            self.assertEqual(parsed["os"], expected["os"], string)
+
+    def test_compiles_lazily(self):
+        self.regex_set.parse(
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+                )
+        total = len(self.regex_set._user_agent) + len(self.regex_set._os)
+
+        self.assertGreater(self.regex_set.compiled, 0)
+        self.assertLess(self.regex_set.compiled, total / 10)
+
+    def test_persisted_rules_are_reused(self):
+        self.regex_set.parse("curl/7.64.1")
+        cache_file = pathlib.Path(self.tmp.name,
+                                  f"ua_regexes-v{regexes.FORMAT_VERSION}.json"
+                                  )
+        self.assertTrue(cache_file.exists())
+
+        with patch('simple_useragent.regexes._build') as mock_build:
+            regex_set = RegexSet(self.tmp.name)
+            self.assertEqual(regex_set.parse("curl/7.64.1")["user_agent"][
+                                 "family"], "curl"
+                             )
+            mock_build.assert_not_called()
+
+    def test_outdated_rules_are_rebuilt(self):
+        self.regex_set.parse("curl/7.64.1")
+        cache_file = pathlib.Path(self.tmp.name,
+                                  f"ua_regexes-v{regexes.FORMAT_VERSION}.json"
+                                  )
+        with open(cache_file, "r") as fh:
+            data = json.load(fh)
+        data["source"]["size"] = -1
+        with open(cache_file, "w") as fh:
+            json.dump(data, fh)
+
+        with patch('simple_useragent.regexes._build',
+                   wraps=regexes._build
+                   ) as mock_build:
+            RegexSet(self.tmp.name).parse("curl/7.64.1")
+            mock_build.assert_called_once()
+
+    def test_corrupt_rules_are_rebuilt(self):
+        cache_file = pathlib.Path(self.tmp.name,
+                                  f"ua_regexes-v{regexes.FORMAT_VERSION}.json"
+                                  )
+        with open(cache_file, "w") as fh:
+            fh.write('{"format": ')
+
+        parsed = self.regex_set.parse("curl/7.64.1")
+        self.assertEqual(parsed["user_agent"]["family"], "curl")
+
+    def test_in_memory_only(self):
+        regex_set = RegexSet()
+        self.assertEqual(regex_set.parse("curl/7.64.1")["user_agent"][
+                             "family"], "curl"
+                         )
+
+    def test_superseded_rules_are_removed(self):
+        for name in ("ua_regexes-v1.json", "ua_regexes-v1.json.1.tmp",
+                     "user_agents.json"):
+            pathlib.Path(self.tmp.name, name).write_text("{}")
+
+        self.regex_set.parse("curl/7.64.1")
+
+        self.assertEqual(
+                sorted(os.listdir(self.tmp.name)),
+                ["ua_regexes-v1.json.1.tmp",
+                 f"ua_regexes-v{regexes.FORMAT_VERSION}.json",
+                 "user_agents.json"]
+                )
+
+    def test_persist(self):
+        regex_set = RegexSet()
+        regex_set.parse("curl/7.64.1")
+        cache_file = pathlib.Path(self.tmp.name,
+                                  f"ua_regexes-v{regexes.FORMAT_VERSION}.json"
+                                  )
+        self.assertFalse(cache_file.exists())
+
+        # Rules, which were prepared in memory, are written.
+        regex_set.persist(self.tmp.name)
+        self.assertTrue(cache_file.exists())
+
+        # The first cache location wins.
+        with tempfile.TemporaryDirectory() as other:
+            regex_set.persist(other)
+            self.assertEqual(os.listdir(other), [])
+        self.assertEqual(regex_set.cache_location, self.tmp.name)
+
+        # Before the first parse, the rules are loaded from there.
+        with patch('simple_useragent.regexes._build') as mock_build:
+            regex_set = RegexSet()
+            regex_set.persist(self.tmp.name)
+            self.assertEqual(regex_set.parse("curl/7.64.1")["user_agent"][
+                                 "family"], "curl"
+                             )
+            mock_build.assert_not_called()
+
+    def test_literal(self):
+        self.assertEqual(regexes._literal(r"(Chrome)/(\d+)"), "Chrome/")
+        self.assertEqual(regexes._literal(r"^(Luminary)[Stage]+/(\d+) "
+                                          r"CFNetwork"
+                                          ), " CFNetwork"
+                         )
+        self.assertEqual(regexes._literal(r"(?:Edge|Edg)/(\d+)"), "Edg")
+        self.assertEqual(regexes._literal(r"(?:Edge|Chrome)/(\d+)"), "/")
+        self.assertEqual(regexes._literal(r"(Firefox)?/(\d+)"), "/")
+        self.assertEqual(regexes._literal(r"(?i)chrome"), "")
+
+    def test_uniform(self):
+        self.assertEqual(regexes._uniform(r"(Chrome)/(\d+)\.(\d+)"), 2)
+        self.assertEqual(regexes._uniform(r"(Firefox)/([^;)]+)"), 2)
+        self.assertEqual(regexes._uniform(r"^.{0,200}?(\w+)"), 1)
+        self.assertEqual(regexes._uniform(r"(\d+)(\d+)"), 1)
+        self.assertEqual(regexes._uniform(r"(Windows NT 6\.1)"), 0)
+        self.assertEqual(regexes._uniform(r"Android [4-9]"), 0)
+        self.assertEqual(regexes._uniform(r"(\w+)/\1"), 0)
+
+    def test_widened(self):
+        widened = regexes._widened(r"(Windows NT 6\.1)")
+        self.assertTrue(widened.search("Windows NT 7.2"))
+        self.assertFalse(widened.search("Windows NT 10.0"))
+        self.assertTrue(regexes._widened(r"Android [4-9]").search("Android 1"))
+        self.assertIsNone(regexes._widened(r"(\w+)/\1"))
+
+    def test_template_cache_matches_ua_parser(self):
+        rng = random.Random(0)
+
+        def vary(match):
+            return str(int(match[0]) + rng.randint(-3, 3)) \
+                if rng.random() < 0.5 else match[0]
+
+        strings = load_user_agents()
+        strings += [re.sub(r"\d+", vary, s) for s in strings * 3]
+
+        for string in strings:
+            expected = user_agent_parser.Parse(string)
+            parsed = self.regex_set.parse(string)
+
+            self.assertEqual(parsed["user_agent"], expected["user_agent"],
+                             string
+                             )
+            self.assertEqual(parsed["os"], expected["os"], string)
+
+        info = self.regex_set.cache_info()
+        self.assertEqual(info["hits"] + info["misses"], len(strings))
+        self.assertGreater(info["hits"], info["misses"])
+
+    def test_template_cache_digit_dependent_rules(self):
+        template = ("Mozilla/5.0 (Windows NT {}; Win64; x64) AppleWebKit/"
+                    "537.36 (KHTML, like Gecko) Chrome/{}.0.0.0 Safari/537.36")
+
+        for nt, chrome in (("6.1", 120), ("10.0", 121), ("6.1", 99),
+                           ("6.2", 122), ("10.0", 120)):
+            string = template.format(nt, chrome)
+            parsed = self.regex_set.parse(string)
+
+            self.assertEqual(parsed["os"],
+                             user_agent_parser.Parse(string)["os"]
+                             )
+            self.assertEqual(parsed["user_agent"]["major"], str(chrome))
+
+        self.assertEqual(self.regex_set.cache_info()["size"], 1)
+
+    def test_template_cache_is_bounded(self):
+        with patch('simple_useragent.regexes._TEMPLATE_CACHE_SIZE', 2):
+            for string in ("curl/7.64.1", "Wget/1.21", "Lynx/2.8.9rel.1",
+                           "curl/8.0.1"):
+                self.regex_set.parse(string)
+
+        self.assertLessEqual(self.regex_set.cache_info()["size"], 2)
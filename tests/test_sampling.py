@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+"""
+test_sampling.py: Test the batch sampling of the simple-useragent package.
+
+This file contains the test cases for the vectorised, usage weighted
+Sampler class. Both the NumPy and the pure Python implementation are
+tested, if NumPy is installed.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_sampling
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import array
+import collections
+import unittest
+from unittest.mock import patch
+
+from simple_useragent import sampling
+from simple_useragent.sampling import Sampler
+
+
+class TestSampler(unittest.TestCase):
+    def setUp(self):
+        self.table = [f"ua{i}" for i in range(10)]
+        self.weights = [50.0] + [5.0] * 9
+        self.sampler = Sampler(self.table, self.weights)
+
+    def check_samples(self, samples):
+        self.assertEqual(len(samples), 10000)
+        counts = collections.Counter(int(i) for i in samples)
+        self.assertEqual(set(counts), set(range(10)))
+
+        # The first user agent has ~53% usage.
+        self.assertGreater(counts[0], 4500)
+        self.assertLess(counts[0], 6000)
+
+    def test_sample_numpy(self):
+        if sampling._numpy() is None:
+            self.skipTest("NumPy is not installed.")
+
+        samples = self.sampler.sample(10000, seed=42)
+        self.assertEqual(samples.dtype.itemsize, 1)
+        self.check_samples(samples)
+
+    @patch('simple_useragent.sampling._numpy', return_value=None)
+    def test_sample_pure_python(self, mock_numpy):
+        samples = self.sampler.sample(10000, seed=42)
+        self.assertIsInstance(samples, array.array)
+        self.assertEqual(samples.typecode, "B")
+        self.check_samples(samples)
+
+    def test_sample_is_reproducible(self):
+        self.assertEqual(list(self.sampler.sample(100, seed=1)),
+                         list(self.sampler.sample(100, seed=1))
+                         )
+        self.assertNotEqual(list(self.sampler.sample(100, seed=1)),
+                            list(self.sampler.sample(100, seed=2))
+                            )
+
+    def test_sample_empty(self):
+        self.assertEqual(len(self.sampler.sample(0)), 0)
+        self.assertEqual(len(Sampler([], []).sample(10)), 0)
+
+    def test_typecode(self):
+        self.assertEqual(sampling._typecode(45), "B")
+        self.assertEqual(sampling._typecode(1000), "H")
+        self.assertEqual(sampling._typecode(100000), "L")
+
+    def test_invalid_input(self):
+        self.assertRaises(ValueError, Sampler, self.table, [1.0])
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+"""
+test_sidecar.py: Test the sidecar service of the simple-useragent
+package.
+
+This file contains tests for the endpoints of the local HTTP service
+and the client backend of the UserAgents class, which reads from it.
+The sidecar refreshes from the local stand-in of 'useragents.me', so
+the tests run offline.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_sidecar
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from benchmarks.server import FakeServer
+from simple_useragent import core
+from simple_useragent.core import UserAgent, UserAgents
+from simple_useragent.sidecar import Sidecar
+
+
+class TestSidecar(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeServer()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+        patcher = patch.object(core, "_API_URL", self.server.url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = tmp.name
+
+        self.sidecar = Sidecar(
+                UserAgents(cache_location=tmp.name, max_retries=1), port=0
+                )
+        self.sidecar.start()
+        self.addCleanup(self.sidecar.stop)
+
+    def get(self, path: str, **params) -> requests.Response:
+        return requests.get(self.sidecar.url + path, params=params, timeout=5)
+
+    def test_list_and_random(self):
+        data = self.sidecar.user_agents.get_dict()
+
+        self.assertEqual(self.get("list").json(), list(data["desktop"]))
+        self.assertEqual(self.get("list", mobile=1, n=2).json(),
+                         list(data["mobile"][:2])
+                         )
+
+        sample = self.get("random", mobile="true", n=5).json()
+        self.assertEqual(len(sample), 5)
+        self.assertTrue(set(sample) <= set(data["mobile"]))
+        self.assertEqual(len(self.get("random").json()), 1)
+
+    def test_dict(self):
+        data = self.sidecar.user_agents.get_dict()
+        content = self.get("dict").json()
+
+        self.assertEqual(content["desktop"], list(data["desktop"]))
+        self.assertEqual(content["mobile"], list(data["mobile"]))
+        self.assertIn("pct", content)
+
+        # The serialized body is reused until the next refresh.
+        self.assertIs(self.sidecar._dict_body(), self.sidecar._dict_body())
+
+    def test_parse(self):
+        string = core._FALLBACK_MOBILE[0]
+        record = self.get("parse", ua=string).json()
+        self.assertEqual(record["string"], string)
+        self.assertEqual(record["os"], UserAgent(string).os)
+
+        response = requests.post(
+                self.sidecar.url + "parse",
+                data="\n".join(core._FALLBACK_DESKTOP + [""] + [string]),
+                timeout=5,
+                )
+        self.assertEqual([r["string"] for r in response.json()],
+                         core._FALLBACK_DESKTOP + [string]
+                         )
+
+    def test_errors(self):
+        self.assertEqual(self.get("parse").status_code, 400)
+        self.assertEqual(self.get("list", n="x").status_code, 400)
+        self.assertEqual(self.get("unknown").status_code, 404)
+        self.assertEqual(self.get("health").json()["status"], "ok")
+
+    def test_requests_never_refresh(self):
+        user_agents = UserAgents(cache_location=self.cache_dir,
+                                 cache_duration=0, max_retries=1)
+        with Sidecar(user_agents, port=0, refresh_interval=3600) as sidecar:
+            self.assertFalse(user_agents.auto_refresh)
+            requests_before = self.server.requests
+
+            for path in ("list", "random", "dict"):
+                response = requests.get(sidecar.url + path, timeout=5)
+                self.assertEqual(response.status_code, 200)
+            self.assertEqual(self.server.requests, requests_before)
+
+            # Only the refresher asks the website.
+            sidecar.refresh()
+            self.assertGreater(self.server.requests, requests_before)
+
+            health = requests.get(sidecar.url + "health", timeout=5).json()
+            self.assertEqual(health["age"], user_agents.pool_age)
+            self.assertEqual(health["cached"],
+                             user_agents.get_dict()["cached"])
+
+    def test_client_backend(self):
+        requests_before = self.server.requests
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = UserAgents(
+                    cache_location=cache_dir, sidecar_url=self.sidecar.url
+                    )
+            data = client.export_dict(force_cached=False)
+
+        expected = self.sidecar.user_agents.export_dict()
+        self.assertEqual(data["desktop"], expected["desktop"])
+        self.assertEqual(data["mobile"], expected["mobile"])
+        self.assertEqual(data["pct"]["desktop"], expected["pct"]["desktop"])
+
+        # The client never asked the website itself.
+        self.assertEqual(self.server.requests, requests_before)
+
+    def test_client_backend_invalid_response(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = UserAgents(
+                    cache_location=cache_dir, max_retries=1, timeout=0.01,
+                    sidecar_url=self.server.url + "missing/",
+                    )
+            with self.assertLogs(core.LOGGER, "ERROR"):
+                data = client.get_dict(force_cached=False)
+
+        # Falls back to the shipped user agents.
+        self.assertTrue(data["desktop"])
+
+
+if __name__ == "__main__":
+    unittest.main()
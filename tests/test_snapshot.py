@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+
+"""
+test_snapshot.py: Test the read-only pool snapshots of the
+simple-useragent package.
+
+This file contains tests for exporting a snapshot, which is refreshed
+from the local stand-in of 'useragents.me', and for using it at startup
+without any network I/O and as fallback.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_snapshot
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import io
+import json
+import os
+import pathlib
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from unittest.mock import patch
+
+import requests
+
+from benchmarks.server import FakeServer
+from simple_useragent import cli, core
+from simple_useragent.core import UserAgent, UserAgents
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = tmp.name
+        self.path = str(pathlib.Path(self.tmp, "snapshot.json"))
+
+        with FakeServer() as server, \
+                patch.object(core, "_API_URL", server.url):
+            self.snapshot = UserAgents(
+                    cache_location=self.tmp, max_retries=1
+                    ).export_snapshot(self.path)
+
+        # No network I/O from here on.
+        patcher = patch("requests.get",
+                        side_effect=requests.ConnectionError("offline")
+                        )
+        self.get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def user_agents(self, **kwargs) -> UserAgents:
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        return UserAgents(cache_location=cache_dir.name, max_retries=1,
+                          timeout=0, **kwargs
+                          )
+
+    def test_export(self):
+        with open(self.path, "r") as fh:
+            snapshot = json.load(fh)
+
+        self.assertEqual(snapshot, self.snapshot)
+        self.assertEqual(snapshot["format"], core._SNAPSHOT_FORMAT)
+        self.assertTrue(snapshot["desktop"])
+        self.assertEqual(len(snapshot["parsed"]["mobile"]),
+                         len(snapshot["mobile"])
+                         )
+        agent = UserAgent(snapshot["desktop"][0])
+        self.assertEqual(snapshot["parsed"]["desktop"][0], {
+                **agent.__dict__(),
+                "browser_version_tuple": list(agent.browser_version_tuple),
+                "os_version_tuple": list(agent.os_version_tuple),
+                })
+
+    def test_export_fails_without_network(self):
+        path = pathlib.Path(self.tmp, "failed.json")
+        with self.assertRaises(RuntimeError), self.assertLogs(core.LOGGER):
+            self.user_agents().export_snapshot(str(path))
+
+        self.assertFalse(path.exists())
+
+    def test_export_cleans_up(self):
+        path = pathlib.Path(self.tmp, "failed.json")
+        with patch.object(UserAgents, "_UserAgents__useragents_api",
+                          return_value=self.snapshot), \
+                patch.object(core.json, "dump", side_effect=OSError):
+            with self.assertRaises(OSError):
+                self.user_agents().export_snapshot(str(path), parsed=False)
+
+        self.assertEqual(sorted(os.listdir(self.tmp)), ["snapshot.json"])
+
+    def test_startup_without_network(self):
+        user_agents = self.user_agents(snapshot_path=self.path)
+
+        # The pre-parsed attributes are used, nothing is parsed.
+        with patch.object(core, "_parse", side_effect=AssertionError):
+            data = user_agents.get_dict()
+            agents = user_agents.get(num=3)
+
+        self.assertEqual(list(data["desktop"]), self.snapshot["desktop"])
+        self.assertEqual(data.keys(), {"desktop", "mobile", "cached"})
+        self.assertEqual(user_agents._user_agents_cached["snapshot"],
+                         self.snapshot["cached"]
+                         )
+        parsed = self.snapshot["parsed"]["desktop"][0]
+        self.assertEqual(agents[0].__dict__().items(),
+                         {k: parsed[k] for k in core._ATTRIBUTES}.items()
+                         )
+        self.assertEqual(agents[0].browser_version_tuple,
+                         tuple(parsed["browser_version_tuple"])
+                         )
+        self.assertEqual(agents[0].fingerprint,
+                         UserAgent(agents[0].string).fingerprint
+                         )
+        with self.assertRaises(AttributeError):
+            agents[0].browser = "Other"
+        self.get.assert_not_called()
+
+    def test_snapshot_without_version_tuples(self):
+        for attributes in self.snapshot["parsed"]["desktop"]:
+            del attributes["browser_version_tuple"]
+        with open(self.path, "w") as fh:
+            json.dump(self.snapshot, fh)
+
+        agent = self.user_agents(snapshot_path=self.path).get(num=1)[0]
+        expected = UserAgent(agent.string).browser_version_tuple[:2]
+        self.assertEqual(agent.browser_version_tuple, expected)
+
+    def test_environment_variable(self):
+        with patch.dict(os.environ, {core.SNAPSHOT_ENV: self.path}):
+            user_agents = self.user_agents()
+
+        self.assertEqual(user_agents.get_list(mobile=True),
+                         tuple(self.snapshot["mobile"])
+                         )
+        self.get.assert_not_called()
+
+    def test_other_package_version_is_parsed(self):
+        self.snapshot["package"] = "0.0.0"
+        with open(self.path, "w") as fh:
+            json.dump(self.snapshot, fh)
+
+        agents = self.user_agents(snapshot_path=self.path).get(num=1)
+        self.assertEqual(agents[0].string, self.snapshot["desktop"][0])
+
+    def test_fallback_to_snapshot(self):
+        self.snapshot["cached"] -= 2 * 86400
+        with open(self.path, "w") as fh:
+            json.dump(self.snapshot, fh)
+
+        user_agents = self.user_agents(snapshot_path=self.path)
+        with self.assertLogs(core.LOGGER, "WARNING") as logs:
+            data = user_agents.get_dict(force_cached=False)
+
+        self.assertEqual(list(data["desktop"]), self.snapshot["desktop"])
+        self.assertIn("Falling back to snapshot", "\n".join(logs.output))
+
+        # The outdated snapshot keeps its age, so the next call tries to
+        # refresh again.
+        self.assertEqual(data["cached"], self.snapshot["cached"])
+        calls = self.get.call_count
+        with self.assertLogs(core.LOGGER, "WARNING"):
+            user_agents.get_dict()
+        self.assertGreater(self.get.call_count, calls)
+
+    def test_newer_file_cache_wins(self):
+        user_agents = self.user_agents(snapshot_path=self.path)
+        cached = {"desktop": core._FALLBACK_DESKTOP,
+                  "mobile": core._FALLBACK_MOBILE,
+                  "cached": self.snapshot["cached"] + 1}
+        with open(pathlib.Path(user_agents._cache_location,
+                               "user_agents.json"), "w") as fh:
+            json.dump(cached, fh)
+
+        data = user_agents.get_dict()
+
+        self.assertEqual(list(data["desktop"]), core._FALLBACK_DESKTOP)
+        self.assertNotIn("snapshot", user_agents._user_agents_cached)
+        self.get.assert_not_called()
+
+    def test_outdated_file_cache_loses(self):
+        # Newer than the snapshot, but older than the cache duration.
+        self.snapshot["cached"] -= 3 * 86400
+        with open(self.path, "w") as fh:
+            json.dump(self.snapshot, fh)
+
+        user_agents = self.user_agents(snapshot_path=self.path)
+        cached = {"desktop": core._FALLBACK_DESKTOP,
+                  "mobile": core._FALLBACK_MOBILE,
+                  "cached": self.snapshot["cached"] + 86400}
+        with open(pathlib.Path(user_agents._cache_location,
+                               "user_agents.json"), "w") as fh:
+            json.dump(cached, fh)
+
+        data = user_agents.get_dict()
+
+        self.assertEqual(list(data["desktop"]), self.snapshot["desktop"])
+        self.get.assert_not_called()
+
+    def test_older_file_cache_loses(self):
+        user_agents = self.user_agents(snapshot_path=self.path)
+        cached = {"desktop": core._FALLBACK_DESKTOP,
+                  "mobile": core._FALLBACK_MOBILE,
+                  "cached": self.snapshot["cached"] - 1}
+        with open(pathlib.Path(user_agents._cache_location,
+                               "user_agents.json"), "w") as fh:
+            json.dump(cached, fh)
+
+        data = user_agents.get_dict()
+
+        self.assertEqual(list(data["desktop"]), self.snapshot["desktop"])
+        self.get.assert_not_called()
+
+    def test_invalid_snapshot(self):
+        with open(self.path, "w") as fh:
+            fh.write("{")
+
+        user_agents = self.user_agents(snapshot_path=self.path)
+        with self.assertLogs(core.LOGGER, "WARNING") as logs:
+            data = user_agents.get_dict(force_cached=True)
+
+        self.assertEqual(list(data["desktop"]), core._FALLBACK_DESKTOP)
+        self.assertIn("Could not load snapshot", "\n".join(logs.output))
+
+    def test_cli(self):
+        path = str(pathlib.Path(self.tmp, "cli.json"))
+        with open(pathlib.Path(self.tmp, "user_agents.json"), "w") as fh:
+            json.dump(self.snapshot, fh)
+
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            code = cli.main(["snapshot", path, "--from-cache", "--no-parsed",
+                             "--cache-location", self.tmp
+                             ])
+
+        self.assertEqual(code, 0)
+        self.assertIn(core.SNAPSHOT_ENV, stderr.getvalue())
+        with open(path, "r") as fh:
+            snapshot = json.load(fh)
+        self.assertEqual(snapshot["desktop"], self.snapshot["desktop"])
+        self.assertNotIn("parsed", snapshot)
+
+
+if __name__ == "__main__":
+    unittest.main()
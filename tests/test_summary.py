@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+"""
+test_summary.py: Test the parallel log aggregation of the
+simple-useragent package.
+
+This file contains tests for splitting memory-mapped logs into
+line-aligned byte ranges, counting their unique user agents in worker
+processes and the summary table.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_summary
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import collections
+import io
+import json
+import pathlib
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from simple_useragent import cli, core, summary
+from simple_useragent.core import UserAgent
+
+_LINE = ('10.0.0.{ip} - - [19/Oct/2026:13:55:{sec:02d} +0000] "GET /{ip} '
+         'HTTP/1.1" 200 {size} "https://example.com/" "{ua}"\n')
+
+
+class TestSummary(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = tmp.name
+
+        with open(core._FALLBACK_JSON, "r") as fh:
+            data = json.load(fh)
+
+        rng = random.Random(0)
+        self.strings = [rng.choice(data["desktop"] + data["mobile"])
+                        for _ in range(3000)]
+
+        self.log = pathlib.Path(self.tmp, "access.log")
+        with open(self.log, "w") as fh:
+            for i, ua in enumerate(self.strings):
+                fh.write(_LINE.format(ip=i % 255, sec=i % 60, size=i, ua=ua))
+            # Lines without user agent are counted, but not summarized.
+            fh.write(_LINE.format(ip=1, sec=1, size=1, ua="-"))
+            fh.write("garbage")
+
+    def expected(self) -> dict[str, collections.Counter]:
+        sections = {name: collections.Counter() for name in summary.SECTIONS}
+        for string in self.strings:
+            agent = UserAgent(string)
+            sections["browser"][agent.browser] += 1
+            sections["browser_version"][
+                f"{agent.browser} {agent.browser_version}".rstrip()] += 1
+            sections["os"][agent.os] += 1
+            sections["os_version"][
+                f"{agent.os} {agent.os_version}".rstrip()] += 1
+            sections["device"]["mobile" if agent.mobile else "desktop"] += 1
+
+        return sections
+
+    def test_ranges_are_line_aligned(self):
+        content = self.log.read_bytes()
+        ranges = list(summary._ranges(str(self.log), 1000))
+
+        self.assertGreater(len(ranges), 100)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], len(content))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(content[end - 1:end], b"\n")
+
+    def test_summarize_combined(self):
+        expected = self.expected()
+
+        for workers in (0, 2):
+            with self.subTest(workers=workers):
+                result = summary.summarize(
+                        [str(self.log)], input_format="combined",
+                        workers=workers, range_size=4096,
+                        )
+
+                self.assertEqual(result["lines"], len(self.strings) + 2)
+                self.assertEqual(result["records"], len(self.strings))
+                self.assertEqual(result["unique"], len(set(self.strings)))
+                for name in summary.SECTIONS:
+                    self.assertEqual(result[name], dict(expected[name]))
+
+    def test_summarize_user_agent_lines(self):
+        path = pathlib.Path(self.tmp, "agents.txt")
+        path.write_text("\n".join(self.strings) + "\n\n  \r\n")
+        empty = pathlib.Path(self.tmp, "empty.txt")
+        empty.write_text("")
+
+        result = summary.summarize([str(path), str(empty)], workers=0)
+
+        self.assertEqual(result["records"], len(self.strings))
+        self.assertEqual(result["browser"], dict(self.expected()["browser"]))
+
+    def test_summarize_skip_bots(self):
+        path = pathlib.Path(self.tmp, "agents.txt")
+        path.write_text("\n".join(self.strings + ["curl/8.4.0"] * 3
+                                  + ["Googlebot/2.1"]) + "\n")
+
+        result = summary.summarize([str(path)], workers=0, skip_bots=True)
+
+        self.assertEqual(result["records"], len(self.strings))
+        self.assertEqual(result["bots"], 4)
+        self.assertEqual(result["browser"], dict(self.expected()["browser"]))
+        self.assertIn("4 bot records skipped", summary.format_table(result))
+
+    def test_format_table(self):
+        result = summary.summarize([str(self.log)], input_format="combined",
+                                   workers=0
+                                   )
+        table = summary.format_table(result, top=2)
+
+        for title in summary.SECTIONS.values():
+            self.assertIn(title, table)
+        self.assertIn(f"Records: {len(self.strings):,}", table)
+        self.assertIn("Rest (", table)
+        self.assertEqual(len(table.split("Device")[1].splitlines()), 3)
+
+    def test_cli(self):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            code = cli.main(["summarize", str(self.log), "--input-format",
+                             "combined", "-f", "json", "-w", "0"
+                             ])
+
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(stdout.getvalue())["records"],
+                         len(self.strings)
+                         )
+        self.assertIn("lines/s", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
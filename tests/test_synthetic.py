@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+"""
+test_synthetic.py: Test the variant generator of the simple-useragent
+package.
+
+This file contains tests for the reproducibility, the usage weighting
+and the internal consistency of the generated user agent variants.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_synthetic
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import collections
+import json
+import re
+import unittest
+
+from simple_useragent import core
+from simple_useragent.core import UserAgent
+from simple_useragent.synthetic import VariantGenerator
+
+_EDGE = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+         "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 "
+         "Edg/120.0.2210.91")
+_FIREFOX = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) "
+            "Gecko/20100101 Firefox/121.0")
+_FIREFOX_FROZEN = ("Mozilla/5.0 (X11; Linux x86_64; rv:109.0) "
+                   "Gecko/20100101 Firefox/110.0")
+_SAFARI = ("Mozilla/5.0 (iPhone; CPU iPhone OS 17_2_1 like Mac OS X) "
+           "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 "
+           "Mobile/15E148 Safari/604.1")
+
+
+class TestSynthetic(unittest.TestCase):
+    def setUp(self):
+        with open(core._FALLBACK_JSON, "r") as fh:
+            data = json.load(fh)
+        self.strings = data["desktop"] + data["mobile"]
+
+    def test_stream_is_reproducible(self):
+        generator = VariantGenerator(self.strings)
+
+        first = list(generator.stream(2000, seed=7))
+        self.assertEqual(first, list(generator.stream(2000, seed=7)))
+        self.assertEqual(first[:10], list(generator.stream(10, seed=7)))
+        self.assertNotEqual(first, list(generator.stream(2000, seed=8)))
+        self.assertGreater(len(set(first)), 10 * len(self.strings))
+
+        self.assertEqual(list(generator.stream(0)), [])
+        self.assertEqual(list(VariantGenerator([]).stream(5)), [])
+
+    def test_variants_are_consistent(self):
+        generator = VariantGenerator(self.strings + [_EDGE, _FIREFOX,
+                                                     _FIREFOX_FROZEN, _SAFARI])
+        seeds = {(a.browser, a.os, a.mobile) for a in map(
+                UserAgent, generator.strings)}
+
+        for variant in set(generator.stream(3000, seed=1)):
+            agent = UserAgent(variant)
+            self.assertIn((agent.browser, agent.os, agent.mobile), seeds)
+
+            # Firefox 110 to 119 send 'rv:109.0', all others their major.
+            match = re.search(r"rv:(\d+)\.0\) .* Firefox/(\d+)\.0$", variant)
+            if match is not None:
+                rv, major = map(int, match.groups())
+                self.assertEqual(rv, 109 if 110 <= major <= 119 else major,
+                                 variant
+                                 )
+
+        self.assertEqual(
+                set(VariantGenerator([_FIREFOX_FROZEN]).stream(100, seed=1)),
+                {_FIREFOX_FROZEN,
+                 _FIREFOX_FROZEN.replace("110.0", "109.0"),
+                 _FIREFOX_FROZEN.replace("110.0", "108.0").replace(
+                         "109.0", "108.0")}
+                )
+
+    def test_versions_move_together(self):
+        for string, pattern in (
+                (_EDGE, r"Chrome/(\d+)\.0\.0\.0 .* Edg/(\d+)\.0\.\d+\.\d+$"),
+                (_FIREFOX_FROZEN.replace("110.0", "108.0").replace(
+                        "109.0", "108.0"),
+                 r"rv:(\d+)\.0\) .* Firefox/(\d+)\.0$"),
+                (_SAFARI, r"OS 17_(\d)(?:_\d)? like .* Version/17\.(\d) "),
+                ):
+            generator = VariantGenerator([string], spread=2)
+            with self.subTest(string=string):
+                variants = set(generator.stream(500, seed=1))
+                self.assertGreater(len(variants), 2)
+                for variant in variants:
+                    match = re.search(pattern, variant)
+                    self.assertIsNotNone(match, variant)
+                    self.assertEqual(match.group(1), match.group(2))
+
+        majors = {UserAgent(v).browser_version_tuple[0]
+                  for v in VariantGenerator([_EDGE]).stream(500, seed=1)}
+        self.assertEqual(majors, {118, 119, 120})
+
+    def test_weights(self):
+        generator = VariantGenerator([_EDGE, _FIREFOX], weights=[9, 1],
+                                     spread=0)
+        counts = collections.Counter(
+                UserAgent(v).browser for v in generator.stream(2000, seed=1)
+                )
+
+        self.assertGreater(counts["Edge"], counts["Firefox"] * 5)
+        self.assertRaises(ValueError, VariantGenerator, [_EDGE], [1, 2])
+        self.assertRaises(ValueError, VariantGenerator, [_EDGE], spread=-1)
+
+    def test_spread_zero_keeps_frozen_versions(self):
+        reduced = self.strings[0]
+        variants = set(VariantGenerator([reduced], spread=0).stream(100))
+
+        self.assertEqual(variants, {reduced})
+
+
+if __name__ == "__main__":
+    unittest.main()
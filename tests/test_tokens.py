@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+"""
+test_tokens.py: Test the product and comment tokenizer of the
+simple-useragent package.
+
+This file contains tests for the tokenization of well-formed and
+malformed user agent strings and for the rendering engine, platform
+and device model, which are derived from the tokens.
+
+The tests can be run with the following command:
+    $ python -m unittest tests.test_tokens
+"""
+from __future__ import annotations
+
+# Header.
+__author__ = "Lennart Haack"
+__email__ = "simple-useragent@lennolium.dev"
+__license__ = "GNU GPLv3"
+__version__ = "0.1.6"
+__date__ = "2026-10-19"
+__status__ = "Development"
+__github__ = "https://github.com/Lennolium/simple-useragent"
+
+# Imports.
+import unittest
+
+from simple_useragent import tokens
+from simple_useragent.tokens import Comment, Product
+
+_PIXEL = ("Mozilla/5.0 (Linux; Android 14; Pixel 8 Build/UQ1A.240205.004) "
+          "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.6099.230 "
+          "Mobile Safari/537.36")
+
+
+class TestTokens(unittest.TestCase):
+    def test_tokenize(self):
+        self.assertEqual(tokens.tokenize(_PIXEL), (
+                Product("Mozilla", "5.0"),
+                Comment("Linux; Android 14; Pixel 8 Build/UQ1A.240205.004",
+                        ("Linux", "Android 14",
+                         "Pixel 8 Build/UQ1A.240205.004")),
+                Product("AppleWebKit", "537.36"),
+                Comment("KHTML, like Gecko", ("KHTML, like Gecko",)),
+                Product("Chrome", "120.0.6099.230"),
+                Product("Mobile"),
+                Product("Safari", "537.36"),
+                ))
+
+    def test_tokenize_malformed(self):
+        cases = {
+                "": (),
+                "curl/8.4.0": (Product("curl", "8.4.0"),),
+                "a (b (c) d\\) e) f/": (
+                        Product("a"),
+                        Comment("b (c) d\\) e", ("b (c) d\\) e",)),
+                        Product("f"),
+                        ),
+                "App (unclosed; x": (
+                        Product("App"),
+                        Comment("unclosed; x", ("unclosed", "x")),
+                        ),
+                " ) / x ( ;; )": (Product("x"), Comment(" ;; ", ())),
+                }
+
+        for string, expected in cases.items():
+            with self.subTest(string=string):
+                self.assertEqual(tokens.tokenize(string), expected)
+
+    def test_engine(self):
+        cases = {
+                _PIXEL: ("Blink", "120.0.6099.230"),
+                "Mozilla/5.0 (iPhone; CPU iPhone OS 17_2 like Mac OS X) "
+                "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 "
+                "Mobile/15E148 Safari/604.1": ("WebKit", "605.1.15"),
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) "
+                "Gecko/20100101 Firefox/121.0": ("Gecko", "121.0"),
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/70.0.3538.102 Safari/537.36 "
+                "Edge/18.19582": ("EdgeHTML", "18.19582"),
+                "Mozilla/5.0 (Windows NT 10.0; Trident/7.0; rv:11.0) like "
+                "Gecko": ("Trident", "7.0"),
+                "Opera/9.80 (Windows NT 6.1) Presto/2.12.388 Version/12.16":
+                    ("Presto", "2.12.388"),
+                "curl/8.4.0": (None, None),
+                }
+
+        for string, expected in cases.items():
+            with self.subTest(string=string):
+                self.assertEqual(tokens.engine(tokens.tokenize(string)),
+                                 expected)
+
+    def test_device_model(self):
+        cases = {
+                _PIXEL: "Pixel 8",
+                "Mozilla/5.0 (Linux; U; Android 4.0.3; de-de; GT-I9100) "
+                "AppleWebKit/534.30": "GT-I9100",
+                "Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36": None,
+                "Mozilla/5.0 (iPad; CPU OS 17_2 like Mac OS X)": "iPad",
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64)": None,
+                "curl/8.4.0": None,
+                }
+
+        for string, expected in cases.items():
+            with self.subTest(string=string):
+                self.assertEqual(tokens.device_model(tokens.tokenize(string)),
+                                 expected)
+
+    def test_platform_and_products(self):
+        parsed = tokens.tokenize(_PIXEL)
+
+        self.assertEqual(tokens.platform(parsed), (
+                "Linux", "Android 14", "Pixel 8 Build/UQ1A.240205.004"
+                ))
+        self.assertEqual(tokens.products(parsed)["Chrome"], "120.0.6099.230")
+        self.assertEqual(tokens.platform(tokens.tokenize("curl/8.4.0")), ())
+
+
+if __name__ == "__main__":
+    unittest.main()